@@ -0,0 +1,754 @@
+"""Banco de pruebas de rendimiento del conversor.
+
+Uso (desde el directorio GUI_Converter):
+    python bench.py [escenario ...]
+    python bench.py --output bench.json
+    python bench.py --baseline bench.json --threshold 0.10
+
+Escenarios: engine (placeholder_convert escalar), batch (convert_array),
+format (1M valores con separadores locales), parse (lectura de números),
+exact (modo de precisión exacta frente a la ruta float), cache (ResultCache),
+csv (cli.convert_stream),
+gui (latencia de actualización de la tabla de UnitConverterUI con Qt
+offscreen), shm (canal de memoria compartida frente a ProcessPoolExecutor),
+import y bulk. Cada uno devuelve métricas cuyo sufijo indica el
+sentido: `*_per_s` cuanto más alto mejor; `*_ns`, `*_us` y `*_ms` cuanto
+más bajo mejor (las `legacy_*` miden el código original y no se comparan). Con --baseline se comparan las métricas comunes y el
+proceso termina con código 1 si alguna empeora más que el umbral.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+
+from converter_core import (
+    FACTOR_MATRICES, NumberFormatter, conversion_operation, convert, placeholder_convert,
+)
+from converter_core.instrumentation import Histogram
+
+
+def legacy_placeholder_convert(category: str, src_idx: int, dst_idx: int, qty: float) -> float:
+    """Cadena if/elif original, conservada como referencia para comparar."""
+
+    if category == "Force":
+        if src_idx == 0 and dst_idx == 1:
+            return qty
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 100000.0
+        elif src_idx == 1 and dst_idx == 0:
+            return qty
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 100000.0
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 100000.0
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 100000.0
+        else:
+            return qty
+    if category == "Pressure":
+        if src_idx == 0 and dst_idx == 1:
+            return qty / 1000000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 10
+        elif src_idx == 1 and dst_idx == 0:
+            return qty * 1000000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 10000000
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 10
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 10000000
+        else:
+            return qty
+    if category == "Density":
+        if src_idx == 0 and dst_idx == 1:
+            return qty / 1000000000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty / 1000
+        elif src_idx == 1 and dst_idx == 0:
+            return qty * 1000000000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 1000000
+        elif src_idx == 2 and dst_idx == 0:
+            return qty * 1000
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 1000000
+        else:
+            return qty
+    if category == "Thermal Conductivity":
+        if src_idx == 0 and dst_idx == 1:
+            return qty * 1000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 100000
+        elif src_idx == 1 and dst_idx == 0:
+            return qty / 1000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 100
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 100000
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 100
+        else:
+            return qty
+    if category == "Specific heat":
+        if src_idx == 0 and dst_idx == 1:
+            return qty * 1000000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 10000
+        elif src_idx == 1 and dst_idx == 0:
+            return qty / 1000000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty / 100
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 10000
+        elif src_idx == 2 and dst_idx == 1:
+            return qty * 100
+        else:
+            return qty
+    if category == "Young’s Modulus":
+        if src_idx == 0 and dst_idx == 1:
+            return qty / 1000000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 10
+        elif src_idx == 1 and dst_idx == 0:
+            return qty * 1000000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 10000000
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 10
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 10000000
+        else:
+            return qty
+    if category == "Film Coefficient":
+        if src_idx == 0 and dst_idx == 1:
+            return qty
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 1000
+        elif src_idx == 1 and dst_idx == 0:
+            return qty
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 1000
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 1000
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 1000
+        else:
+            return qty
+    if category == "Dynamic Viscosity":
+        if src_idx == 0 and dst_idx == 1:
+            return qty / 1000000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 10
+        elif src_idx == 1 and dst_idx == 0:
+            return qty * 1000000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 10000000
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 10
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 10000000
+        else:
+            return qty
+    if category == "Elastic":
+        if src_idx == 0 and dst_idx == 1:
+            return qty / 1000000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 10
+        elif src_idx == 1 and dst_idx == 0:
+            return qty * 1000000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 10000000
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 10
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 10000000
+        else:
+            return qty
+    if category == "Expansion":
+        if src_idx == 0 and dst_idx == 1:
+            return qty
+        elif src_idx == 0 and dst_idx == 2:
+            return qty
+        elif src_idx == 1 and dst_idx == 0:
+            return qty
+        elif src_idx == 1 and dst_idx == 2:
+            return qty
+        elif src_idx == 2 and dst_idx == 0:
+            return qty
+        elif src_idx == 2 and dst_idx == 1:
+            return qty
+        else:
+            return qty
+    if category == "Stefan Boltzmann":
+        if src_idx == 0 and dst_idx == 1:
+            return qty / 1000
+        elif src_idx == 0 and dst_idx == 2:
+            return qty * 1000
+        elif src_idx == 1 and dst_idx == 0:
+            return qty * 1000
+        elif src_idx == 1 and dst_idx == 2:
+            return qty * 1000000
+        elif src_idx == 2 and dst_idx == 0:
+            return qty / 1000
+        elif src_idx == 2 and dst_idx == 1:
+            return qty / 1000000
+        else:
+            return qty
+    return qty
+
+
+# Sistemas que cubre la cadena if/elif original; los añadidos después al
+# registro no tienen equivalente con el que comparar.
+LEGACY_SYSTEMS = 3
+
+
+def _engine_cases() -> List[tuple]:
+    return [
+        (category, src, dst, 1234.5678)
+        for category, matrix in FACTOR_MATRICES.items()
+        for src in range(min(len(matrix), LEGACY_SYSTEMS))
+        for dst in range(min(len(matrix), LEGACY_SYSTEMS))
+    ]
+
+
+# Cantidades de la comprobación de regresión: exactas, periódicas en binario,
+# negativas, extremas y una muestra fija de valores arbitrarios
+_AGREEMENT_QUANTITIES = (
+    [0.0, 1.0, 2.5, -3.7, 0.1, 0.3, 7.0, 1234.5678, 1e-7, 6.02e23, 1e300, -1e-300]
+    + [random.Random(seed).uniform(-1e6, 1e6) for seed in range(200)]
+)
+
+
+def _check_legacy_agreement():
+    """convert() debe dar bit a bit lo mismo que la cadena if/elif original."""
+    for category, matrix in FACTOR_MATRICES.items():
+        for src in range(min(len(matrix), LEGACY_SYSTEMS)):
+            for dst in range(min(len(matrix), LEGACY_SYSTEMS)):
+                for qty in _AGREEMENT_QUANTITIES:
+                    old = legacy_placeholder_convert(category, src, dst, qty)
+                    new = convert(category, src, dst, qty)
+                    if old != new:
+                        raise AssertionError(
+                            f"Resultado distinto para {(category, src, dst, qty)}: {old!r} != {new!r}")
+
+
+def _per_call_ns(func: Callable, cases: List[tuple], repeat: int = 5, number: int = 2000) -> float:
+    def run():
+        for args in cases:
+            func(*args)
+
+    best = min(timeit.repeat(run, repeat=repeat, number=number))
+    return best / (number * len(cases)) * 1e9
+
+
+def _call_latency(func: Callable, cases: List[tuple], samples: int = 5000) -> Histogram:
+    """Histograma por llamada: cada muestra es una pasada por `cases` dividida entre su tamaño."""
+    histogram = Histogram()
+    counter = time.perf_counter_ns
+    for _ in range(samples):
+        start = counter()
+        for args in cases:
+            func(*args)
+        histogram.record((counter() - start) // len(cases))
+    return histogram
+
+
+def _latency_metrics(prefix: str, histogram: Histogram, unit: str = "ns") -> Dict[str, float]:
+    scale = {"ns": 1.0, "us": 1e3, "ms": 1e6}[unit]
+    return {f"{prefix}_p50_{unit}": histogram.percentile(50) / scale,
+            f"{prefix}_p99_{unit}": histogram.percentile(99) / scale}
+
+
+def bench_engine() -> Dict[str, float]:
+    """Compara por llamada la cadena if/elif original con placeholder_convert."""
+    cases = _engine_cases()
+    _check_legacy_agreement()
+
+    legacy_ns = _per_call_ns(legacy_placeholder_convert, cases)
+    table_ns = _per_call_ns(placeholder_convert, cases)
+    latency = _call_latency(placeholder_convert, cases)
+    print(f"engine: legacy if/elif {legacy_ns:8.1f} ns/call")
+    print(f"engine: factor table   {table_ns:8.1f} ns/call  (x{legacy_ns / table_ns:.1f})  "
+          f"{1e9 / table_ns:14,.0f} ops/s  p50 {latency.percentile(50):.0f} ns  "
+          f"p99 {latency.percentile(99):.0f} ns")
+    metrics = {"legacy_ns": legacy_ns, "table_ns": table_ns, "table_ops_per_s": 1e9 / table_ns}
+    metrics.update(_latency_metrics("table", latency))
+    return metrics
+
+
+def bench_batch(n_values: int = 200_000) -> Dict[str, float]:
+    """Compara el bucle escalar con convert_array sobre un lote de valores."""
+    try:
+        import numpy as np
+        from converter_core.batch import convert_array
+    except ImportError:
+        print("batch: skipped (NumPy not installed)")
+        return {}
+
+    category = "Density"
+    n_systems = len(FACTOR_MATRICES[category])
+    values = np.linspace(1.0, 1e4, n_values)
+    out = np.empty((n_values, n_systems))
+
+    def scalar_loop():
+        return [[convert(category, 0, dst, v) for dst in range(n_systems)] for v in values.tolist()]
+
+    scalar_s = min(timeit.repeat(scalar_loop, repeat=3, number=1))
+    array_s = min(timeit.repeat(lambda: convert_array(category, 0, values, out=out), repeat=5, number=1))
+    print(f"batch: scalar loop    {n_values / scalar_s:14,.0f} values/s")
+    print(f"batch: convert_array  {n_values / array_s:14,.0f} values/s  (x{scalar_s / array_s:.0f})")
+    return {"scalar_values_per_s": n_values / scalar_s, "array_values_per_s": n_values / array_s}
+
+
+def _legacy_format(value: float, decimal_sep: str = ",", group_sep: str = ".") -> str:
+    """Formato por celda tal como lo hacía la interfaz: texto, split y rstrip."""
+    raw = f"{value:,.12f}".replace(",", "\0").replace(".", decimal_sep).replace("\0", group_sep)
+    if decimal_sep in raw:
+        parts = raw.split(decimal_sep, 1)
+        decimals = parts[1].rstrip("0")
+        return f"{parts[0]}{decimal_sep}{decimals}" if decimals else parts[0]
+    return raw
+
+
+def bench_format(n_values: int = 1_000_000) -> Dict[str, float]:
+    """Compara el formato por celda original con NumberFormatter."""
+    values = [i * 1.25 + 0.001 for i in range(n_values)]
+    formatter = NumberFormatter(",", ".")
+    for value in values[:1000]:
+        if _legacy_format(value) != formatter.fixed(value):
+            raise AssertionError(f"Formato distinto para {value}")
+
+    legacy_s = min(timeit.repeat(lambda: [_legacy_format(v) for v in values], repeat=3, number=1))
+    many_s = min(timeit.repeat(lambda: formatter.format_many(values), repeat=3, number=1))
+    repeated = values[:64] * (n_values // 64)
+    cached_s = min(timeit.repeat(lambda: [formatter.fixed(v) for v in repeated], repeat=3, number=1))
+    print(f"format: legacy split/rstrip {n_values / legacy_s:14,.0f} values/s")
+    print(f"format: format_many         {n_values / many_s:14,.0f} values/s")
+    print(f"format: fixed (LRU hits)    {len(repeated) / cached_s:14,.0f} values/s")
+    return {"legacy_values_per_s": n_values / legacy_s, "many_values_per_s": n_values / many_s,
+            "cached_values_per_s": len(repeated) / cached_s}
+
+
+def bench_bulk(n_values: int = 100_000) -> Dict[str, float]:
+    """Texto pegado con n valores: análisis y conversión a todos los sistemas."""
+    from converter_core.bulk import convert_all, parse_values
+
+    text = "\n".join(f"{i * 0.37 + 1.5:.6f}" for i in range(n_values))
+
+    def run():
+        values, _invalid = parse_values(text)
+        convert_all("Pressure", 1, values)
+
+    elapsed = min(timeit.repeat(run, repeat=3, number=1))
+    print(f"bulk: parse+convert {n_values:,} pasted values in {elapsed * 1000:8.1f} ms")
+    return {"bulk_ms": elapsed * 1000}
+
+
+def bench_parse(n_values: int = 200_000) -> Dict[str, float]:
+    """Lectura del valor por pulsación (regex + replace + float frente a NumberParser) y en bloque."""
+    import re
+    from converter_core.parsing import NumberParser
+
+    pattern = re.compile(r"^[+-]?(\d+[.,]?\d*|\d*[.,]?\d+)([eE][+-]?\d+)?$")
+
+    def legacy_parse(text: str):
+        # Lo que hacía la versión original: el validador con la expresión
+        # regular y, en la conversión, strip() + replace(',', '.') + float()
+        if not pattern.match(text):
+            return None
+        return float(text.strip().replace(",", "."))
+
+    parser = NumberParser(",", ".")
+    cases = [("1234,5678",), ("-0,001",), ("6,02e23",), ("12",)]
+    legacy_ns = _per_call_ns(legacy_parse, cases)
+    parser_ns = _per_call_ns(parser.try_parse, cases)
+    text = "\n".join(f"{i * 0.37 + 1.5:.6f}".replace(".", ",") for i in range(n_values))
+    bulk_s = min(timeit.repeat(lambda: parser.parse_many(text), repeat=3, number=1))
+    print(f"parse: regex+float    {legacy_ns:8.1f} ns/value")
+    print(f"parse: NumberParser   {parser_ns:8.1f} ns/value (single pass, validates and parses)")
+    print(f"parse: parse_many     {n_values / bulk_s:14,.0f} values/s")
+    return {"legacy_ns": legacy_ns, "single_ns": parser_ns, "bulk_values_per_s": n_values / bulk_s}
+
+
+def bench_exact() -> Dict[str, float]:
+    """Fila de la tabla con float + round frente al modo exacto.
+
+    Con PySide6 mide además _perform_conversion de la ventana con la casilla
+    Exact desactivada y activada (vaciando la caché de resultados en cada
+    llamada), que es donde se decide entre las dos rutas.
+    """
+    category, src = "Stefan Boltzmann", 0
+    n_systems = len(FACTOR_MATRICES[category])
+
+    def float_row(value: float):
+        return [round(placeholder_convert(category, src, row, value), 12) for row in range(n_systems)]
+
+    # Ruta float medida antes de cargar fractions/decimal
+    float_ns = _per_call_ns(float_row, [(5.670374419e-8,), (1.5,)], number=500)
+
+    from converter_core.exact import convert_row_exact, format_scientific_exact, format_significant
+
+    def exact_row(text: str):
+        values = convert_row_exact(category, src, text)
+        return ([format_significant(value) for value in values],
+                [format_scientific_exact(value) for value in values])
+
+    exact = [float(value) for value in convert_row_exact(category, src, "5.670374419e-8")]
+    if not any(abs(rounded - value) > 1e-9 * abs(value)
+               for rounded, value in zip(float_row(5.670374419e-8), exact)):
+        raise AssertionError("round() to 12 decimals should lose digits that exact mode keeps")
+    float_after_ns = _per_call_ns(float_row, [(5.670374419e-8,), (1.5,)], number=500)
+    exact_ns = _per_call_ns(exact_row, [("5.670374419e-8",), ("1.5",)], number=500)
+    print(f"exact: float row (off)  {float_ns / 1e3:8.2f} us/row  "
+          f"(after loading exact: {float_after_ns / 1e3:.2f} us)")
+    print(f"exact: exact row + text {exact_ns / 1e3:8.2f} us/row  (x{exact_ns / float_ns:.1f})")
+    metrics = {"float_row_us": float_ns / 1e3, "float_row_after_import_us": float_after_ns / 1e3,
+               "exact_row_us": exact_ns / 1e3}
+
+    opened = _offscreen_window()
+    if opened is None:
+        print("exact: window dispatch skipped (PySide6 not installed)")
+        return metrics
+    app, window = opened
+    window.combo_properties.setCurrentIndex(window.combo_properties.findText(category))
+    window.line_edit_value.setText("5.670374419e-8".replace(".", window.number_formatter.decimal_point))
+    app.processEvents()
+
+    def dispatch():
+        window.result_cache.clear()
+        window._perform_conversion()
+
+    for exact_on in (False, True):
+        window.check_exact.setChecked(exact_on)
+        app.processEvents()
+        key = "dispatch_exact_us" if exact_on else "dispatch_off_us"
+        metrics[key] = _per_call_ns(dispatch, [()], number=500) / 1e3
+    window.close()
+    app.processEvents()
+    print(f"exact: window, Exact off {metrics['dispatch_off_us']:8.2f} us/update  "
+          f"(on: {metrics['dispatch_exact_us']:.2f} us)")
+    return metrics
+
+
+def bench_cache(updates: int = 20_000) -> Dict[str, float]:
+    """Consultas repetidas (alternar el sistema de origen) con y sin ResultCache."""
+    from converter_core.result_cache import ResultCache
+
+    category = "Density"
+    n_systems = len(FACTOR_MATRICES[category])
+    formatter = NumberFormatter(",", ".")
+    # Pocos valores y todos los sistemas de origen, como al alternar el combo
+    queries = [(src, value) for value in (1.5, 1000.0, 7850.0, 0.25) for src in range(n_systems)]
+    queries = (queries * (updates // len(queries) + 1))[:updates]
+
+    def row(src: int, value: float) -> List[float]:
+        return [round(placeholder_convert(category, src, dst, value), 12) for dst in range(n_systems)]
+
+    def uncached():
+        for src, value in queries:
+            values = row(src, value)
+            [formatter.fixed(result) for result in values]
+            [formatter.scientific(result) for result in values]
+
+    cache = ResultCache(formatter)
+
+    def cached():
+        for src, value in queries:
+            cache.lookup(category, src, value, lambda: row(src, value))
+
+    uncached_s = min(timeit.repeat(uncached, repeat=3, number=1))
+    cached_s = min(timeit.repeat(cached, repeat=3, number=1))
+    formatter.set_locale(".", ",")
+    if cache.get(category, 0, 1.5) is not None or cache.invalidations != 1:
+        raise AssertionError("a locale change must invalidate the result cache")
+    print(f"cache: uncached {uncached_s / updates * 1e6:8.2f} us/update")
+    print(f"cache: cached   {cached_s / updates * 1e6:8.2f} us/update  (x{uncached_s / cached_s:.1f}, "
+          f"hit rate {cache.hit_rate:.1%})")
+    return {"uncached_us": uncached_s / updates * 1e6, "cached_us": cached_s / updates * 1e6,
+            "cached_updates_per_s": updates / cached_s}
+
+
+def bench_csv(n_rows: int = 100_000, n_columns: int = 4) -> Dict[str, float]:
+    """Conversión en streaming de un CSV en memoria con cli.convert_stream."""
+    from cli import DEFAULT_CHUNK_SIZE, convert_stream
+
+    header = ",".join(f"c{i}" for i in range(n_columns))
+    lines = [",".join(f"{r * 0.37 + i:.6f}" for i in range(n_columns)) for r in range(n_rows)]
+    text = header + "\n" + "\n".join(lines) + "\n"
+    operation = conversion_operation("Density", 0, 2)
+
+    def run():
+        return convert_stream(io.StringIO(text), io.StringIO(), operation)
+
+    stats = run()
+    elapsed = min(timeit.repeat(run, repeat=3, number=1))
+    chunk_latency = Histogram()
+    chunk_rows = DEFAULT_CHUNK_SIZE
+    chunk_text = header + "\n" + "\n".join(lines[:chunk_rows]) + "\n"
+    for _ in range(20):
+        start = time.perf_counter_ns()
+        convert_stream(io.StringIO(chunk_text), io.StringIO(), operation)
+        chunk_latency.record(time.perf_counter_ns() - start)
+
+    mb = len(text.encode("utf-8")) / 1e6
+    print(f"csv: {stats.rows:,} rows  {stats.values / elapsed:14,.0f} values/s  {mb / elapsed:7.1f} MB/s  "
+          f"chunk of {chunk_rows} rows p50 {chunk_latency.percentile(50) / 1e6:.2f} ms  "
+          f"p99 {chunk_latency.percentile(99) / 1e6:.2f} ms")
+    metrics = {"rows_per_s": stats.rows / elapsed, "values_per_s": stats.values / elapsed,
+               "mb_per_s": mb / elapsed}
+    metrics.update(_latency_metrics("chunk", chunk_latency, "ms"))
+    return metrics
+
+
+def _offscreen_window():
+    """(QApplication, UnitConverterUI) visibles con Qt offscreen, o None sin PySide6."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide6.QtCore import QStandardPaths
+        from PySide6.QtWidgets import QApplication
+    except ImportError:
+        return None
+    # No tocar el historial real del usuario
+    QStandardPaths.setTestModeEnabled(True)
+    from gui_converter import UnitConverterUI
+
+    app = QApplication.instance() or QApplication([])
+    window = UnitConverterUI()
+    window.show()
+    app.processEvents()
+    return app, window
+
+
+def bench_gui(updates: int = 500) -> Dict[str, float]:
+    """Latencia de una actualización de la tabla de resultados con Qt offscreen.
+
+    Cada muestra cubre desde el cambio de texto hasta que la tabla se ha
+    repintado: setText, la conversión pendiente del planificador y el
+    procesado de los eventos de pintado.
+    """
+    opened = _offscreen_window()
+    if opened is None:
+        print("gui: skipped (PySide6 not installed)")
+        return {}
+    app, window = opened
+
+    histogram = Histogram()
+    counter = time.perf_counter_ns
+    for k in range(updates):
+        start = counter()
+        text = f"{k * 1.25 + 0.5:.3f}".replace(".", window.number_formatter.decimal_point)
+        window.line_edit_value.setText(text)
+        window.conversion_scheduler.flush()
+        window.table_results.viewport().repaint()
+        app.processEvents()
+        histogram.record(counter() - start)
+
+    window.close()
+    app.processEvents()
+    total_s = histogram.total_ns / 1e9
+    print(f"gui: {updates} table updates  {updates / total_s:10,.0f} updates/s  "
+          f"p50 {histogram.percentile(50) / 1e3:.0f} µs  p99 {histogram.percentile(99) / 1e3:.0f} µs")
+    metrics = {"updates_per_s": updates / total_s}
+    metrics.update(_latency_metrics("update", histogram, "us"))
+    return metrics
+
+
+# Presupuesto de importación del núcleo (ms) en un intérprete nuevo. Se
+# precarga `typing`, que cualquier consumidor real (cli.py, PySide6) ya tiene
+# importado, para medir solo el coste propio de converter_core.
+IMPORT_BUDGET_MS = 5.0
+
+_IMPORT_PROBE = """
+import json, sys, time, typing
+t0 = time.perf_counter()
+import converter_core
+elapsed = (time.perf_counter() - t0) * 1000.0
+print(json.dumps({"ms": elapsed, "qt": any(m.startswith("PySide6") for m in sys.modules)}))
+"""
+
+
+def bench_import(runs: int = 7) -> Dict[str, float]:
+    """Mide la importación de converter_core en frío y comprueba que no carga Qt."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], cwd=here,
+                                capture_output=True, text=True, check=True).stdout
+        probe = json.loads(output)
+        if probe["qt"]:
+            raise AssertionError("converter_core imported PySide6")
+        samples.append(probe["ms"])
+
+    best = min(samples)
+    print(f"import: converter_core {best:6.2f} ms (budget {IMPORT_BUDGET_MS:.1f} ms)")
+    if best > IMPORT_BUDGET_MS:
+        raise AssertionError(f"converter_core import took {best:.2f} ms > {IMPORT_BUDGET_MS} ms")
+    return {"import_ms": best}
+
+
+def _pickled_convert(category: str, src_idx: int, dst_idx: int, values):
+    """Tarea de ProcessPoolExecutor: los valores y el resultado viajan con pickle."""
+    multiplier, divisor = conversion_operation(category, src_idx, dst_idx)
+    try:
+        import numpy as np
+    except ImportError:
+        from array import array
+        return array("d", [v * multiplier / divisor for v in values])
+    return np.multiply(values, multiplier) / divisor
+
+
+def bench_shm(block_values: int = 1 << 18, blocks: int = 40) -> Dict[str, float]:
+    """Canal de memoria compartida frente a ProcessPoolExecutor (pickle) con bloques float64."""
+    from array import array
+    from concurrent.futures import ProcessPoolExecutor
+    from converter_core.shm_channel import SharedMemoryChannel, np
+
+    category, src, dst = "Density", 0, 2
+    source = array("d", (i * 0.5 + 1.0 for i in range(block_values)))
+    payload = np.frombuffer(source, dtype=np.float64).copy() if np is not None else source
+    expected = convert(category, src, dst, payload[10])
+
+    pickled = Histogram()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        executor.submit(_pickled_convert, category, src, dst, payload[:1]).result()
+        for _ in range(blocks):
+            start = time.perf_counter_ns()
+            result = executor.submit(_pickled_convert, category, src, dst, payload).result()
+            pickled.record(time.perf_counter_ns() - start)
+    if result[10] != expected:
+        raise AssertionError("ProcessPoolExecutor result mismatch")
+
+    shared = Histogram()
+    with SharedMemoryChannel(slots=2, slot_values=block_values) as channel:
+        slot = channel.acquire()
+        block = channel.values(slot, block_values)
+        for _ in range(blocks):
+            # El cliente produce los datos directamente en la ranura
+            block[:] = payload
+            start = time.perf_counter_ns()
+            channel.submit(slot, category, src, dst, block_values)
+            channel.wait(slot)
+            shared.record(time.perf_counter_ns() - start)
+        if block[10] != expected:
+            raise AssertionError("Shared-memory channel result mismatch")
+        if np is None:
+            block.release()
+        del block
+        channel.release(slot)
+
+    metrics = {}
+    for name, histogram in (("pickle", pickled), ("shm", shared)):
+        per_s = block_values * histogram.count / (histogram.total_ns / 1e9)
+        print(f"shm: {name:<6} {block_values:,} values/block  {per_s:14,.0f} values/s  "
+              f"p50 {histogram.percentile(50) / 1e6:.2f} ms  p99 {histogram.percentile(99) / 1e6:.2f} ms")
+        metrics[f"{name}_values_per_s"] = per_s
+        metrics.update(_latency_metrics(f"{name}_block", histogram, "ms"))
+    return metrics
+
+
+SCENARIOS: Dict[str, Callable[[], Dict[str, float]]] = {
+    "engine": bench_engine,
+    "batch": bench_batch,
+    "import": bench_import,
+    "format": bench_format,
+    "bulk": bench_bulk,
+    "parse": bench_parse,
+    "exact": bench_exact,
+    "cache": bench_cache,
+    "csv": bench_csv,
+    "gui": bench_gui,
+    "shm": bench_shm,
+}
+
+DEFAULT_THRESHOLD = 0.10
+
+_HIGHER_IS_BETTER = ("_per_s",)
+_LOWER_IS_BETTER = ("_ns", "_us", "_ms")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Métricas que empeoran respecto a la referencia más que `threshold` (fracción)."""
+    regressions = []
+    for scenario, metrics in results.items():
+        reference = baseline.get(scenario, {})
+        for name, value in metrics.items():
+            old = reference.get(name)
+            # Las métricas legacy_* miden el código de referencia, no el actual
+            if not old or name.startswith("legacy_"):
+                continue
+            change = (value - old) / old
+            if name.endswith(_HIGHER_IS_BETTER):
+                worse = -change
+            elif name.endswith(_LOWER_IS_BETTER):
+                worse = change
+            else:
+                continue
+            flag = "REGRESSION" if worse > threshold else ""
+            print(f"  {scenario}.{name:<24} {old:14.4g} -> {value:14.4g}  {change:+7.1%}  {flag}")
+            if worse > threshold:
+                regressions.append(f"{scenario}.{name}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Unit converter benchmark suite")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario",
+                        help=f"Scenarios to run (default: all). Available: {', '.join(SCENARIOS)}")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown before failing (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenario(s): {', '.join(unknown)}. Available: {', '.join(SCENARIOS)}")
+
+    failed = []
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        try:
+            results[name] = SCENARIOS[name]()
+        except AssertionError as e:
+            print(f"{name}: FAILED ({e})")
+            failed.append(name)
+
+    if args.output:
+        report = {"timestamp": time.time(), "commit": _git_commit(), "python": platform.python_version(),
+                  "platform": platform.platform(), "results": results}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Comparison with {args.baseline} (commit {baseline.get('commit') or '?'}, "
+              f"threshold {args.threshold:.0%}):")
+        regressions = compare(results, baseline.get("results", {}), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+from array import array
+from typing import List, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel,
+    QMessageBox, QPlainTextEdit, QProgressBar, QPushButton, QTableView, QVBoxLayout,
+)
+
+from conversion_scheduler import ConversionScheduler
+from conversion_worker import BackgroundConverter
+from converter_core import CATEGORY_UNITS, UNIT_LABELS, NumberFormatter
+from converter_core.bulk import parse_values
+from converter_core.export import columns_rows, format_for_path
+from export_worker import BackgroundExporter, with_export_extension
+
+
+class BulkResultsModel(QAbstractTableModel):
+    """Tabla virtual: una fila por valor pegado y una columna por sistema.
+
+    Los datos son arrays('d') por columna; el texto se formatea solo para las
+    filas que la vista pinta, así que 100k filas no crean 100k cadenas.
+    """
+
+    def __init__(self, formatter: NumberFormatter, parent=None):
+        super().__init__(parent)
+        self._formatter = formatter
+        self._headers: List[str] = ["Value"]
+        self._columns: List[array] = [array("d")]
+        self._converted_rows = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.column() > 0 and index.row() >= self._converted_rows:
+            # Fila aún no convertida por el trabajo en segundo plano
+            return "…" if role == Qt.ItemDataRole.DisplayRole else None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._formatter.fixed(self._columns[index.column()][index.row()])
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._formatter.scientific(self._columns[index.column()][index.row()], 12)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def begin_job(self, headers: Sequence[str], values: array):
+        """Muestra los valores de entrada y reserva las columnas de resultados."""
+        self.beginResetModel()
+        self._headers = list(headers)
+        empty = bytes(8 * len(values))
+        self._columns = [values] + [array("d", empty) for _ in self._headers[1:]]
+        self._converted_rows = 0
+        self.endResetModel()
+
+    def apply_chunk(self, start: int, converted: Sequence[array]):
+        """Copia un bloque de resultados y emite un único dataChanged para él."""
+        if not converted:
+            return
+        stop = start + len(converted[0])
+        for column, block in zip(self._columns[1:], converted):
+            column[start:stop] = block
+        self._converted_rows = max(self._converted_rows, stop)
+        self.dataChanged.emit(self.index(start, 1), self.index(stop - 1, len(self._columns) - 1))
+
+    def snapshot(self) -> Tuple[List[str], List[array], int]:
+        """Cabeceras, columnas y filas ya convertidas, para exportar.
+
+        Cada trabajo crea arrays nuevos, así que las referencias siguen
+        siendo válidas aunque después se lance otra conversión.
+        """
+        rows = self._converted_rows if len(self._columns) > 1 else len(self._columns[0])
+        return list(self._headers), list(self._columns), rows
+
+
+class BulkConversionPanel(QDialog):
+    """Entrada de varios valores (separados por saltos de línea o ';').
+
+    Convierte todos los valores pegados a cada sistema de la categoría y
+    sistema de origen que tenga seleccionados la ventana principal.
+    """
+
+    # Antirrebote de la entrada: pegar o teclear en bloque provoca una sola conversión
+    PARSE_DELAY_MS = 150
+    EXPORT_FILTERS = "CSV (*.csv);;JSON Lines (*.jsonl);;NumPy matrix (*.npy);;NumPy columnar (*.npz)"
+
+    def __init__(self, formatter: NumberFormatter, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Bulk conversion")
+        self.resize(800, 600)
+        self._category = ""
+        self._src_idx = 0
+
+        # Formateador propio para no desplazar la caché de la ventana principal
+        self.formatter = NumberFormatter(formatter.decimal_point, formatter.group_separator,
+                                         decimals=formatter.decimals)
+
+        layout = QVBoxLayout(self)
+        header_layout = QHBoxLayout()
+        self.label_context = QLabel("")
+        self.label_context.setStyleSheet("font-weight: bold;")
+        self.label_status = QLabel("")
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(160)
+        self.progress_bar.setVisible(False)
+        header_layout.addWidget(self.label_context, 1)
+        header_layout.addWidget(self.progress_bar)
+        header_layout.addWidget(self.label_status)
+        self.button_export = QPushButton("Export...")
+        header_layout.addWidget(self.button_export)
+        layout.addLayout(header_layout)
+
+        content_layout = QHBoxLayout()
+        self.text_values = QPlainTextEdit()
+        self.text_values.setPlaceholderText("Paste values, one per line or separated by ';'")
+        self.text_values.setFixedWidth(220)
+        content_layout.addWidget(self.text_values)
+
+        self.results_model = BulkResultsModel(self.formatter, self)
+        self.table_results = QTableView()
+        self.table_results.setModel(self.results_model)
+        self.table_results.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_results.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_results.verticalHeader().setDefaultSectionSize(24)
+        content_layout.addWidget(self.table_results, 1)
+        layout.addLayout(content_layout, 1)
+
+        # Los lotes grandes se convierten en segundo plano; un cambio en la
+        # entrada cancela el trabajo en curso y descarta sus resultados.
+        self.converter = BackgroundConverter(parent=self)
+        self.converter.chunkReady.connect(self.results_model.apply_chunk)
+        self.converter.progressChanged.connect(self._on_progress)
+        self.converter.jobFinished.connect(self._on_job_finished)
+        self.converter.jobFailed.connect(self._on_job_failed)
+
+        self.scheduler = ConversionScheduler(self.perform_conversion, self.PARSE_DELAY_MS, self)
+        self.text_values.textChanged.connect(self.scheduler.request)
+
+        self.exporter = BackgroundExporter(self)
+        self.exporter.exportFinished.connect(self._on_export_finished)
+        self.exporter.exportFailed.connect(self._on_export_failed)
+        self.button_export.clicked.connect(self.export_results)
+
+    def set_context(self, category: str, src_idx: int):
+        """Categoría y sistema de origen tomados de la ventana principal."""
+        if category == self._category and src_idx == self._src_idx:
+            return
+        self._category = category
+        self._src_idx = src_idx
+        self.scheduler.request()
+
+    def set_locale(self, decimal_point: str, group_separator: str):
+        if self.formatter.set_locale(decimal_point, group_separator):
+            self.scheduler.request()
+
+    def perform_conversion(self):
+        category = self._category
+        systems = CATEGORY_UNITS.get(category, [])
+        labels = UNIT_LABELS.get(category, [])
+        source = f"{systems[self._src_idx]} [{labels[self._src_idx]}]" if 0 <= self._src_idx < len(systems) else ""
+        self.label_context.setText(f"{category} — from {source}")
+
+        values, invalid = parse_values(self.text_values.toPlainText(), self.formatter.decimal_point,
+                                       self.formatter.group_separator)
+        headers = ["Value"] + [f"{system} [{label}]" for system, label in zip(systems, labels)]
+        if not 0 <= self._src_idx < len(systems):
+            headers = headers[:1]
+        self.results_model.begin_job(headers, values)
+
+        status = f"{len(values):,} values"
+        if invalid:
+            position, token = invalid[0]
+            status += f" — {len(invalid):,} ignored (first: #{position + 1} {token!r})"
+        self.label_status.setText(status)
+
+        self.progress_bar.setVisible(len(values) >= self.converter.threshold)
+        self.progress_bar.setValue(0)
+        self.converter.submit(category, self._src_idx, values)
+
+    def _on_progress(self, done: int, total: int):
+        self.progress_bar.setValue(int(done * 100 / total) if total else 100)
+
+    def _on_job_finished(self):
+        self.progress_bar.setVisible(False)
+
+    def _on_job_failed(self, message: str):
+        self.progress_bar.setVisible(False)
+        self.label_status.setText(f"Conversion failed: {message}")
+
+    def export_results(self):
+        headers, columns, rows = self.results_model.snapshot()
+        if not rows:
+            return
+        file_name, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export bulk results", "bulk_results.csv", self.EXPORT_FILTERS)
+        if not file_name:
+            return
+        file_name = with_export_extension(file_name, selected_filter)
+        try:
+            fmt = format_for_path(file_name)
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        self.exporter.submit(lambda: columns_rows(columns, rows), file_name, headers, fmt)
+        self.label_status.setText(f"Exporting {rows:,} rows...")
+
+    def _on_export_finished(self, path: str, rows: int):
+        self.label_status.setText(f"Exported {rows:,} rows to {path}")
+
+    def _on_export_failed(self, path: str, message: str):
+        QMessageBox.critical(self, "Error", f"Error saving file:\n{message}")
+
+    def closeEvent(self, event):
+        self.converter.cancel()
+        super().closeEvent(event)
@@ -0,0 +1,462 @@
+"""Conversor por línea de comandos (sin Qt) para ficheros CSV/TSV.
+
+Uso (desde el directorio GUI_Converter):
+    python -m cli list
+    python -m cli convert --category Density --from 0 --to 2 in.csv out.csv
+    python -m cli convert --from "kN/cm²" --to MPa in.csv out.csv
+    python -m cli units "kN/cm²" MPa 1 2.5
+    python -m cli convert-dir --category Density --from 0 --to 2 --workers 8 in_dir out_dir
+    python -m cli convert-bin --category Density --from 0 --to 2 field.f64 [out.f64]
+
+Las filas se procesan en bloques de tamaño fijo mediante generadores, así que
+el consumo de memoria no depende del tamaño del fichero.
+"""
+import argparse
+import csv
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from converter_core import CATEGORY_UNITS, UNIT_LABELS, NumberFormatter, conversion_operation
+
+DEFAULT_CHUNK_SIZE = 4096
+DEFAULT_PRECISION = 12
+
+
+def resolve_system(category: str, system: str) -> int:
+    """Acepta un índice ('0') o el nombre del sistema ('m,kg,s,K')."""
+    systems = CATEGORY_UNITS[category]
+    if system.isdigit():
+        idx = int(system)
+        if idx < len(systems):
+            return idx
+    elif system in systems:
+        return systems.index(system)
+    raise ValueError(f"Unknown system {system!r} for {category}. Available: "
+                     + ", ".join(f"{i}={name}" for i, name in enumerate(systems)))
+
+
+def detect_delimiter(path: str) -> str:
+    return "\t" if path.lower().endswith((".tsv", ".tab")) else ","
+
+
+def iter_chunks(rows: Iterable[List[str]], size: int) -> Iterator[List[List[str]]]:
+    """Agrupa las filas en listas de como máximo `size` elementos."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ConversionStats:
+    """Contadores del proceso de conversión de un fichero."""
+
+    __slots__ = ("rows", "values")
+
+    def __init__(self):
+        self.rows = 0
+        self.values = 0
+
+
+def convert_chunks(chunks: Iterable[List[List[str]]], operation: Tuple[float, float],
+                   columns: Optional[Sequence[int]] = None,
+                   precision: int = DEFAULT_PRECISION,
+                   stats: Optional[ConversionStats] = None) -> Iterator[List[List[str]]]:
+    """Convierte los campos numéricos de cada bloque; el resto se copia tal cual.
+
+    Sin `columns` se intentan convertir todos los campos, lo que deja pasar
+    cabeceras y columnas de texto sin cambios. `operation` es el par
+    (multiplicador, divisor) de engine.conversion_operation.
+    """
+    multiplier, divisor = operation
+    formatter = NumberFormatter(".", "")
+    for chunk in chunks:
+        positions = []
+        values = []
+        for r, row in enumerate(chunk):
+            indices = range(len(row)) if columns is None else columns
+            for i in indices:
+                if i >= len(row):
+                    continue
+                try:
+                    values.append(float(row[i]) * multiplier / divisor)
+                except ValueError:
+                    continue
+                positions.append((r, i))
+        # Formateo de todo el bloque de una vez
+        for (r, i), text in zip(positions, formatter.format_many(values, precision, "general")):
+            chunk[r][i] = text
+        if stats is not None:
+            stats.rows += len(chunk)
+            stats.values += len(values)
+        yield chunk
+
+
+def convert_stream(src, dst, operation: Tuple[float, float], delimiter: str = ",",
+                   columns: Optional[Sequence[int]] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   precision: int = DEFAULT_PRECISION) -> ConversionStats:
+    """Lee de `src`, convierte y escribe en `dst` bloque a bloque."""
+    stats = ConversionStats()
+    reader = csv.reader(src, delimiter=delimiter)
+    writer = csv.writer(dst, delimiter=delimiter, lineterminator="\n")
+    for chunk in convert_chunks(iter_chunks(reader, chunk_size), operation, columns, precision, stats):
+        writer.writerows(chunk)
+    return stats
+
+
+def convert_file(in_path: str, out_path: str, operation: Tuple[float, float], delimiter: Optional[str] = None,
+                 columns: Optional[Sequence[int]] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 precision: int = DEFAULT_PRECISION) -> Dict:
+    """Convierte un fichero completo; pensado para ejecutarse en un proceso hijo.
+
+    Nunca lanza excepciones: los errores se devuelven en el campo "error"
+    para que un fichero defectuoso no detenga el resto del directorio.
+    """
+    result = {"path": in_path, "rows": 0, "values": 0, "bytes": 0, "seconds": 0.0, "error": None}
+    start = time.perf_counter()
+    # Temporal + os.replace: si la salida es la propia entrada no se vacía
+    # antes de leerla, y un error no toca un fichero de salida ya existente.
+    tmp_path = _temporary_path(out_path)
+    try:
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        with open(in_path, "r", newline="", encoding="utf-8") as src, \
+                open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+            stats = convert_stream(src, dst, operation, delimiter or detect_delimiter(in_path),
+                                   columns, chunk_size, precision)
+        result["bytes"] = os.path.getsize(in_path)
+        os.replace(tmp_path, out_path)
+        result["rows"] = stats.rows
+        result["values"] = stats.values
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        # No dejar ficheros de salida a medio escribir
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def find_files(root: str, pattern: str = "*.csv", recursive: bool = False) -> List[str]:
+    """Ficheros de `root` que cumplen `pattern`, ordenados de mayor a menor.
+
+    Empezar por los más grandes reparte mejor la carga entre procesos.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        found.extend(os.path.join(dirpath, name) for name in fnmatch.filter(filenames, pattern))
+        if not recursive:
+            break
+    found.sort(key=lambda path: os.path.getsize(path), reverse=True)
+    return found
+
+
+class DirectoryReport:
+    """Resumen agregado de la conversión de un directorio."""
+
+    def __init__(self):
+        self.files = 0
+        self.rows = 0
+        self.values = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+        self.failures: List[Tuple[str, str]] = []
+
+    def add(self, result: Dict):
+        self.files += 1
+        if result["error"]:
+            self.failures.append((result["path"], result["error"]))
+            return
+        self.rows += result["rows"]
+        self.values += result["values"]
+        self.bytes += result["bytes"]
+
+    @property
+    def values_per_second(self) -> float:
+        return self.values / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1e6 / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "files": self.files, "rows": self.rows, "values": self.values, "bytes": self.bytes,
+            "elapsed_s": self.elapsed, "values_per_s": self.values_per_second,
+            "mb_per_s": self.megabytes_per_second,
+            "failures": [{"path": path, "error": error} for path, error in self.failures],
+        }
+
+
+def convert_directory(in_dir: str, out_dir: str, operation: Tuple[float, float], workers: Optional[int] = None,
+                      pattern: str = "*.csv", recursive: bool = False,
+                      delimiter: Optional[str] = None, columns: Optional[Sequence[int]] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      precision: int = DEFAULT_PRECISION) -> DirectoryReport:
+    """Reparte los ficheros entre procesos; cada uno convierte su fichero en streaming.
+
+    Solo viajan entre procesos las rutas y un pequeño diccionario de
+    resultados, nunca el contenido de los ficheros. Con out_dir igual a
+    in_dir los ficheros se convierten in situ; un out_dir dentro de in_dir se
+    rechaza con ValueError.
+    """
+    in_root, out_root = os.path.realpath(in_dir), os.path.realpath(out_dir)
+    if out_root != in_root and os.path.commonpath([in_root, out_root]) == in_root:
+        # Las salidas se mezclarían con las entradas (y con --recursive se releerían)
+        raise ValueError(f"Output directory {out_dir!r} is inside the input directory {in_dir!r}")
+    report = DirectoryReport()
+    files = find_files(in_dir, pattern, recursive)
+    tasks = [(path, os.path.join(out_dir, os.path.relpath(path, in_dir))) for path in files]
+    options = (operation, delimiter, columns, chunk_size, precision)
+
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        for in_path, out_path in tasks:
+            report.add(convert_file(in_path, out_path, *options))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(convert_file, in_path, out_path, *options)
+                       for in_path, out_path in tasks]
+            for future in as_completed(futures):
+                report.add(future.result())
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _temporary_path(path: str) -> str:
+    """Fichero temporal en el mismo directorio que `path`, para poder usar os.replace."""
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def _open(path: str, mode: str):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def cmd_list(args) -> int:
+    for category, systems in CATEGORY_UNITS.items():
+        print(category)
+        for idx, (system, label) in enumerate(zip(systems, UNIT_LABELS[category])):
+            print(f"  {idx}: {system:<10} {label}")
+    return 0
+
+
+def cmd_convert(args) -> int:
+    operation = _resolve_conversion(args)
+    if operation is None:
+        return 2
+
+    delimiter = args.delimiter or detect_delimiter(args.input if args.input != "-" else args.output)
+    columns = [int(c) for c in args.columns.split(",")] if args.columns else None
+
+    # La salida se escribe en un temporal junto al destino y se renombra al
+    # terminar: con entrada y salida iguales, abrir el destino con "w" lo
+    # vaciaría antes de leerlo, y un error no deja el destino a medias.
+    tmp_path = None if args.output == "-" else _temporary_path(args.output)
+    try:
+        src = _open(args.input, "r")
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    try:
+        dst = _open(args.output if tmp_path is None else tmp_path, "w")
+        try:
+            stats = convert_stream(src, dst, operation, delimiter, columns, args.chunk_size, args.precision)
+        finally:
+            if dst is not sys.stdout:
+                dst.close()
+        if tmp_path is not None:
+            os.replace(tmp_path, args.output)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    if not args.quiet:
+        print(f"Converted {stats.values} values in {stats.rows} rows", file=sys.stderr)
+    return 0
+
+
+def _resolve_conversion(args) -> Optional[Tuple[float, float]]:
+    """Par (multiplicador, divisor) de --from a --to; None (ya informado) si no es válido."""
+    if args.category is None:
+        # Sin categoría, --from y --to son expresiones de unidades
+        from converter_core.unit_expr import UnitError, unit_factor
+        try:
+            return unit_factor(args.src, args.dst), 1.0
+        except UnitError as e:
+            print(e, file=sys.stderr)
+            return None
+    if args.category not in CATEGORY_UNITS:
+        print(f"Unknown category: {args.category!r}. Available: {', '.join(CATEGORY_UNITS)}",
+              file=sys.stderr)
+        return None
+    try:
+        src_idx = resolve_system(args.category, args.src)
+        dst_idx = resolve_system(args.category, args.dst)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return None
+    return conversion_operation(args.category, src_idx, dst_idx)
+
+
+def cmd_units(args) -> int:
+    from converter_core.unit_expr import UnitError, unit_factor
+    try:
+        factor = unit_factor(args.src, args.dst)
+    except UnitError as e:
+        print(e, file=sys.stderr)
+        return 2
+    from converter_core.parsing import NumberParser
+    parser = NumberParser(".", ",")
+    formatter = NumberFormatter(".", "")
+    for text in args.values:
+        try:
+            value = parser.parse(text)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+        print(f"{text} {args.src} = {formatter.general(value * factor, args.precision)} {args.dst}")
+    return 0
+
+
+def cmd_convert_dir(args) -> int:
+    operation = _resolve_conversion(args)
+    if operation is None:
+        return 2
+    if not os.path.isdir(args.input):
+        print(f"Not a directory: {args.input}", file=sys.stderr)
+        return 2
+
+    columns = [int(c) for c in args.columns.split(",")] if args.columns else None
+    try:
+        report = convert_directory(args.input, args.output, operation, args.workers, args.pattern,
+                                   args.recursive, args.delimiter, columns, args.chunk_size,
+                                   args.precision)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report.as_dict(), f, indent=2)
+    if not args.quiet:
+        print(f"{report.files} files, {report.values:,} values, {report.bytes / 1e6:.1f} MB "
+              f"in {report.elapsed:.2f} s: {report.values_per_second:,.0f} values/s, "
+              f"{report.megabytes_per_second:.1f} MB/s", file=sys.stderr)
+        for path, error in report.failures:
+            print(f"FAILED {path}: {error}", file=sys.stderr)
+    return 1 if report.failures else 0
+
+
+def cmd_convert_bin(args) -> int:
+    if args.category not in CATEGORY_UNITS:
+        print(f"Unknown category: {args.category!r}. Available: {', '.join(CATEGORY_UNITS)}",
+              file=sys.stderr)
+        return 2
+    try:
+        src_idx = resolve_system(args.category, args.src)
+        dst_idx = resolve_system(args.category, args.dst)
+        # NumPy solo se carga para el modo binario
+        from converter_core.binary import convert_binary_file
+        summary = convert_binary_file(args.category, src_idx, dst_idx, args.input, args.output,
+                                      args.dtype, args.block_pages)
+    except ImportError:
+        print("The binary mode requires NumPy: pip install numpy", file=sys.stderr)
+        return 2
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        target = args.output or f"{args.input} (in place)"
+        print(f"Converted {summary['values']:,} values -> {target}: "
+              f"{summary['bytes'] / 1e6:.1f} MB in {summary['seconds']:.2f} s, "
+              f"{summary['bytes_per_s'] / 1e6:.1f} MB/s", file=sys.stderr)
+    return 0
+
+
+def _add_conversion_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--category",
+                        help="Unit category; without it --from/--to are unit expressions")
+    parser.add_argument("--from", dest="src", required=True,
+                        help="Source system index or name, or a unit expression such as 'kN/cm²'")
+    parser.add_argument("--to", dest="dst", required=True,
+                        help="Destination system index or name, or a unit expression such as 'MPa'")
+    parser.add_argument("--columns",
+                        help="Comma-separated 0-based columns to convert (default: all numeric)")
+    parser.add_argument("--delimiter", help="Field delimiter (default: from file extension)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--precision", type=int, default=DEFAULT_PRECISION,
+                        help="Significant digits in the output")
+    parser.add_argument("--quiet", action="store_true")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli", description="Headless unit converter")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List categories, systems and units")
+    list_parser.set_defaults(func=cmd_list)
+
+    convert_parser = subparsers.add_parser("convert", help="Convert a CSV/TSV file")
+    _add_conversion_arguments(convert_parser)
+    convert_parser.add_argument("input", help="Input file, or - for stdin")
+    convert_parser.add_argument("output", help="Output file, or - for stdout")
+    convert_parser.set_defaults(func=cmd_convert)
+
+    units_parser = subparsers.add_parser("units", help="Convert values between unit expressions")
+    units_parser.add_argument("src", help="Source unit expression, e.g. 'kN/cm²'")
+    units_parser.add_argument("dst", help="Destination unit expression, e.g. 'MPa'")
+    units_parser.add_argument("values", nargs="+", help="Values to convert")
+    units_parser.add_argument("--precision", type=int, default=DEFAULT_PRECISION,
+                              help="Significant digits in the output")
+    units_parser.set_defaults(func=cmd_units)
+
+    dir_parser = subparsers.add_parser("convert-dir",
+                                       help="Convert every matching file of a directory in parallel")
+    _add_conversion_arguments(dir_parser)
+    dir_parser.add_argument("--workers", type=int, default=None,
+                            help="Worker processes (default: number of CPUs)")
+    dir_parser.add_argument("--pattern", default="*.csv", help="File name pattern (default: *.csv)")
+    dir_parser.add_argument("--recursive", action="store_true")
+    dir_parser.add_argument("--report", help="Write the aggregate report as JSON to this file")
+    dir_parser.add_argument("input", help="Input directory")
+    dir_parser.add_argument("output", help="Output directory (mirrors the input tree)")
+    dir_parser.set_defaults(func=cmd_convert_dir)
+
+    bin_parser = subparsers.add_parser("convert-bin",
+                                       help="Convert a raw float64/float32 binary file (needs NumPy)")
+    bin_parser.add_argument("--category", required=True)
+    bin_parser.add_argument("--from", dest="src", required=True, help="Source system index or name")
+    bin_parser.add_argument("--to", dest="dst", required=True, help="Destination system index or name")
+    bin_parser.add_argument("--dtype", default="float64",
+                            help="NumPy dtype of the values, e.g. float64, float32, >f8 (default: float64)")
+    bin_parser.add_argument("--block-pages", type=int, default=1024,
+                            help="Memory pages converted per block (default: 1024)")
+    bin_parser.add_argument("--quiet", action="store_true")
+    bin_parser.add_argument("input", help="Input binary file")
+    bin_parser.add_argument("output", nargs="?", help="Output file (default: convert in place)")
+    bin_parser.set_defaults(func=cmd_convert_bin)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
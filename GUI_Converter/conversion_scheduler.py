@@ -0,0 +1,54 @@
+from typing import Callable, Dict
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class ConversionScheduler(QObject):
+    """Agrupa las peticiones de conversión en una sola ejecución.
+
+    Cada edición del valor o cambio de sistema llama a `request()`, que
+    (re)arranca un QTimer de disparo único. Con intervalo 0 todas las
+    peticiones de un mismo turno del bucle de eventos se resuelven con una
+    única conversión; con un intervalo mayor actúa como antirrebote.
+    """
+
+    def __init__(self, callback: Callable[[], None], interval_ms: int = 0, parent: QObject = None):
+        super().__init__(parent)
+        self._callback = callback
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._run)
+        self.requested = 0
+        self.performed = 0
+
+    def interval(self) -> int:
+        return self._timer.interval()
+
+    def setInterval(self, interval_ms: int):
+        self._timer.setInterval(interval_ms)
+
+    def request(self, *_args):
+        """Ranura conectable a cualquier señal: ignora los argumentos."""
+        self.requested += 1
+        self._timer.start()
+
+    def is_pending(self) -> bool:
+        return self._timer.isActive()
+
+    def flush(self):
+        """Ejecuta ya la conversión pendiente, si la hay."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._run()
+
+    def stats(self) -> Dict[str, int]:
+        return {"requested": self.requested, "performed": self.performed}
+
+    def reset_stats(self):
+        self.requested = 0
+        self.performed = 0
+
+    def _run(self):
+        self.performed += 1
+        self._callback()
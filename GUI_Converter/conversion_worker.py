@@ -0,0 +1,150 @@
+import threading
+from array import array
+from typing import List
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from converter_core.bulk import convert_all
+
+
+class _JobSignals(QObject):
+    # Las señales se emiten desde el hilo del trabajador y llegan encoladas
+    # al hilo de la interfaz.
+    chunk = Signal(int, int, object)    # id del trabajo, fila inicial, columnas convertidas
+    progress = Signal(int, int, int)    # id del trabajo, filas hechas, total
+    finished = Signal(int)              # id del trabajo
+    failed = Signal(int, str)           # id del trabajo, mensaje
+    done = Signal(int)                  # id del trabajo; siempre, también si se cancela
+
+
+class ConversionJob(QRunnable):
+    """Convierte un array de valores por bloques fuera del hilo de la interfaz."""
+
+    def __init__(self, job_id: int, category: str, src_idx: int, values: array,
+                 chunk_size: int, signals: _JobSignals):
+        super().__init__()
+        self.job_id = job_id
+        self.category = category
+        self.src_idx = src_idx
+        self.values = values
+        self.chunk_size = chunk_size
+        self.signals = signals
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        total = len(self.values)
+        try:
+            for start in range(0, total, self.chunk_size):
+                if self.cancelled.is_set():
+                    return
+                block = self.values[start:start + self.chunk_size]
+                columns = convert_all(self.category, self.src_idx, block)
+                self.signals.chunk.emit(self.job_id, start, columns)
+                self.signals.progress.emit(self.job_id, start + len(block), total)
+            if not self.cancelled.is_set():
+                self.signals.finished.emit(self.job_id)
+        except Exception as e:
+            self.signals.failed.emit(self.job_id, str(e))
+        finally:
+            self.signals.done.emit(self.job_id)
+
+
+class BackgroundConverter(QObject):
+    """Reparte las conversiones grandes en un QThreadPool.
+
+    Los lotes por debajo de `threshold` se convierten en el acto (el coste de
+    pasar a otro hilo no compensa). Cada envío cancela el trabajo anterior y
+    los bloques que aún lleguen de trabajos sustituidos se descartan, de modo
+    que nunca sobrescriben los resultados vigentes.
+    """
+
+    chunkReady = Signal(int, object)        # fila inicial, columnas convertidas
+    progressChanged = Signal(int, int)      # filas hechas, total
+    jobStarted = Signal(int)                # total de filas
+    jobFinished = Signal()
+    jobFailed = Signal(str)
+
+    DEFAULT_THRESHOLD = 20_000
+    DEFAULT_CHUNK_SIZE = 16_384
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_threads: int = 2, parent: QObject = None):
+        super().__init__(parent)
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._signals = _JobSignals(self)
+        self._signals.chunk.connect(self._on_chunk)
+        self._signals.progress.connect(self._on_progress)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._signals.done.connect(self._on_done)
+        self._current_id = 0
+        self._current_job = None
+        # Referencias a los trabajos en ejecución (incluidos los cancelados)
+        # hasta que terminan, para que Python no los libere antes que Qt.
+        self._running = {}
+        self.discarded_chunks = 0
+
+    def submit(self, category: str, src_idx: int, values: array) -> int:
+        """Lanza la conversión de `values` y devuelve el id del trabajo."""
+        self.cancel()
+        self._current_id += 1
+        job_id = self._current_id
+        self.jobStarted.emit(len(values))
+
+        if len(values) < self.threshold:
+            columns: List[array] = convert_all(category, src_idx, values)
+            self.chunkReady.emit(0, columns)
+            self.progressChanged.emit(len(values), len(values))
+            self.jobFinished.emit()
+            return job_id
+
+        job = ConversionJob(job_id, category, src_idx, values, self.chunk_size, self._signals)
+        job.setAutoDelete(False)
+        self._current_job = job
+        self._running[job_id] = job
+        self._pool.start(job)
+        return job_id
+
+    def cancel(self):
+        """Cancela el trabajo en curso; sus resultados pendientes se ignorarán."""
+        if self._current_job is not None:
+            self._current_job.cancel()
+            self._current_job = None
+
+    def is_busy(self) -> bool:
+        return self._current_job is not None
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def _is_stale(self, job_id: int) -> bool:
+        return job_id != self._current_id or self._current_job is None
+
+    def _on_chunk(self, job_id: int, start: int, columns):
+        if self._is_stale(job_id):
+            self.discarded_chunks += 1
+            return
+        self.chunkReady.emit(start, columns)
+
+    def _on_progress(self, job_id: int, done: int, total: int):
+        if not self._is_stale(job_id):
+            self.progressChanged.emit(done, total)
+
+    def _on_finished(self, job_id: int):
+        if not self._is_stale(job_id):
+            self._current_job = None
+            self.jobFinished.emit()
+
+    def _on_failed(self, job_id: int, message: str):
+        if not self._is_stale(job_id):
+            self._current_job = None
+            self.jobFailed.emit(message)
+
+    def _on_done(self, job_id: int):
+        self._running.pop(job_id, None)
@@ -0,0 +1,24 @@
+"""Núcleo de conversión sin dependencias de Qt.
+
+Contiene el registro de unidades (units.json) y las tablas derivadas, el motor de conversión y los ayudantes de
+formato, de modo que la línea de comandos y otros consumidores pueden usarlos
+sin cargar PySide6. La API vectorizada (NumPy) está en converter_core.batch
+y no se importa aquí para mantener rápida la importación.
+"""
+from .engine import (
+    BASE_SCALES, FACTOR_MATRICES, FACTOR_TABLE,
+    conversion_factor, conversion_operation, convert, factor_row, operation_row, placeholder_convert,
+)
+from .formatting import (
+    NumberFormatter, convert_to_html_unit, format_fixed, format_scientific,
+)
+from .instrumentation import PROFILER, Profiler
+from .registry import REGISTRY, UnitRegistry, load_registry
+from .tables import CATEGORY_UNITS, UNIT_LABELS, UNIT_SYSTEM_NAMES
+
+__all__ = [
+    "BASE_SCALES", "CATEGORY_UNITS", "FACTOR_MATRICES", "FACTOR_TABLE", "NumberFormatter",
+    "PROFILER", "Profiler", "REGISTRY", "UNIT_LABELS", "UNIT_SYSTEM_NAMES", "UnitRegistry",
+    "conversion_factor", "conversion_operation", "convert", "convert_to_html_unit", "factor_row",
+    "format_fixed", "format_scientific", "load_registry", "operation_row", "placeholder_convert",
+]
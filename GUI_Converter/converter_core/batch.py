@@ -0,0 +1,74 @@
+"""Conversión vectorizada con NumPy para lotes grandes de valores.
+
+NumPy es una dependencia opcional: solo este módulo lo importa, de modo que
+la interfaz y la ruta escalar siguen funcionando sin él.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+from .engine import FACTOR_MATRICES, operation_row
+
+# Matrices de factores como arrays float64, construidas una sola vez.
+FACTOR_ARRAYS: Dict[str, np.ndarray] = {
+    category: np.array(matrix, dtype=np.float64)
+    for category, matrix in FACTOR_MATRICES.items()
+}
+# Las mismas conversiones como pares (multiplicador, divisor) de engine.convert:
+# valor * multiplicador / divisor da el mismo float que la ruta escalar.
+MULTIPLIER_ARRAYS: Dict[str, np.ndarray] = {}
+DIVISOR_ARRAYS: Dict[str, np.ndarray] = {}
+for _category, _matrix in FACTOR_MATRICES.items():
+    _pairs = [operation_row(_category, src) for src in range(len(_matrix))]
+    MULTIPLIER_ARRAYS[_category] = np.array([[m for m, _ in row] for row in _pairs], dtype=np.float64)
+    DIVISOR_ARRAYS[_category] = np.array([[d for _, d in row] for row in _pairs], dtype=np.float64)
+for _array in (*FACTOR_ARRAYS.values(), *MULTIPLIER_ARRAYS.values(), *DIVISOR_ARRAYS.values()):
+    _array.setflags(write=False)
+
+
+def _factor_matrix(category: str) -> np.ndarray:
+    try:
+        return FACTOR_ARRAYS[category]
+    except KeyError:
+        raise ValueError(f"Unknown category: {category!r}") from None
+
+
+def _check_index(matrix: np.ndarray, idx: int, name: str) -> None:
+    if not 0 <= idx < matrix.shape[0]:
+        raise ValueError(f"{name} out of range: {idx} (0..{matrix.shape[0] - 1})")
+
+
+def convert_array(category: str, src_idx: int, values, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convierte todos los valores a todos los sistemas de la categoría.
+
+    `values` puede ser un array de NumPy o cualquier objeto compatible con el
+    protocolo de buffer (array.array, memoryview...). Para una entrada de
+    forma (n,) el resultado tiene forma (n, n_sistemas). Con `out` se escribe
+    en un array ya reservado en lugar de crear uno nuevo.
+    """
+    matrix = _factor_matrix(category)
+    _check_index(matrix, src_idx, "src_idx")
+    values = np.asarray(values, dtype=np.float64)
+    result = np.multiply(values[..., np.newaxis], MULTIPLIER_ARRAYS[category][src_idx], out=out)
+    divisors = DIVISOR_ARRAYS[category][src_idx]
+    if (divisors != 1.0).any():
+        np.divide(result, divisors, out=result)
+    return result
+
+
+def convert_to(category: str, src_idx: int, dst_idx: int, values,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convierte todos los valores a un único sistema de destino.
+
+    Pasando el propio array como `out` la conversión se hace in situ, sin
+    copias adicionales.
+    """
+    matrix = _factor_matrix(category)
+    _check_index(matrix, src_idx, "src_idx")
+    _check_index(matrix, dst_idx, "dst_idx")
+    values = np.asarray(values, dtype=np.float64)
+    result = np.multiply(values, MULTIPLIER_ARRAYS[category][src_idx, dst_idx], out=out)
+    divisor = DIVISOR_ARRAYS[category][src_idx, dst_idx]
+    if divisor != 1.0:
+        np.divide(result, divisor, out=result)
+    return result
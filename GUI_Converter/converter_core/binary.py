@@ -0,0 +1,102 @@
+"""Conversión de ficheros binarios crudos (float64/float32) con memoria mapeada.
+
+Requiere NumPy. Los valores nunca pasan a objetos float de Python: cada bloque
+del fichero de entrada (mapeado en memoria) se multiplica directamente sobre
+el bloque correspondiente del fichero de salida o, sin salida, in situ (y se
+divide, si el factor es 1/n, como en engine.convert). Al
+procesar por bloques alineados a página la memoria residente no crece con el
+tamaño del fichero.
+
+Con fichero de salida se escribe en un parcial junto a él (salida + ".part")
+que sustituye al destino con os.replace solo al terminar: un error no deja
+el destino vacío ni a medias.
+"""
+import mmap
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .batch import DIVISOR_ARRAYS, FACTOR_ARRAYS, MULTIPLIER_ARRAYS
+from .export import PART_SUFFIX
+
+# Bloque por defecto: 1024 páginas (4 MiB con páginas de 4 KiB).
+DEFAULT_BLOCK_PAGES = 1024
+
+
+def _operation(category: str, src_idx: int, dst_idx: int) -> Tuple[float, float]:
+    try:
+        matrix = FACTOR_ARRAYS[category]
+    except KeyError:
+        raise ValueError(f"Unknown category: {category!r}") from None
+    n = matrix.shape[0]
+    if not (0 <= src_idx < n and 0 <= dst_idx < n):
+        raise ValueError(f"System index out of range (0..{n - 1})")
+    return (float(MULTIPLIER_ARRAYS[category][src_idx, dst_idx]),
+            float(DIVISOR_ARRAYS[category][src_idx, dst_idx]))
+
+
+def _float_dtype(dtype) -> np.dtype:
+    """dtype de NumPy de coma flotante; ValueError con cualquier otro."""
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError(f"Invalid dtype: {dtype!r}") from None
+    if dtype.kind != "f":
+        raise ValueError(f"dtype must be a floating-point type, not {dtype}")
+    return dtype
+
+
+def convert_binary_file(category: str, src_idx: int, dst_idx: int, in_path: str,
+                        out_path: Optional[str] = None, dtype: str = "float64",
+                        block_pages: int = DEFAULT_BLOCK_PAGES) -> Dict[str, float]:
+    """Convierte un fichero binario de valores; in situ si `out_path` es None.
+
+    Devuelve un resumen con el número de valores, bytes y bytes/s.
+    """
+    multiplier, divisor = _operation(category, src_idx, dst_idx)
+    dtype = _float_dtype(dtype)
+    if out_path is not None and os.path.exists(out_path) and os.path.samefile(in_path, out_path):
+        out_path = None
+    size = os.path.getsize(in_path)
+    if size % dtype.itemsize:
+        raise ValueError(f"{in_path}: size {size} is not a multiple of {dtype.itemsize} bytes")
+    count = size // dtype.itemsize
+    block = max(1, block_pages * mmap.PAGESIZE // dtype.itemsize)
+
+    start = time.perf_counter()
+    part_path = None if out_path is None else out_path + PART_SUFFIX
+    if part_path is not None:
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+    try:
+        source_mode = "r+" if part_path is None else "r"
+        for first in range(0, count, block):
+            length = min(block, count - first)
+            offset = first * dtype.itemsize
+            source = np.memmap(in_path, dtype=dtype, mode=source_mode, offset=offset, shape=(length,))
+            if part_path is None:
+                target = source
+            else:
+                target = np.memmap(part_path, dtype=dtype, mode="r+", offset=offset, shape=(length,))
+            np.multiply(source, multiplier, out=target)
+            if divisor != 1.0:
+                np.divide(target, divisor, out=target)
+            target.flush()
+            # Liberar el mapeo del bloque antes de pasar al siguiente
+            del source, target
+        if part_path is not None:
+            os.replace(part_path, out_path)
+    except BaseException:
+        if part_path is not None and os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    elapsed = time.perf_counter() - start
+
+    return {
+        "values": count,
+        "bytes": size,
+        "seconds": elapsed,
+        "bytes_per_s": size / elapsed if elapsed else 0.0,
+    }
@@ -0,0 +1,28 @@
+"""Conversión por lotes de listas de valores pegadas como texto."""
+from array import array
+from typing import List, Tuple
+
+from .engine import operation_row
+from .parsing import NumberParser, split_values  # noqa: F401 (split_values se reexporta)
+
+
+def parse_values(text: str, decimal_point: str = ".",
+                 group_separator: str = "") -> Tuple[array, List[Tuple[int, str]]]:
+    """Convierte un bloque de texto en un array('d') de valores.
+
+    Devuelve también los elementos no numéricos como (posición, texto). Ver
+    NumberParser.parse_many: el bloque se intenta convertir de una vez y solo
+    si falla se recorre elemento a elemento.
+    """
+    return NumberParser(decimal_point, group_separator).parse_many(text)
+
+
+def convert_all(category: str, src_idx: int, values: array) -> List[array]:
+    """Convierte todos los valores a cada sistema; una columna por sistema.
+
+    Cada columna se calcula con una sola pasada map() en C en lugar de una
+    llamada a la función de conversión por valor: una multiplicación o, si
+    el factor es 1/n, una división por n, como engine.convert.
+    """
+    return [array("d", map(multiplier.__mul__ if divisor == 1.0 else divisor.__rtruediv__, values))
+            for multiplier, divisor in operation_row(category, src_idx)]
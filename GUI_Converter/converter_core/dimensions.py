@@ -0,0 +1,56 @@
+"""Análisis dimensional: vectores de exponentes sobre las dimensiones base.
+
+Cada magnitud es un vector de exponentes sobre (L, M, T, Θ) y cada sistema
+de unidades da la escala de su unidad base de cada dimensión respecto al SI
+(p. ej. mm → 1e-3, t → 1e3). La escala de una magnitud en un sistema es el
+producto de potencias Π escala_base^exponente, así que añadir un sistema es
+una sola definición y no una rama por cada par de sistemas.
+"""
+from functools import lru_cache
+from typing import Mapping, Sequence, Tuple
+
+BASE_DIMENSIONS: Tuple[str, ...] = ("L", "M", "T", "Θ")
+
+Dimension = Tuple[float, ...]
+
+_SUPERSCRIPTS = str.maketrans("0123456789-.", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻·")
+
+
+def dimension_vector(spec: Mapping[str, float], dimensions: Sequence[str] = BASE_DIMENSIONS) -> Dimension:
+    """Vector de exponentes a partir de {'L': 1, 'T': -2, ...}."""
+    unknown = set(spec) - set(dimensions)
+    if unknown:
+        raise ValueError(f"Unknown dimension(s): {', '.join(sorted(unknown))}")
+    return tuple(float(spec.get(name, 0)) for name in dimensions)
+
+
+@lru_cache(maxsize=None)
+def scale_in_system(dimension: Dimension, base_scales: Tuple[float, ...]) -> float:
+    """Escala respecto al SI de la unidad coherente de `dimension` en un sistema.
+
+    Se redondea a 15 cifras significativas para que, p. ej., (1e-2)^-3 dé
+    exactamente 1e6 y no 999999.9999999999.
+    """
+    scale = 1.0
+    for exponent, base in zip(dimension, base_scales):
+        if exponent:
+            scale *= base ** exponent
+    return float(f"{scale:.15g}")
+
+
+def _power(symbol: str, exponent: float) -> str:
+    if exponent == 1:
+        return symbol
+    text = f"{exponent:g}"
+    return symbol + text.translate(_SUPERSCRIPTS)
+
+
+def format_dimension(dimension: Dimension, symbols: Sequence[str]) -> str:
+    """Etiqueta de unidad con la notación de la interfaz, p. ej. 't/(mm·s²)'."""
+    numerator = [_power(symbol, e) for symbol, e in zip(symbols, dimension) if e > 0]
+    denominator = [_power(symbol, -e) for symbol, e in zip(symbols, dimension) if e < 0]
+    top = "·".join(numerator) or "1"
+    if not denominator:
+        return top
+    bottom = "·".join(denominator)
+    return f"{top}/({bottom})" if len(denominator) > 1 else f"{top}/{bottom}"
@@ -0,0 +1,69 @@
+from typing import Dict, List, Mapping, Tuple
+
+from .registry import REGISTRY, build_factor_matrix
+
+# MOTOR DE CONVERSIÓN
+#
+# Cada categoría se describe con el factor de escala de su unidad en cada
+# sistema respecto al sistema base (m,kg,s,K): valor_SI = valor * escala.
+# Las escalas vienen del registro de unidades (units.json), que ya trae
+# compiladas las matrices N×N de factores, de modo que convertir es una
+# búsqueda y una multiplicación. La ruta escalar usa pares (multiplicador,
+# divisor) para dividir por n cuando el factor es 1/n, como la cadena
+# if/elif original, y dar exactamente sus mismos resultados; las rutas por
+# lotes (bulk, batch, binary, shm, cli, serve) usan los mismos pares.
+
+BASE_SCALES: Mapping[str, Tuple[float, ...]] = REGISTRY.scales
+FACTOR_MATRICES: Mapping[str, Tuple[Tuple[float, ...], ...]] = REGISTRY.matrices
+FACTOR_TABLE: Mapping[str, Dict[int, Dict[int, float]]] = REGISTRY.factor_table
+_OPERATIONS: Mapping[str, Dict[int, Dict[int, Tuple[float, float]]]] = REGISTRY.operations
+
+
+def conversion_factor(category: str, src_idx: int, dst_idx: int) -> float:
+    """Factor multiplicativo de src_idx a dst_idx (1.0 si no está definido)."""
+    try:
+        return FACTOR_TABLE[category][src_idx][dst_idx]
+    except KeyError:
+        return 1.0
+
+
+def conversion_operation(category: str, src_idx: int, dst_idx: int) -> Tuple[float, float]:
+    """Par (multiplicador, divisor) de src_idx a dst_idx ((1.0, 1.0) si no está definido)."""
+    try:
+        return _OPERATIONS[category][src_idx][dst_idx]
+    except KeyError:
+        return 1.0, 1.0
+
+
+def convert(category: str, src_idx: int, dst_idx: int, qty: float) -> float:
+    """Convierte qty con una búsqueda en la tabla y una multiplicación (o división)."""
+    try:
+        multiplier, divisor = _OPERATIONS[category][src_idx][dst_idx]
+    except KeyError:
+        return qty
+    return qty * multiplier / divisor
+
+
+def factor_row(category: str, src_idx: int) -> List[float]:
+    """Factores desde src_idx hacia todos los sistemas de la categoría."""
+    matrix = FACTOR_MATRICES.get(category)
+    if matrix is None or not 0 <= src_idx < len(matrix):
+        return []
+    return list(matrix[src_idx])
+
+
+def operation_row(category: str, src_idx: int) -> List[Tuple[float, float]]:
+    """Pares (multiplicador, divisor) desde src_idx hacia todos los sistemas."""
+    row = _OPERATIONS.get(category, {}).get(src_idx)
+    if row is None:
+        return []
+    return [row[dst_idx] for dst_idx in range(len(row))]
+
+
+def placeholder_convert(category: str, src_idx: int, dst_idx: int, qty: float) -> float:
+    """Función central de conversión de unidades (firma original de main.py)."""
+    try:
+        multiplier, divisor = _OPERATIONS[category][src_idx][dst_idx]
+    except KeyError:
+        return qty
+    return qty * multiplier / divisor
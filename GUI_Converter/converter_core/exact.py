@@ -0,0 +1,179 @@
+"""Modo de precisión exacta: factores como Fraction y formato por cifras significativas.
+
+La ruta normal (engine.convert) multiplica floats y la interfaz redondea a
+12 decimales, de modo que magnitudes muy pequeñas (constantes de Stefan-
+Boltzmann, densidades en kg/mm³) se quedan en 0. Este módulo es opcional y
+no lo importa converter_core (fractions y decimal encarecen el arranque):
+
+    from converter_core.exact import convert_row_exact, format_significant
+    row = convert_row_exact("Density", 0, "1.5")      # [Fraction(3, 2), ...]
+    format_significant(row[1], 15)                     # '0.0000000015'
+
+Las escalas del registro se pasan a Fraction desde su representación
+decimal más corta (repr), que es la que figura en units.json: 1e-3 se lee
+como 1/1000 exacto y no como el binario más cercano. Las matrices de
+factores exactos se calculan una vez por categoría y quedan en caché, igual
+que los contextos de Decimal por número de cifras.
+
+El texto de entrada se lee primero como Decimal, que guarda el exponente
+sin desarrollarlo, y se rechaza (ExactRangeError) si sale del rango de float
+o tiene demasiadas cifras: Fraction('1e999999') construiría un entero de un
+millón de cifras en el hilo de la interfaz.
+"""
+import math
+from decimal import Context, Decimal, InvalidOperation
+from fractions import Fraction
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple, Union
+
+from .registry import REGISTRY
+
+DEFAULT_SIGNIFICANT = 15
+# Fuera de este rango de exponentes decimales se usa notación científica
+POSITIONAL_RANGE = (-24, 24)
+# Exponentes decimales admitidos en la entrada (los de float, subnormales incluidos)
+MIN_EXPONENT, MAX_EXPONENT = -324, 308
+# Cifras significativas admitidas en la entrada
+MAX_INPUT_DIGITS = 400
+
+
+class ExactRangeError(ValueError):
+    """Valor fuera del rango que admite el modo exacto."""
+
+
+Number = Union[Fraction, Decimal, float, int, str]
+
+
+def _checked_decimal(value: Union[Decimal, str]) -> Decimal:
+    """Decimal del texto, comprobado contra MIN/MAX_EXPONENT y MAX_INPUT_DIGITS."""
+    if not isinstance(value, Decimal):
+        try:
+            value = Decimal(value.strip())
+        except InvalidOperation:
+            raise ValueError(f"Not a number: {value!r}") from None
+    if not value.is_finite():
+        raise ExactRangeError(f"Not a finite number: {value}")
+    if value:
+        if not MIN_EXPONENT <= value.adjusted() <= MAX_EXPONENT:
+            raise ExactRangeError(f"Exponent out of range ({MIN_EXPONENT}..{MAX_EXPONENT})")
+        if len(value.as_tuple().digits) > MAX_INPUT_DIGITS:
+            raise ExactRangeError(f"More than {MAX_INPUT_DIGITS} significant digits")
+    return value
+
+
+def to_fraction(value: Number) -> Fraction:
+    """Fraction exacta; los float se leen por su repr ('0.1' -> 1/10).
+
+    Los str y Decimal pasan antes por _checked_decimal (ExactRangeError si
+    el exponente o el número de cifras se sale de los límites).
+    """
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ExactRangeError(f"Not a finite number: {value}")
+        return Fraction(repr(value))
+    if isinstance(value, int):
+        return Fraction(value)
+    return Fraction(_checked_decimal(value))
+
+
+def to_float(value: Fraction) -> float:
+    """float del resultado exacto; ExactRangeError si no cabe (1e308 m -> mm)."""
+    try:
+        return float(value)
+    except OverflowError:
+        raise ExactRangeError("Converted value out of range") from None
+
+
+@lru_cache(maxsize=None)
+def exact_scales(category: str) -> Tuple[Fraction, ...]:
+    try:
+        scales = REGISTRY.scales[category]
+    except KeyError:
+        raise ValueError(f"Unknown category: {category!r}") from None
+    return tuple(Fraction(repr(scale)) for scale in scales)
+
+
+@lru_cache(maxsize=None)
+def exact_matrix(category: str) -> Tuple[Tuple[Fraction, ...], ...]:
+    """Matriz N×N de factores exactos de la categoría (en caché)."""
+    scales = exact_scales(category)
+    return tuple(tuple(src / dst for dst in scales) for src in scales)
+
+
+def exact_factor(category: str, src_idx: int, dst_idx: int) -> Fraction:
+    matrix = exact_matrix(category)
+    if not (0 <= src_idx < len(matrix) and 0 <= dst_idx < len(matrix)):
+        raise ValueError(f"System index out of range (0..{len(matrix) - 1})")
+    return matrix[src_idx][dst_idx]
+
+
+def convert_exact(category: str, src_idx: int, dst_idx: int, qty: Number) -> Fraction:
+    """Como engine.convert, pero sin redondeo: devuelve una Fraction."""
+    return to_fraction(qty) * exact_factor(category, src_idx, dst_idx)
+
+
+def convert_row_exact(category: str, src_idx: int, qty: Number) -> List[Fraction]:
+    """`qty` convertido a todos los sistemas de la categoría (una fila de la tabla)."""
+    matrix = exact_matrix(category)
+    if not 0 <= src_idx < len(matrix):
+        raise ValueError(f"System index out of range (0..{len(matrix) - 1})")
+    value = to_fraction(qty)
+    return [value * factor for factor in matrix[src_idx]]
+
+
+@lru_cache(maxsize=None)
+def decimal_context(digits: int) -> Context:
+    """Contexto de Decimal con `digits` cifras significativas (uno por precisión)."""
+    return Context(prec=digits)
+
+
+def to_decimal(value: Number, digits: int = DEFAULT_SIGNIFICANT) -> Decimal:
+    """Valor redondeado a `digits` cifras significativas."""
+    context = decimal_context(digits)
+    if isinstance(value, Decimal):
+        return context.plus(value)
+    value = to_fraction(value)
+    return context.divide(Decimal(value.numerator), Decimal(value.denominator))
+
+
+def format_significant(value: Number, digits: int = DEFAULT_SIGNIFICANT,
+                       localize: Optional[Callable[[str], str]] = None) -> str:
+    """Texto con `digits` cifras significativas y sin ceros sobrantes.
+
+    Notación posicional dentro de POSITIONAL_RANGE y científica fuera. El
+    texto sale con ',' de miles y '.' decimal; `localize` (p. ej.
+    NumberFormatter.localize) lo pasa a los separadores de la localización.
+    """
+    number = to_decimal(value, digits)
+    if not number:
+        return "0"
+    number = number.normalize(decimal_context(digits))
+    exponent = number.adjusted()
+    if POSITIONAL_RANGE[0] < exponent < POSITIONAL_RANGE[1]:
+        text = format(number, ",f")
+    else:
+        text = format(number, "e").replace("E", "e")
+    return localize(text) if localize is not None else text
+
+
+def format_scientific_exact(value: Number, digits: int = 4) -> str:
+    """Notación científica con `digits` decimales en la mantisa, redondeada en Decimal.
+
+    Mismo texto que NumberFormatter.scientific para un float ('0.0000e+00',
+    '5.6704e-08'): mantisa de digits + 1 cifras y exponente de al menos dos.
+    """
+    number = to_decimal(value, digits + 1)
+    if not number:
+        return format(0.0, f".{digits}e")
+    sign, coefficient, _ = number.as_tuple()
+    mantissa = "".join(map(str, coefficient)).ljust(digits + 1, "0")
+    if digits:
+        mantissa = f"{mantissa[0]}.{mantissa[1:]}"
+    return f"{'-' if sign else ''}{mantissa}e{number.adjusted():+03d}"
+
+
+def clear_caches():
+    exact_scales.cache_clear()
+    exact_matrix.cache_clear()
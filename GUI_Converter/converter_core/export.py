@@ -0,0 +1,228 @@
+"""Exportación en streaming de historial o resultados por lotes.
+
+Los datos llegan de un iterable de filas (tuplas alineadas con `fields`) y
+se escriben por bloques de `chunk_rows` filas con un buffer de E/S grande,
+así que un millón de filas nunca se materializa entero en memoria.
+
+Formatos:
+  csv    texto separado por comas con cabecera
+  jsonl  un objeto JSON por línea
+  npy    matriz 2-D float64 (solo columnas numéricas)
+  npz    columnar: un array por campo; los campos de texto se guardan
+         codificados como diccionario (`<campo>` con los códigos int32 y
+         `<campo>__levels` con los valores distintos)
+
+Los formatos de NumPy lo importan bajo demanda; csv y jsonl no lo necesitan.
+"""
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from array import array
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+FORMATS = ("csv", "jsonl", "npy", "npz")
+DEFAULT_CHUNK_ROWS = 8192
+BUFFER_SIZE = 1 << 20
+# Sufijo del fichero parcial; se renombra al destino solo si la exportación termina
+PART_SUFFIX = ".part"
+
+HISTORY_FIELDS = ("category", "source_value", "source_unit", "system", "result", "unit", "timestamp")
+
+
+class ExportCancelled(Exception):
+    """Se canceló la exportación; el fichero parcial ya se ha borrado."""
+
+
+def format_for_path(path: str) -> str:
+    """Formato según la extensión del fichero."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension not in FORMATS:
+        raise ValueError(f"Unsupported export format: {extension or path!r}")
+    return extension
+
+
+def _chunks(rows: Iterable[Sequence], size: int) -> Iterator[List[Sequence]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_csv(chunks: Iterator[List[Sequence]], path: str, fields: Sequence[str]):
+    with open(path, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            yield len(chunk)
+
+
+def _write_jsonl(chunks: Iterator[List[Sequence]], path: str, fields: Sequence[str]):
+    # Un solo codificador: json.dumps con argumentos crea uno nuevo por llamada
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    fields = tuple(fields)
+    with open(path, "w", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+        for chunk in chunks:
+            f.write("\n".join([encode(dict(zip(fields, row))) for row in chunk]))
+            f.write("\n")
+            yield len(chunk)
+
+
+class _Column:
+    """Columna acumulada en un fichero temporal en crudo."""
+
+    def __init__(self, directory: str, index: int, textual: bool):
+        self.textual = textual
+        self.count = 0
+        self.path = os.path.join(directory, f"column{index}.bin")
+        self._file = open(self.path, "wb", buffering=BUFFER_SIZE)
+        self._codes: Dict[str, int] = {}
+
+    def append(self, values: List):
+        if self.textual:
+            codes = self._codes
+            data = array("i", [codes.setdefault(value, len(codes)) for value in values])
+        else:
+            data = array("d", values)
+        data.tofile(self._file)
+        self.count += len(values)
+
+    def close(self):
+        self._file.close()
+
+    def levels(self) -> List[str]:
+        return list(self._codes)
+
+    def descr(self, np) -> str:
+        return np.dtype("i4" if self.textual else "f8").str
+
+
+def _npy_header(np, descr: str, shape) -> bytes:
+    buffer = io.BytesIO()
+    np.lib.format.write_array_header_1_0(buffer, {"descr": descr, "fortran_order": False, "shape": shape})
+    return buffer.getvalue()
+
+
+def _collect_columns(chunks, directory: str, fields: Sequence[str], numeric_only: bool):
+    """Vuelca cada columna a su fichero temporal; genera el número de filas de cada bloque."""
+    columns: List[_Column] = []
+    try:
+        for chunk in chunks:
+            if not columns:
+                for i, value in enumerate(chunk[0]):
+                    textual = isinstance(value, str)
+                    if textual and numeric_only:
+                        raise ValueError(f"Field {fields[i]!r} is not numeric; use csv, jsonl or npz")
+                    columns.append(_Column(directory, i, textual))
+            for i, column in enumerate(columns):
+                column.append([row[i] for row in chunk])
+            yield len(chunk)
+    finally:
+        for column in columns:
+            column.close()
+    # Sin filas: columnas numéricas vacías para conservar los nombres
+    if not columns:
+        for i in range(len(fields)):
+            columns.append(_Column(directory, i, False))
+            columns[-1].close()
+    return columns
+
+
+def _write_npz(chunks, path: str, fields: Sequence[str]):
+    import numpy as np
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as directory:
+        columns = yield from _collect_columns(chunks, directory, fields, numeric_only=False)
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name, column in zip(fields, columns):
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as entry:
+                    entry.write(_npy_header(np, column.descr(np), (column.count,)))
+                    with open(column.path, "rb") as raw:
+                        shutil.copyfileobj(raw, entry, BUFFER_SIZE)
+                if column.textual:
+                    with archive.open(f"{name}__levels.npy", "w") as entry:
+                        np.lib.format.write_array(entry, np.array(column.levels(), dtype=str))
+
+
+def _write_npy(chunks, path: str, fields: Sequence[str]):
+    import numpy as np
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as directory:
+        raw_path = os.path.join(directory, "rows.bin")
+        count = 0
+        with open(raw_path, "wb", buffering=BUFFER_SIZE) as raw:
+            for chunk in chunks:
+                for row in chunk:
+                    if any(isinstance(value, str) for value in row):
+                        raise ValueError("npy export needs numeric fields only; use csv, jsonl or npz")
+                # Fila a fila (orden C): la matriz final es (filas, campos)
+                array("d", [value for row in chunk for value in row]).tofile(raw)
+                count += len(chunk)
+                yield len(chunk)
+        with open(path, "wb", buffering=BUFFER_SIZE) as f, open(raw_path, "rb") as raw:
+            f.write(_npy_header(np, np.dtype("f8").str, (count, len(fields))))
+            shutil.copyfileobj(raw, f, BUFFER_SIZE)
+
+
+_WRITERS = {
+    "csv": _write_csv,
+    "jsonl": _write_jsonl,
+    "npy": _write_npy,
+    "npz": _write_npz,
+}
+
+
+def export_rows(rows: Iterable[Sequence], path: str, fields: Sequence[str], fmt: Optional[str] = None,
+                chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                progress: Optional[Callable[[int], None]] = None,
+                cancelled: Optional[Callable[[], bool]] = None) -> int:
+    """Escribe `rows` en `path` y devuelve el número de filas exportadas.
+
+    `progress(filas)` se llama tras cada bloque; si `cancelled()` devuelve
+    True se detiene, borra el fichero parcial y lanza ExportCancelled.
+
+    Se escribe en `path + ".part"` y se renombra al terminar, así que una
+    exportación fallida o cancelada no toca un fichero ya existente en `path`.
+    """
+    fmt = fmt or format_for_path(path)
+    try:
+        writer = _WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unsupported export format: {fmt!r}") from None
+
+    total = 0
+    part_path = path + PART_SUFFIX
+    steps = writer(_chunks(rows, chunk_rows), part_path, fields)
+    try:
+        for written in steps:
+            total += written
+            if progress is not None:
+                progress(total)
+            if cancelled is not None and cancelled():
+                raise ExportCancelled(path)
+        os.replace(part_path, path)
+    except BaseException:
+        # Cerrar primero el escritor (y sus ficheros) antes de borrar el parcial
+        steps.close()
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    return total
+
+
+def history_rows(records) -> Iterator[tuple]:
+    """Filas HISTORY_FIELDS a partir de objetos HistoryRecord."""
+    return (record.as_row() for record in records)
+
+
+def columns_rows(columns: Sequence[Sequence[float]], count: Optional[int] = None) -> Iterator[tuple]:
+    """Filas a partir de columnas paralelas (p. ej. resultados por lotes)."""
+    rows = zip(*columns)
+    return rows if count is None else islice(rows, count)
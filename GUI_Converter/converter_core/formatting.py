@@ -0,0 +1,156 @@
+"""Ayudantes de formato de números y unidades, sin dependencias de Qt."""
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional
+
+from .instrumentation import PROFILER
+
+
+def convert_to_html_unit(unit_str: str) -> str:
+    """Convierte un string de unidad con superíndices (ej. 'm³') a HTML."""
+    unit_str = unit_str.replace("²", "<sup>2</sup>")
+    unit_str = unit_str.replace("³", "<sup>3</sup>")
+    unit_str = unit_str.replace("⁴", "<sup>4</sup>")
+    unit_str = unit_str.replace("·", "⋅")
+    unit_str = unit_str.replace("K⁴", "K<sup>4</sup>")
+    return unit_str
+
+
+def _fixed_text(value: float, decimals: int) -> str:
+    text = f"{value:,.{decimals}f}"
+    if decimals > 0:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def _make_localizer(decimal_point: str, group_separator: str) -> Callable[[str], str]:
+    """Función que pasa texto con ',' y '.' a los separadores dados.
+
+    Encadenar replace es bastante más rápido que str.translate para cadenas
+    cortas como estas.
+    """
+    if decimal_point == "." and group_separator == ",":
+        return lambda text: text
+    if group_separator == "":
+        return lambda text: text.replace(",", "").replace(".", decimal_point)
+    if decimal_point == ".":
+        return lambda text: text.replace(",", group_separator)
+    return lambda text: (text.replace(",", "\0").replace(".", decimal_point)
+                         .replace("\0", group_separator))
+
+
+def format_fixed(value: float, decimals: int = 12, decimal_point: str = ".",
+                 group_separator: str = ",") -> str:
+    """Punto fijo con separador de miles y sin ceros decimales a la derecha.
+
+    Equivale a QLocale.toString(value, 'f', decimals) seguido de la limpieza
+    de ceros que hacía la interfaz, con los separadores pasados como texto.
+    """
+    return _make_localizer(decimal_point, group_separator)(_fixed_text(value, decimals))
+
+
+def format_scientific(value: float, digits: int = 4) -> str:
+    """Notación científica con `digits` decimales en la mantisa."""
+    return f"{value:.{digits}e}"
+
+
+class NumberFormatter:
+    """Formateador numérico con los separadores de la localización en caché.
+
+    Guarda el separador decimal y el de miles una sola vez y formatea en una
+    pasada (format + replace) en lugar de pedir la localización y trocear
+    el texto en cada celda. Los formatos individuales pasan por una caché LRU
+    indexada por (valor, precisión) que se vacía al cambiar la localización.
+    """
+
+    STYLES = ("fixed", "scientific", "general")
+
+    def __init__(self, decimal_point: str = ".", group_separator: str = ",",
+                 decimals: int = 12, sci_digits: int = 4, cache_size: int = 4096):
+        self.decimals = decimals
+        self.sci_digits = sci_digits
+        self.cache_size = cache_size
+        self.locale_version = 0
+        self.decimal_point = decimal_point
+        self.group_separator = group_separator
+        self._build()
+        if PROFILER.enabled:
+            # Solo con la instrumentación activa: mide también los aciertos de la caché
+            self.fixed = PROFILER.wrap("format", self.fixed)
+            self.scientific = PROFILER.wrap("format", self.scientific)
+
+    def _build(self):
+        self._localize = _make_localizer(self.decimal_point, self.group_separator)
+        self._fixed_cached = lru_cache(maxsize=self.cache_size)(self._format_fixed)
+        self._scientific_cached = lru_cache(maxsize=self.cache_size)(self._format_scientific)
+
+    def set_locale(self, decimal_point: str, group_separator: str) -> bool:
+        """Actualiza los separadores; devuelve True (y vacía la caché) si cambian."""
+        if decimal_point == self.decimal_point and group_separator == self.group_separator:
+            return False
+        self.decimal_point = decimal_point
+        self.group_separator = group_separator
+        self.locale_version += 1
+        self._build()
+        return True
+
+    def clear_cache(self):
+        self._fixed_cached.cache_clear()
+        self._scientific_cached.cache_clear()
+
+    def cache_info(self):
+        return {"fixed": self._fixed_cached.cache_info(),
+                "scientific": self._scientific_cached.cache_info()}
+
+    def _format_fixed(self, value: float, precision: int) -> str:
+        return self._localize(_fixed_text(value, precision))
+
+    def _format_scientific(self, value: float, precision: int) -> str:
+        return f"{value:.{precision}e}"
+
+    def _format_general(self, value: float, precision: int) -> str:
+        text = f"{value:.{precision}g}"
+        if self.decimal_point != ".":
+            text = text.replace(".", self.decimal_point)
+        return text
+
+    def fixed(self, value: float, precision: Optional[int] = None) -> str:
+        """Punto fijo localizado, sin ceros decimales sobrantes."""
+        return self._fixed_cached(value, self.decimals if precision is None else precision)
+
+    def scientific(self, value: float, precision: Optional[int] = None) -> str:
+        """Notación científica con `precision` decimales en la mantisa."""
+        return self._scientific_cached(value, self.sci_digits if precision is None else precision)
+
+    def localize(self, text: str) -> str:
+        """Pasa un texto con ',' de miles y '.' decimal a los separadores actuales."""
+        return self._localize(text)
+
+    def general(self, value: float, precision: int = 12) -> str:
+        """Formato 'g' con `precision` cifras significativas (sin separador de miles)."""
+        return self._format_general(value, precision)
+
+    def format_many(self, values: Iterable[float], precision: Optional[int] = None,
+                    style: str = "fixed") -> List[str]:
+        """Formatea una columna completa de valores.
+
+        No usa la caché LRU: en lotes los valores rara vez se repiten y
+        solo desplazarían las entradas útiles de la interfaz.
+        """
+        if style == "fixed":
+            precision = self.decimals if precision is None else precision
+            localize = self._localize
+            spec = f",.{precision}f"
+            if precision > 0:
+                texts = [format(value, spec).rstrip("0").rstrip(".") for value in values]
+            else:
+                texts = [format(value, spec) for value in values]
+            return [localize(text) if text != "-0" else "0" for text in texts]
+        elif style == "scientific":
+            precision = self.sci_digits if precision is None else precision
+            func = self._format_scientific
+        elif style == "general":
+            precision = 12 if precision is None else precision
+            func = self._format_general
+        else:
+            raise ValueError(f"Unknown style {style!r}; expected one of {self.STYLES}")
+        return [func(value, precision) for value in values]
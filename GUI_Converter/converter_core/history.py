@@ -0,0 +1,172 @@
+"""Historial de conversiones: registros compactos con índice para duplicados."""
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .formatting import NumberFormatter
+
+
+class HistoryRecord:
+    """Una conversión guardada en el historial."""
+
+    __slots__ = ("category", "source_value", "source_unit", "system", "result", "unit", "timestamp",
+                 "record_id")
+
+    def __init__(self, category: str, source_value: float, source_unit: str, system: str,
+                 result: float, unit: str, timestamp: Optional[float] = None,
+                 record_id: Optional[int] = None):
+        self.category = category
+        self.source_value = source_value
+        self.source_unit = source_unit
+        self.system = system
+        self.result = result
+        self.unit = unit
+        self.timestamp = time.time() if timestamp is None else timestamp
+        # Clave en la base de datos de historial (None si aún no se ha leído de ella)
+        self.record_id = record_id
+
+    @property
+    def key(self) -> Tuple:
+        """Identidad del registro para detectar duplicados (sin la fecha)."""
+        return (self.category, self.source_value, self.source_unit, self.system, self.result, self.unit)
+
+    def as_row(self) -> Tuple:
+        """Campos en el orden de export.HISTORY_FIELDS."""
+        return (self.category, self.source_value, self.source_unit, self.system,
+                self.result, self.unit, self.timestamp)
+
+    def display_text(self, formatter: NumberFormatter) -> str:
+        return (
+            f"{self.category} | {formatter.fixed(self.source_value)} {self.source_unit} | "
+            f"[{self.system}] {formatter.fixed(self.result)} {self.unit} | "
+            f" ({formatter.scientific(self.result)})"
+        )
+
+    def __repr__(self) -> str:
+        return (f"HistoryRecord({self.category!r}, {self.source_value!r}, {self.source_unit!r}, "
+                f"{self.system!r}, {self.result!r}, {self.unit!r})")
+
+
+class HistoryStore:
+    """Cola ordenada de registros con un índice hash y capacidad máxima.
+
+    Los registros están en un deque, así que añadir al final y descartar los
+    más antiguos por el principio es O(1). El índice guarda, por clave, un
+    número de secuencia que no cambia al descartar: la fila de un registro es
+    su secuencia menos la del primero (`_first`). La comprobación de
+    duplicados es O(1) con ese diccionario.
+    """
+
+    DEFAULT_CAPACITY = 10_000
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._records: Deque[HistoryRecord] = deque()
+        self._index: Dict[Tuple, int] = {}
+        # Secuencia del registro de la fila 0
+        self._first = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, row: int) -> HistoryRecord:
+        return self._records[row]
+
+    def __iter__(self) -> Iterator[HistoryRecord]:
+        return iter(self._records)
+
+    def __contains__(self, record: HistoryRecord) -> bool:
+        return record.key in self._index
+
+    def row_of(self, record: HistoryRecord) -> Optional[int]:
+        """Fila actual del registro (o de uno con la misma clave), o None."""
+        sequence = self._index.get(record.key)
+        return None if sequence is None else sequence - self._first
+
+    def overflow_for(self, count: int = 1) -> int:
+        """Cuántos registros antiguos se descartarían al añadir `count` nuevos."""
+        return max(0, len(self._records) + count - self.capacity)
+
+    def add(self, record: HistoryRecord) -> bool:
+        """Añade el registro si no está repetido; devuelve si se añadió."""
+        key = record.key
+        if key in self._index:
+            return False
+        overflow = self.overflow_for(1)
+        if overflow:
+            self.evict(overflow)
+        self._index[key] = self._first + len(self._records)
+        self._records.append(record)
+        return True
+
+    def unseen(self, records: Iterable[HistoryRecord]) -> List[HistoryRecord]:
+        """Registros de `records` que aún no están en el almacén."""
+        index = self._index
+        return [record for record in records if record.key not in index]
+
+    def prepend(self, records: List[HistoryRecord]) -> int:
+        """Inserta registros más antiguos al principio, sin superar la capacidad.
+
+        `records` va de más antiguo a más reciente; si no caben todos se
+        conservan los más recientes. Devuelve cuántos se insertaron.
+        """
+        room = self.capacity - len(self._records)
+        fresh = self.unseen(records)
+        if room <= 0 or not fresh:
+            return 0
+        fresh = fresh[-room:]
+        self._first -= len(fresh)
+        for sequence, record in enumerate(fresh, self._first):
+            self._index[record.key] = sequence
+        self._records.extendleft(reversed(fresh))
+        return len(fresh)
+
+    def extend(self, records: Iterable[HistoryRecord]) -> int:
+        return sum(1 for record in records if self.add(record))
+
+    def evict(self, count: int):
+        """Descarta los `count` registros más antiguos (O(count))."""
+        records, index = self._records, self._index
+        count = min(count, len(records))
+        for _ in range(count):
+            index.pop(records.popleft().key, None)
+        self._first += count
+
+    def remove_rows(self, rows: Iterable[int]):
+        """Borra filas sueltas en una sola pasada (O(n), no O(k·n) con del por fila).
+
+        La deque se reconstruye sin las filas borradas y solo se renumeran
+        los registros posteriores a la primera de ellas.
+        """
+        removed = set(rows)
+        if not removed:
+            return
+        records, index = self._records, self._index
+        if min(removed) < 0 or max(removed) >= len(records):
+            raise IndexError("history row out of range")
+        kept: Deque[HistoryRecord] = deque()
+        for row, record in enumerate(records):
+            if row in removed:
+                index.pop(record.key, None)
+            else:
+                kept.append(record)
+        self._records = kept
+        start = min(removed)
+        for sequence, record in enumerate(islice(kept, start, None), self._first + start):
+            index[record.key] = sequence
+
+    def clear(self):
+        self._records.clear()
+        self._index.clear()
+        self._first = 0
+
+    def set_capacity(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        overflow = len(self._records) - capacity
+        if overflow > 0:
+            self.evict(overflow)
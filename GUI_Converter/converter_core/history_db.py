@@ -0,0 +1,213 @@
+"""Persistencia del historial en SQLite.
+
+La base de datos funciona en modo WAL (las lecturas no bloquean a las
+escrituras) y las altas se acumulan en memoria hasta `batch_size` registros
+o hasta que se llama a `flush()`, de modo que cada lote es una sola
+transacción. La lectura es por páginas (paginación por clave, sin OFFSET)
+y la búsqueda se resuelve en la propia base de datos.
+"""
+import os
+import sqlite3
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .history import HistoryRecord
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_PAGE_SIZE = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id           INTEGER PRIMARY KEY,
+    category     TEXT NOT NULL,
+    source_value REAL NOT NULL,
+    source_unit  TEXT NOT NULL,
+    system       TEXT NOT NULL,
+    result       REAL NOT NULL,
+    unit         TEXT NOT NULL,
+    timestamp    REAL NOT NULL,
+    UNIQUE (category, source_value, source_unit, system, result, unit)
+);
+CREATE INDEX IF NOT EXISTS history_category ON history (category COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS history_timestamp ON history (timestamp);
+"""
+
+_COLUMNS = "id, category, source_value, source_unit, system, result, unit, timestamp"
+_KEY_WHERE = ("category = ? AND source_value = ? AND source_unit = ? "
+              "AND system = ? AND result = ? AND unit = ?")
+
+
+def _record(row) -> HistoryRecord:
+    record_id, category, source_value, source_unit, system, result, unit, timestamp = row
+    return HistoryRecord(category, source_value, source_unit, system, result, unit,
+                         timestamp, record_id)
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Condición del filtro del historial: categoría que empieza por el texto o
+# sistema/unidades que lo contienen. matches_filter es su equivalente en Python.
+_FILTER_WHERE = ("category LIKE ? ESCAPE '\\' OR system LIKE ? ESCAPE '\\' "
+                 "OR unit LIKE ? ESCAPE '\\' OR source_unit LIKE ? ESCAPE '\\'")
+
+
+def _filter_params(text: str) -> Tuple[str, str, str, str]:
+    text = _escape_like(text.strip())
+    return (text + "%", f"%{text}%", f"%{text}%", f"%{text}%")
+
+
+def matches_filter(record: HistoryRecord, text: str) -> bool:
+    """Si `record` aparecería en search(text) (sin distinguir mayúsculas)."""
+    text = text.strip().lower()
+    return (record.category.lower().startswith(text) or text in record.system.lower()
+            or text in record.unit.lower() or text in record.source_unit.lower())
+
+
+class HistoryDatabase:
+    """Historial persistente; `path` puede ser ':memory:'."""
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        # Transacciones explícitas: las abrimos nosotros en cada lote
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending: List[HistoryRecord] = []
+
+    def add(self, record: HistoryRecord):
+        """Encola el registro; se escribe al completar el lote o en `flush()`."""
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, records: Iterable[HistoryRecord]):
+        self._pending.extend(records)
+        self.flush()
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """Escribe los registros pendientes en una sola transacción."""
+        if not self._pending:
+            return 0
+        rows = [
+            (r.category, r.source_value, r.source_unit, r.system, r.result, r.unit, r.timestamp)
+            for r in self._pending
+        ]
+        with self._transaction():
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO history "
+                "(category, source_value, source_unit, system, result, unit, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        self._pending.clear()
+        return len(rows)
+
+    def recent(self, limit: int = DEFAULT_PAGE_SIZE, before_id: Optional[int] = None) -> List[HistoryRecord]:
+        """Página de registros anteriores a `before_id`, de más antiguo a más reciente."""
+        self.flush()
+        if before_id is None:
+            cursor = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM history ORDER BY id DESC LIMIT ?", (limit,))
+        else:
+            cursor = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM history WHERE id < ? ORDER BY id DESC LIMIT ?",
+                (before_id, limit))
+        records = [_record(row) for row in cursor]
+        records.reverse()
+        return records
+
+    def search(self, text: str, limit: int = DEFAULT_PAGE_SIZE) -> List[HistoryRecord]:
+        """Registros más recientes cuya categoría empiece por `text` o cuyo
+        sistema o unidades lo contengan (sin distinguir mayúsculas)."""
+        self.flush()
+        cursor = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM history WHERE {_FILTER_WHERE} ORDER BY id DESC LIMIT ?",
+            _filter_params(text) + (limit,))
+        records = [_record(row) for row in cursor]
+        records.reverse()
+        return records
+
+    def by_category(self, category: str, limit: int = DEFAULT_PAGE_SIZE) -> List[HistoryRecord]:
+        self.flush()
+        cursor = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM history WHERE category = ? COLLATE NOCASE "
+            "ORDER BY timestamp DESC LIMIT ?", (category, limit))
+        records = [_record(row) for row in cursor]
+        records.reverse()
+        return records
+
+    def remove(self, records: Iterable[HistoryRecord]):
+        self.flush()
+        with self._transaction():
+            self._conn.executemany(f"DELETE FROM history WHERE {_KEY_WHERE}",
+                                   [record.key for record in records])
+
+    def clear(self, text: str = "") -> int:
+        """Borra los registros que coinciden con el filtro `text` (todos si está vacío).
+
+        Devuelve cuántos se borraron.
+        """
+        if not text.strip():
+            self._pending.clear()
+            with self._transaction():
+                return self._conn.execute("DELETE FROM history").rowcount
+        self.flush()
+        with self._transaction():
+            return self._conn.execute(f"DELETE FROM history WHERE {_FILTER_WHERE}",
+                                      _filter_params(text)).rowcount
+
+    def count(self, text: str = "") -> int:
+        """Número de registros (solo los que coinciden con el filtro `text`, si se da)."""
+        self.flush()
+        if not text.strip():
+            return self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+        return self._conn.execute(f"SELECT COUNT(*) FROM history WHERE {_FILTER_WHERE}",
+                                  _filter_params(text)).fetchone()[0]
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+
+def iter_rows(path: str, batch_size: int = 4096) -> Iterator[Tuple]:
+    """Recorre todo el historial (más antiguo primero) como tuplas de export.HISTORY_FIELDS.
+
+    Abre su propia conexión de solo lectura, así que puede usarse desde otro
+    hilo mientras la interfaz sigue escribiendo (WAL).
+    """
+    uri = "file:" + os.path.abspath(path).replace("?", "%3f").replace("#", "%23") + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        cursor = conn.execute(
+            "SELECT category, source_value, source_unit, system, result, unit, timestamp "
+            "FROM history ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+    finally:
+        conn.close()
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute("BEGIN")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self._conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
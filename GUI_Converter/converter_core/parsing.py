@@ -0,0 +1,254 @@
+"""Lectura de números con los separadores de la localización, sin Qt.
+
+NumberParser valida y convierte en una sola pasada el texto que escribe el
+usuario, con las mismas reglas para la casilla de valor, el historial, el
+panel de valores pegados y la línea de comandos:
+
+- signo opcional, mantisa con separador decimal opcional y exponente e/E;
+- se aceptan '.' y ',' como separador decimal (como hacía la expresión
+  regular original), además del de la localización;
+- el separador de miles de la localización se admite entre cifras de la
+  parte entera: '1.234,5' (es_ES) o '1,234.5' (en_US). Un único '.' o ','
+  sin más separadores se lee siempre como decimal, así que '1,5' es 1.5
+  en cualquier localización.
+
+El modo masivo (parse_many) normaliza todo el bloque con str.translate y lo
+convierte de una vez con numpy.fromstring si NumPy está instalado, o con
+map(float) si no. Esa ruta solo se usa si el bloque no tiene más caracteres
+que los de la ruta rápida de un valor suelto (cifras, '.', ',', e/E y
+signos), para que 'nan', 'inf', '1_000' o separadores de miles mal
+agrupados se rechacen igual que en la casilla de valor; en otro caso, o si
+falla, se recorre elemento a elemento con las mismas reglas que parse.
+"""
+import warnings
+from array import array
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Estados de validación (mismos valores que QValidator.State)
+INVALID, INTERMEDIATE, ACCEPTABLE = range(3)
+
+_MARKS = frozenset(".,")
+# Caracteres de la ruta rápida: sin separadores de miles, float() decide solo
+_SIMPLE_CHARS = "0123456789.,eE+-"
+# Borra los caracteres admitidos en la ruta rápida de parse_many; si queda algo, no se usa
+_BLOCK_CHARS = str.maketrans("", "", _SIMPLE_CHARS + ";")
+
+
+def _is_simple(text: str) -> bool:
+    return bool(text) and not text.strip(_SIMPLE_CHARS) and text.count(",") + text.count(".") <= 1
+
+
+def split_values(text: str) -> List[str]:
+    """Separa el texto en valores por saltos de línea o punto y coma."""
+    tokens = text.replace(";", "\n").split("\n")
+    return [token for token in map(str.strip, tokens) if token]
+
+
+class NumberParser:
+    """Validador y lector de números para unos separadores dados."""
+
+    def __init__(self, decimal_point: str = ".", group_separator: str = ","):
+        self.decimal_point = ""
+        self.group_separator = ""
+        self.set_locale(decimal_point, group_separator)
+
+    def set_locale(self, decimal_point: str, group_separator: str) -> bool:
+        """Cambia los separadores; devuelve True si han cambiado."""
+        if decimal_point == self.decimal_point and group_separator == self.group_separator:
+            return False
+        self.decimal_point = decimal_point
+        self.group_separator = group_separator
+        # Bloque pegado: decimal local -> '.' y saltos de línea -> ';' para
+        # numpy.fromstring. Los separadores de miles no se quitan aquí: un
+        # bloque que los tenga pasa elemento a elemento por las reglas de
+        # parse, que comprueban los grupos de tres cifras.
+        table = {ord("\n"): ";", ord("\r"): ";"}
+        if decimal_point != ".":
+            table[ord(decimal_point)] = "."
+        self._bulk_table = str.maketrans(table)
+        return True
+
+    def _read(self, text: str) -> Tuple[int, Optional[float]]:
+        """(estado, valor) en una pasada.
+
+        Lo habitual (cifras con como mucho un '.' o ',') lo resuelve float()
+        directamente; solo los separadores de miles y la entrada incompleta o
+        errónea pasan por _scan.
+        """
+        text = text.strip()
+        # Condición de _is_simple, en línea: es la ruta de cada pulsación
+        if text and not text.strip(_SIMPLE_CHARS) and text.count(",") + text.count(".") <= 1:
+            try:
+                return ACCEPTABLE, float(text.replace(",", "."))
+            except ValueError:
+                pass
+        state, normalized = self._scan(text)
+        return state, (float(normalized) if state == ACCEPTABLE else None)
+
+    def _scan(self, text: str) -> Tuple[int, str]:
+        """(estado, texto normalizado para float()).
+
+        Operaciones de str en C (isdigit, rfind, split) en lugar de recorrer
+        los caracteres en Python.
+        """
+        if not text:
+            return INTERMEDIATE, ""
+        sign = ""
+        if text[0] in "+-":
+            sign, text = text[0], text[1:]
+        if text.isdigit() and text.isascii():
+            return ACCEPTABLE, sign + text
+
+        exponent = None
+        cut = text.find("e")
+        if cut < 0:
+            cut = text.find("E")
+        if cut >= 0:
+            text, exponent = text[:cut], text[cut + 1:]
+        state, mantissa = self._mantissa(text, exponent is None)
+        if state != ACCEPTABLE or exponent is None:
+            return state, sign + mantissa
+        digits = exponent[1:] if exponent.startswith(("+", "-")) else exponent
+        if not digits:
+            return INTERMEDIATE, ""
+        if not (digits.isdigit() and digits.isascii()):
+            return INVALID, ""
+        return ACCEPTABLE, f"{sign}{mantissa}e{exponent}"
+
+    def _mantissa(self, text: str, at_end: bool) -> Tuple[int, str]:
+        if not text:
+            return (INTERMEDIATE if at_end else INVALID), ""
+        group = self.group_separator
+        # Separador decimal: el último '.'/',' salvo que sea el de miles
+        # repetido ('1.234.567' en es_ES).
+        mark = max(text.rfind("."), text.rfind(","), text.rfind(self.decimal_point))
+        if mark >= 0 and text[mark] == group and text.count(group) > 1:
+            mark = -1
+        if mark < 0:
+            integer, fraction, mark_char = text, "", ""
+        else:
+            integer, fraction, mark_char = text[:mark], text[mark + 1:], text[mark]
+        if fraction and not (fraction.isdigit() and fraction.isascii()):
+            return INVALID, ""
+        if integer and not (integer.isdigit() and integer.isascii()):
+            state, integer = self._ungroup(integer, mark_char, at_end and mark < 0)
+            if state != ACCEPTABLE:
+                return state, ""
+        if not integer and not fraction:
+            return (INTERMEDIATE if at_end else INVALID), ""
+        return ACCEPTABLE, integer + ("." + fraction if fraction else "")
+
+    def _ungroup(self, integer: str, mark_char: str, at_end: bool) -> Tuple[int, str]:
+        """Quita los separadores de miles; grupos de tres cifras tras el primero."""
+        separators = {self.group_separator} if not mark_char else {self.group_separator} | (_MARKS - {mark_char})
+        for separator in separators:
+            if separator:
+                integer = integer.replace(separator, "\0")
+        groups = integer.split("\0")
+        if len(groups) == 1 or not groups[0] or len(groups[0]) > 3:
+            return INVALID, ""
+        last = len(groups) - 1
+        for index, digits in enumerate(groups):
+            if digits and not (digits.isdigit() and digits.isascii()):
+                return INVALID, ""
+            if len(digits) != 3 and index:
+                # '1.234.5' o '1.234.' mientras se escribe '1.234.567'
+                if index == last and at_end and len(digits) < 3:
+                    return INTERMEDIATE, ""
+                return INVALID, ""
+        return ACCEPTABLE, "".join(groups)
+
+    def validate(self, text: str) -> int:
+        """INVALID, INTERMEDIATE (entrada incompleta) o ACCEPTABLE."""
+        return self._read(text)[0]
+
+    def parse(self, text: str) -> float:
+        """Valor del texto; ValueError si no es un número completo."""
+        value = self._read(text)[1]
+        if value is None:
+            raise ValueError(f"Not a number: {text!r}")
+        return value
+
+    def try_parse(self, text: str) -> Optional[float]:
+        # Misma lógica que _read sin construir la tupla (estado, valor)
+        text = text.strip()
+        if text and not text.strip(_SIMPLE_CHARS) and text.count(",") + text.count(".") <= 1:
+            try:
+                return float(text.replace(",", "."))
+            except ValueError:
+                pass
+        state, normalized = self._scan(text)
+        return float(normalized) if state == ACCEPTABLE else None
+
+    def normalize(self, text: str) -> Optional[str]:
+        """Texto decimal ASCII equivalente ('1.234,5' -> '1234.5'), o None.
+
+        Para el modo exacto, que lee el número escrito sin pasar por float.
+        """
+        text = text.strip()
+        if _is_simple(text):
+            candidate = text.replace(",", ".")
+            try:
+                float(candidate)
+                return candidate
+            except ValueError:
+                pass
+        state, normalized = self._scan(text)
+        return normalized if state == ACCEPTABLE else None
+
+    def parse_many(self, text: str) -> Tuple[array, List[Tuple[int, str]]]:
+        """Convierte un bloque de valores separados por saltos de línea o ';'.
+
+        Devuelve un array('d') y los elementos no válidos como (posición, texto).
+        """
+        normalized = text.strip().translate(self._bulk_table)
+        if not normalized.translate(_BLOCK_CHARS):
+            values = _parse_block(normalized)
+            if values is not None:
+                return values, []
+
+        values = array("d")
+        invalid = []
+        for position, token in enumerate(split_values(text)):
+            value = self.try_parse(token)
+            if value is None:
+                invalid.append((position, token))
+            else:
+                values.append(value)
+        return values, invalid
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """NumPy solo se carga al pegar un bloque: la interfaz importa este módulo al arrancar."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _parse_block(normalized: str) -> Optional[array]:
+    """Ruta rápida: el bloque entero de una vez, o None si algún elemento no es válido."""
+    while ";;" in normalized:
+        normalized = normalized.replace(";;", ";")
+    normalized = normalized.strip("; \t")
+    if not normalized:
+        return array("d")
+    np = _numpy()
+    if np is not None:
+        with warnings.catch_warnings():
+            # fromstring solo avisa (DeprecationWarning) cuando deja texto sin leer
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                parsed = np.fromstring(normalized, dtype=np.float64, sep=";")
+            except (DeprecationWarning, ValueError):
+                return None
+        values = array("d")
+        values.frombytes(parsed.tobytes())
+        return values
+    try:
+        return array("d", map(float, normalized.split(";")))
+    except ValueError:
+        return None
@@ -0,0 +1,267 @@
+"""Registro de unidades cargado desde un fichero declarativo (units.json).
+
+El JSON lista las dimensiones base, los sistemas de unidades (escala de su
+unidad base de cada dimensión respecto al SI) y, por categoría, su vector de
+dimensiones y las etiquetas de unidad. La escala de cada categoría en cada
+sistema se deriva del análisis dimensional (converter_core.dimensions);
+`overrides` fija a mano las que no siguen la regla y `scales` permite dar
+la lista completa. `units` y `prefixes` definen los símbolos que acepta el
+analizador de expresiones (converter_core.unit_expr); los prefijos se
+expanden al compilar. Al cargarlo se valida y se compila a estructuras inmutables con las matrices de factores
+ya calculadas. El resultado compilado se guarda con `marshal` en
+__pycache__/units.<hash>.marshal (CRC-32 y tamaño del contenido del JSON),
+así que los arranques siguientes no vuelven a analizar ni a validar el
+fichero. Añadir una categoría solo requiere editar el JSON.
+"""
+import marshal
+import os
+import zlib
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from .dimensions import BASE_DIMENSIONS, Dimension, dimension_vector, format_dimension, scale_in_system
+
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "units.json")
+# Se incrementa al cambiar el formato compilado para invalidar las cachés antiguas
+COMPILED_FORMAT = 4
+
+
+class UnitRegistry:
+    """Registro compilado e inmutable."""
+
+    __slots__ = ("digest", "dimensions", "systems", "system_names", "system_bases", "system_symbols",
+                 "categories", "category_dimensions", "labels", "scales", "matrices", "divisors",
+                 "factor_table", "operations", "units")
+
+    def __init__(self, compiled: dict):
+        self.digest: str = compiled["digest"]
+        self.dimensions: Tuple[str, ...] = compiled["dimensions"]
+        self.systems: Tuple[str, ...] = compiled["systems"]
+        self.system_names: Tuple[str, ...] = compiled["system_names"]
+        self.system_bases: Tuple[Tuple[float, ...], ...] = compiled["system_bases"]
+        self.system_symbols: Tuple[Tuple[str, ...], ...] = compiled["system_symbols"]
+        self.categories: Tuple[str, ...] = compiled["categories"]
+        self.category_dimensions: Mapping[str, Dimension] = MappingProxyType(compiled["category_dimensions"])
+        # Símbolo (con prefijo ya expandido) -> (escala respecto al SI, dimensión)
+        self.units: Mapping[str, Tuple[float, Dimension]] = MappingProxyType(compiled["units"])
+        self.labels: Mapping[str, Tuple[str, ...]] = MappingProxyType(compiled["labels"])
+        self.scales: Mapping[str, Tuple[float, ...]] = MappingProxyType(compiled["scales"])
+        self.matrices: Mapping[str, Tuple[Tuple[float, ...], ...]] = MappingProxyType(compiled["matrices"])
+        # Tabla anidada categoría -> origen -> destino -> factor para la ruta escalar.
+        # Se usan diccionarios (no tuplas) para que un índice negativo o fuera de
+        # rango no seleccione por accidente otro factor.
+        self.factor_table: Mapping[str, Dict[int, Dict[int, float]]] = MappingProxyType({
+            category: {src: dict(enumerate(row)) for src, row in enumerate(matrix)}
+            for category, matrix in compiled["matrices"].items()
+        })
+        self.divisors: Mapping[str, Tuple[Tuple[float, ...], ...]] = MappingProxyType(compiled["divisors"])
+        # Misma tabla con pares (multiplicador, divisor): uno de los dos es 1.0, así
+        # que qty * m / d multiplica o divide igual que la cadena if/elif original.
+        self.operations: Mapping[str, Dict[int, Dict[int, Tuple[float, float]]]] = MappingProxyType({
+            category: {
+                src: {dst: ((1.0, divisor) if divisor != 1.0 else (factor, 1.0))
+                      for dst, (factor, divisor) in enumerate(zip(row, divisor_row))}
+                for src, (row, divisor_row) in enumerate(zip(matrix, compiled["divisors"][category]))
+            }
+            for category, matrix in compiled["matrices"].items()
+        })
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"UnitRegistry is read-only ({name!r})")
+        super().__setattr__(name, value)
+
+    def __repr__(self) -> str:
+        return f"UnitRegistry({len(self.categories)} categories, {len(self.systems)} systems, {self.digest})"
+
+
+def _exact_ratios(scales: Tuple[float, ...]):
+    """Cocientes exactos src/dst de las escalas, leídas por su repr decimal (1e-05 -> 1/100000).
+
+    fractions solo se importa al compilar el JSON, no en los arranques con caché.
+    """
+    from fractions import Fraction
+    exact = [Fraction(repr(scale)) for scale in scales]
+    return [[src / dst for dst in exact] for src in exact]
+
+
+def build_factor_matrix(scales: Tuple[float, ...]) -> Tuple[Tuple[float, ...], ...]:
+    """Devuelve la matriz de factores [src][dst] para las escalas dadas.
+
+    Cada factor es el cociente exacto redondeado una sola vez a float: 1/1e-5
+    da 100000.0 y no 99999.99999999999 como la división en binario.
+    """
+    return tuple(tuple(float(ratio) for ratio in row) for row in _exact_ratios(scales))
+
+
+def build_divisor_matrix(scales: Tuple[float, ...]) -> Tuple[Tuple[float, ...], ...]:
+    """Divisor [src][dst] cuando el factor es 1/n con n entero, 1.0 en otro caso.
+
+    qty / 1e5 y qty * 1e-5 no siempre coinciden en float; dividir por n es lo
+    que hacía la cadena if/elif original.
+    """
+    return tuple(
+        tuple(float(ratio.denominator) if ratio.numerator == 1 and ratio.denominator > 1 else 1.0
+              for ratio in row)
+        for row in _exact_ratios(scales)
+    )
+
+
+def _category_labels(category: str, spec: dict, systems, symbols, dimension) -> Tuple[str, ...]:
+    labels = spec.get("labels", {})
+    if isinstance(labels, list):
+        if len(labels) != len(systems):
+            raise ValueError(f"{category!r}: expected {len(systems)} labels")
+        return tuple(labels)
+    # Las etiquetas que falten se generan con los símbolos base del sistema
+    return tuple(
+        labels.get(name) or (format_dimension(dimension, system_symbols) if dimension else "?")
+        for name, system_symbols in zip(systems, symbols)
+    )
+
+
+def _category_scales(category: str, spec: dict, systems, bases, dimension) -> Tuple[float, ...]:
+    if "scales" in spec:
+        scales = tuple(float(scale) for scale in spec["scales"])
+        if len(scales) != len(systems):
+            raise ValueError(f"{category!r}: expected {len(systems)} scales")
+    else:
+        if dimension is None:
+            raise ValueError(f"{category!r}: needs 'dimension' or 'scales'")
+        overrides = spec.get("overrides", {})
+        unknown = set(overrides) - set(systems)
+        if unknown:
+            raise ValueError(f"{category!r}: overrides for unknown system(s) {', '.join(sorted(unknown))}")
+        scales = tuple(
+            float(overrides[name]) if name in overrides else scale_in_system(dimension, base)
+            for name, base in zip(systems, bases)
+        )
+    if any(scale <= 0.0 for scale in scales):
+        raise ValueError(f"{category!r}: scales must be positive")
+    return scales
+
+
+def _compile_units(definition: dict, dimensions: Tuple[str, ...]) -> Dict[str, Tuple[float, Dimension]]:
+    prefixes = definition.get("prefixes", {})
+    units: Dict[str, Tuple[float, Dimension]] = {}
+    prefixed: Dict[str, Tuple[float, Dimension]] = {}
+    for symbol, spec in definition.get("units", {}).items():
+        scale = float(spec["scale"])
+        if scale <= 0.0:
+            raise ValueError(f"Unit {symbol!r}: scale must be positive")
+        dimension = dimension_vector(spec.get("dimension", {}), dimensions)
+        units[symbol] = (scale, dimension)
+        if spec.get("prefixes"):
+            for prefix, factor in prefixes.items():
+                prefixed.setdefault(prefix + symbol, (float(f"{scale * factor:.15g}"), dimension))
+    # Los símbolos definidos explícitamente tienen prioridad sobre los prefijados
+    for symbol, unit in prefixed.items():
+        units.setdefault(symbol, unit)
+    return units
+
+
+def compile_definition(definition: dict, digest: str = "") -> dict:
+    """Valida la definición JSON y la convierte al formato compilado."""
+    try:
+        system_specs = definition["systems"]
+        categories = definition["categories"]
+    except (KeyError, TypeError):
+        raise ValueError("Unit registry needs 'systems' and 'categories'") from None
+    if not system_specs:
+        raise ValueError("Unit registry defines no systems")
+    dimensions = tuple(definition.get("dimensions", BASE_DIMENSIONS))
+
+    systems = tuple(system["name"] for system in system_specs)
+    bases = tuple(dimension_vector(system.get("base", {}), dimensions) for system in system_specs)
+    # Una dimensión sin escala en el sistema vale 1 (misma unidad que el SI)
+    bases = tuple(tuple(scale or 1.0 for scale in base) for base in bases)
+    symbols = tuple(
+        tuple(system.get("symbols", {}).get(name, name) for name in dimensions)
+        for system in system_specs
+    )
+
+    category_dimensions, labels, scales, matrices, divisors = {}, {}, {}, {}, {}
+    for category, spec in categories.items():
+        dimension = dimension_vector(spec["dimension"], dimensions) if "dimension" in spec else None
+        if dimension is not None:
+            category_dimensions[category] = dimension
+        labels[category] = _category_labels(category, spec, systems, symbols, dimension)
+        scales[category] = _category_scales(category, spec, systems, bases, dimension)
+        matrices[category] = build_factor_matrix(scales[category])
+        divisors[category] = build_divisor_matrix(scales[category])
+
+    return {
+        "format": COMPILED_FORMAT,
+        "digest": digest,
+        "dimensions": dimensions,
+        "systems": systems,
+        "system_names": tuple(system.get("display", system["name"]) for system in system_specs),
+        "system_bases": bases,
+        "system_symbols": symbols,
+        "categories": tuple(categories),
+        "category_dimensions": category_dimensions,
+        "labels": labels,
+        "scales": scales,
+        "matrices": matrices,
+        "divisors": divisors,
+        "units": _compile_units(definition, dimensions),
+    }
+
+
+def _cache_path(path: str, digest: str) -> str:
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), "__pycache__")
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(directory, f"{name}.{digest}.marshal")
+
+
+def _read_cache(cache_path: str) -> Optional[dict]:
+    try:
+        with open(cache_path, "rb") as f:
+            compiled = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(compiled, dict) or compiled.get("format") != COMPILED_FORMAT:
+        return None
+    return compiled
+
+
+def _write_cache(cache_path: str, compiled: dict):
+    # Escritura atómica; si el directorio no es escribible se sigue sin caché
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump(compiled, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return
+    # Borrar los compilados de versiones anteriores del mismo fichero
+    directory = os.path.dirname(cache_path)
+    prefix = os.path.basename(cache_path).split(".", 1)[0] + "."
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name.endswith(".marshal") and name != os.path.basename(cache_path):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+def load_registry(path: str = REGISTRY_PATH, use_cache: bool = True) -> UnitRegistry:
+    """Carga el registro, usando la versión compilada en caché si el JSON no ha cambiado."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    # zlib en vez de hashlib/json: su importación es casi gratuita y así la
+    # ruta con caché no paga la carga de OpenSSL ni del módulo re
+    digest = f"{zlib.crc32(raw):08x}{len(raw):x}"
+    cache_path = _cache_path(path, digest)
+
+    compiled = _read_cache(cache_path) if use_cache else None
+    if compiled is None:
+        import json
+        compiled = compile_definition(json.loads(raw.decode("utf-8")), digest)
+        if use_cache:
+            _write_cache(cache_path, compiled)
+    return UnitRegistry(compiled)
+
+
+REGISTRY: UnitRegistry = load_registry()
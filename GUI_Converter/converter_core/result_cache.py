@@ -0,0 +1,117 @@
+"""Caché LRU de resultados para las consultas repetidas de la interfaz.
+
+Al alternar el sistema de origen o volver a escribir un valor se repetía
+toda la cadena (conversión de cada fila + formato). ResultCache guarda, por
+(categoría, sistema de origen, valor normalizado), los valores de todas las
+filas de destino y sus textos en punto fijo y en notación científica.
+
+El valor normalizado es el float leído (así '1,5' y '1.50' comparten
+entrada) o, en el modo exacto, el texto que devuelve NumberParser.normalize;
+un float y un str nunca coinciden como clave, de modo que ambos modos
+conviven en la misma caché.
+
+Los textos dependen del formateador: cada consulta compara su
+(locale_version, decimales) con los de la última y, si han cambiado, vacía
+la caché antes de responder. El registro de unidades es inmutable durante
+la ejecución, así que no forma parte de esa comprobación.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from .formatting import NumberFormatter
+
+
+class CachedResult:
+    """Fila completa de resultados: valores y sus dos textos por destino."""
+
+    __slots__ = ("values", "fixed", "scientific")
+
+    def __init__(self, values: Tuple[float, ...], fixed: Tuple[str, ...], scientific: Tuple[str, ...]):
+        self.values = values
+        self.fixed = fixed
+        self.scientific = scientific
+
+
+class ResultCache:
+    """LRU acotada de CachedResult con contadores de aciertos y fallos."""
+
+    DEFAULT_CAPACITY = 256
+
+    def __init__(self, formatter: NumberFormatter, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.formatter = formatter
+        self.capacity = capacity
+        self._entries: "OrderedDict[Tuple, CachedResult]" = OrderedDict()
+        self._generation = self._current_generation()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _current_generation(self) -> Tuple:
+        formatter = self.formatter
+        return (formatter.locale_version, formatter.decimals, formatter.sci_digits)
+
+    def _check_generation(self):
+        generation = self._current_generation()
+        if generation != self._generation:
+            self._generation = generation
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+
+    def get(self, category: str, src_idx: int, value: Hashable) -> Optional[CachedResult]:
+        self._check_generation()
+        key = (category, src_idx, value)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, category: str, src_idx: int, value: Hashable, values: Sequence[float],
+            fixed: Optional[Sequence[str]] = None,
+            scientific: Optional[Sequence[str]] = None) -> CachedResult:
+        """Guarda una fila; los textos que falten se formatean con el formateador."""
+        self._check_generation()
+        if fixed is None:
+            fixed = [self.formatter.fixed(result) for result in values]
+        if scientific is None:
+            scientific = [self.formatter.scientific(result) for result in values]
+        entry = CachedResult(tuple(values), tuple(fixed), tuple(scientific))
+        key = (category, src_idx, value)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def lookup(self, category: str, src_idx: int, value: Hashable,
+               compute: Callable[[], Sequence[float]]) -> CachedResult:
+        """Entrada en caché o, si no está, la calculada con `compute()` (y guardada)."""
+        entry = self.get(category, src_idx, value)
+        if entry is None:
+            entry = self.put(category, src_idx, value, compute())
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate,
+            "evictions": self.evictions, "invalidations": self.invalidations,
+            "size": len(self._entries), "capacity": self.capacity,
+        }
@@ -0,0 +1,255 @@
+"""Canal de conversión en memoria compartida para procesos del mismo nodo.
+
+Un proceso conversor y un cliente comparten un segmento de
+multiprocessing.shared_memory dividido en ranuras. El cliente escribe los
+float64 directamente en la ranura, publica una cabecera pequeña (categoría,
+sistema de origen y de destino, número de valores) y el conversor multiplica
+el bloque in situ. Los datos nunca se copian ni se serializan con pickle:
+solo viajan el índice de la ranura y las señales de los semáforos.
+
+Disposición del segmento (todo alineado a 64 bytes):
+    control   indicador de parada + anillo de envíos (un uint32 por ranura)
+    ranuras   por cada una: cabecera (estado, categoría, src, dst, n) + datos
+
+    with SharedMemoryChannel() as channel:
+        slot = channel.acquire()
+        block = channel.values(slot, n)      # vista de NumPy (o memoryview 'd')
+        block[:] = datos
+        channel.submit(slot, "Density", 0, 2, n)
+        channel.wait(slot)                   # `block` ya contiene el resultado
+        channel.release(slot)
+
+Las ranuras las reparte un único proceso cliente (puede usarse desde varios
+hilos). NumPy es opcional: sin él el conversor recorre el bloque con un
+memoryview, más lento pero igualmente sin copias.
+"""
+import multiprocessing
+import struct
+import threading
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+from .engine import FACTOR_MATRICES
+from .registry import REGISTRY
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_SLOTS = 8
+# Valores float64 por ranura (8 MiB)
+DEFAULT_SLOT_VALUES = 1 << 20
+
+_ALIGN = 64
+# Estado, categoría, sistema de origen, sistema de destino, número de valores
+_SLOT_HEADER = struct.Struct("<iIIIQ")
+_CONTROL = struct.Struct("<I")
+_RING_ENTRY = struct.Struct("<I")
+
+FREE, SUBMITTED, DONE, FAILED = range(4)
+
+# Las categorías viajan como índice en este orden (el mismo en ambos procesos)
+CATEGORIES = tuple(FACTOR_MATRICES)
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class _Layout:
+    """Desplazamientos dentro del segmento para `slots` ranuras de `slot_values` valores."""
+
+    def __init__(self, slots: int, slot_values: int):
+        self.slots = slots
+        self.slot_values = slot_values
+        self.ring_offset = _CONTROL.size
+        self.slots_offset = _aligned(self.ring_offset + slots * _RING_ENTRY.size)
+        self.slot_size = _aligned(_SLOT_HEADER.size) + _aligned(slot_values * 8)
+        self.size = self.slots_offset + slots * self.slot_size
+
+    def header(self, slot: int) -> int:
+        return self.slots_offset + slot * self.slot_size
+
+    def data(self, slot: int) -> int:
+        return self.header(slot) + _aligned(_SLOT_HEADER.size)
+
+
+def _scale_in_place(buf, offset: int, count: int, multiplier: float, divisor: float):
+    """valor * multiplicador / divisor sobre la ranura, como engine.convert."""
+    if np is not None:
+        block = np.frombuffer(buf, dtype=np.float64, count=count, offset=offset)
+        block *= multiplier
+        if divisor != 1.0:
+            block /= divisor
+        return
+    view = buf[offset:offset + count * 8].cast("d")
+    try:
+        for i in range(count):
+            view[i] = view[i] * multiplier / divisor
+    finally:
+        view.release()
+
+
+def _converter_loop(name: str, slots: int, slot_values: int, ready, done: List):
+    """Proceso conversor: atiende las ranuras en el orden del anillo de envíos."""
+    shm = shared_memory.SharedMemory(name=name)
+    layout = _Layout(slots, slot_values)
+    buf = shm.buf
+    tail = 0
+    try:
+        while True:
+            ready.acquire()
+            if _CONTROL.unpack_from(buf, 0)[0]:
+                return
+            slot = _RING_ENTRY.unpack_from(buf, layout.ring_offset + (tail % slots) * _RING_ENTRY.size)[0]
+            tail += 1
+            header = layout.header(slot)
+            _state, category, src, dst, count = _SLOT_HEADER.unpack_from(buf, header)
+            state = DONE
+            try:
+                operations = REGISTRY.operations[CATEGORIES[category]]
+                if count > slot_values:
+                    raise ValueError
+                multiplier, divisor = operations[src][dst]
+                _scale_in_place(buf, layout.data(slot), count, multiplier, divisor)
+            except (IndexError, KeyError, ValueError):
+                state = FAILED
+            _SLOT_HEADER.pack_into(buf, header, state, category, src, dst, count)
+            done[slot].release()
+    finally:
+        del buf
+        shm.close()
+
+
+class SharedMemoryChannel:
+    """Segmento compartido + proceso conversor; se usa como gestor de contexto."""
+
+    def __init__(self, slots: int = DEFAULT_SLOTS, slot_values: int = DEFAULT_SLOT_VALUES,
+                 context=None):
+        if slots < 1 or slot_values < 1:
+            raise ValueError("slots and slot_values must be positive")
+        self.layout = _Layout(slots, slot_values)
+        self._context = context or multiprocessing.get_context()
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._process = None
+        self._ready = self._context.Semaphore(0)
+        self._done = [self._context.Semaphore(0) for _ in range(slots)]
+        self._free_slots = list(range(slots - 1, -1, -1))
+        self._free = threading.Semaphore(slots)
+        self._lock = threading.Lock()
+        self._head = 0
+
+    @property
+    def slots(self) -> int:
+        return self.layout.slots
+
+    @property
+    def slot_values(self) -> int:
+        return self.layout.slot_values
+
+    def start(self) -> "SharedMemoryChannel":
+        self._shm = shared_memory.SharedMemory(create=True, size=self.layout.size)
+        _CONTROL.pack_into(self._shm.buf, 0, 0)
+        self._process = self._context.Process(
+            target=_converter_loop, daemon=True,
+            args=(self._shm.name, self.layout.slots, self.layout.slot_values, self._ready, self._done))
+        self._process.start()
+        return self
+
+    def close(self):
+        if self._process is not None:
+            _CONTROL.pack_into(self._shm.buf, 0, 1)
+            self._ready.release()
+            self._process.join()
+            self._process = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                # Aún hay vistas del cliente vivas; el mapeo se libera con ellas
+                pass
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedMemoryChannel":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def acquire(self, timeout: Optional[float] = None) -> int:
+        """Reserva una ranura libre (bloquea si están todas en uso)."""
+        if not self._free.acquire(timeout=timeout):
+            raise TimeoutError("No free slot in the shared-memory channel")
+        with self._lock:
+            return self._free_slots.pop()
+
+    def release(self, slot: int):
+        with self._lock:
+            self._free_slots.append(slot)
+        self._free.release()
+
+    def values(self, slot: int, count: Optional[int] = None):
+        """Vista de escritura sobre los datos de la ranura (sin copia)."""
+        count = self.layout.slot_values if count is None else count
+        if not 0 <= count <= self.layout.slot_values:
+            raise ValueError(f"count must be between 0 and {self.layout.slot_values}")
+        offset = self.layout.data(slot)
+        if np is not None:
+            return np.frombuffer(self._shm.buf, dtype=np.float64, count=count, offset=offset)
+        return self._shm.buf[offset:offset + count * 8].cast("d")
+
+    def submit(self, slot: int, category: str, src_idx: int, dst_idx: int, count: int):
+        """Publica la cabecera de la ranura y avisa al conversor."""
+        try:
+            category_id = CATEGORIES.index(category)
+        except ValueError:
+            raise ValueError(f"Unknown category: {category!r}") from None
+        n = len(FACTOR_MATRICES[category])
+        if not (0 <= src_idx < n and 0 <= dst_idx < n):
+            raise ValueError(f"System index out of range (0..{n - 1})")
+        if not 0 <= count <= self.layout.slot_values:
+            raise ValueError(f"count must be between 0 and {self.layout.slot_values}")
+        buf = self._shm.buf
+        _SLOT_HEADER.pack_into(buf, self.layout.header(slot), SUBMITTED, category_id, src_idx, dst_idx, count)
+        with self._lock:
+            position = self.layout.ring_offset + (self._head % self.layout.slots) * _RING_ENTRY.size
+            _RING_ENTRY.pack_into(buf, position, slot)
+            self._head += 1
+            self._ready.release()
+
+    def wait(self, slot: int, timeout: Optional[float] = None):
+        """Espera a que el conversor termine la ranura; ValueError si la rechazó."""
+        if not self._done[slot].acquire(timeout=timeout):
+            raise TimeoutError(f"Slot {slot} was not converted in time")
+        state = _SLOT_HEADER.unpack_from(self._shm.buf, self.layout.header(slot))[0]
+        if state != DONE:
+            raise ValueError(f"Slot {slot} was rejected by the converter process")
+
+    def convert(self, category: str, src_idx: int, dst_idx: int, values) -> List[float]:
+        """Atajo que copia `values` a una ranura y devuelve el resultado como lista.
+
+        Útil para pruebas; para evitar copias, escribir en `values()` directamente.
+        """
+        slot = self.acquire()
+        try:
+            count = len(values)
+            block = self.values(slot, count)
+            try:
+                block[:] = values if np is not None else memoryview(_as_doubles(values))
+                self.submit(slot, category, src_idx, dst_idx, count)
+                self.wait(slot)
+                return block.tolist()
+            finally:
+                if np is None:
+                    block.release()
+                del block
+        finally:
+            self.release(slot)
+
+
+def _as_doubles(values) -> array:
+    return values if isinstance(values, array) and values.typecode == "d" else array("d", values)
@@ -0,0 +1,19 @@
+from typing import Dict, List
+
+from .registry import REGISTRY
+
+# TABLAS DE UNIDADES
+#
+# Vistas en forma de listas del registro (units.json), con la forma que
+# esperan la interfaz y la línea de comandos.
+
+CATEGORY_UNITS: Dict[str, List[str]] = {
+    category: list(REGISTRY.systems) for category in REGISTRY.categories
+}
+
+UNIT_LABELS: Dict[str, List[str]] = {
+    category: list(REGISTRY.labels[category]) for category in REGISTRY.categories
+}
+
+# Nombres de los sistemas tal como se muestran en la tabla de resultados.
+UNIT_SYSTEM_NAMES: List[str] = list(REGISTRY.system_names)
@@ -0,0 +1,244 @@
+"""Analizador de expresiones de unidades con la notación de la interfaz.
+
+Acepta expresiones como 'kN/cm²', 'W/(m²·K⁴)', 'N·s/mm²', 'kg*m^-3' o
+'1/K': símbolos del registro (con prefijos SI), '·', '⋅', '*' o un espacio
+para multiplicar, '/' para dividir (asociativo por la izquierda, como en
+'N·s/mm²'), paréntesis y exponentes en superíndice o con '^' / '**'.
+
+Cada expresión se compila una vez a un UnitExpression (escala respecto al
+SI y vector de dimensiones) y queda en una LRU indexada por el texto. Los
+factores entre dos expresiones también se memorizan, de modo que convertir
+'kN/cm²' → 'MPa' en un bucle cuesta una búsqueda en un diccionario tras la
+primera llamada. Solo hay unidades multiplicativas (K, no °C).
+
+Los exponentes de dimensión se acumulan como Fraction ('m^0.1·m^0.2' y
+'m^0.3' tienen la misma dimensión) y cualquier fallo aritmético (exponente
+mal escrito, desbordamiento, escala nula o infinita) sale como UnitError.
+"""
+import math
+from fractions import Fraction
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .dimensions import Dimension, format_dimension
+from .registry import REGISTRY
+
+UNIT_CACHE_SIZE = 1024
+
+_SUPERSCRIPT_DIGITS = {"⁰": "0", "¹": "1", "²": "2", "³": "3", "⁴": "4", "⁵": "5",
+                       "⁶": "6", "⁷": "7", "⁸": "8", "⁹": "9", "⁻": "-"}
+_MULTIPLY = {"·", "⋅", "*", "×"}
+
+
+class UnitError(ValueError):
+    """Expresión de unidades no válida o conversión entre dimensiones distintas."""
+
+
+class UnitExpression:
+    """Expresión compilada: valor_SI = valor * scale."""
+
+    __slots__ = ("text", "scale", "dimension")
+
+    def __init__(self, text: str, scale: float, dimension: Dimension):
+        self.text = text
+        self.scale = scale
+        self.dimension = dimension
+
+    def __repr__(self) -> str:
+        si = format_dimension(self.dimension, REGISTRY.system_symbols[0])
+        return f"UnitExpression({self.text!r}, {self.scale!r} {si})"
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    """Lista de (tipo, texto): name, number, power, '*', '/', '(', ')', 'space'."""
+    tokens = []
+    i, n = 0, len(text)
+    while i < n:
+        ch = text[i]
+        if ch.isspace():
+            while i < n and text[i].isspace():
+                i += 1
+            tokens.append(("space", " "))
+        elif ch in _SUPERSCRIPT_DIGITS:
+            start = i
+            while i < n and text[i] in _SUPERSCRIPT_DIGITS:
+                i += 1
+            tokens.append(("power", "".join(_SUPERSCRIPT_DIGITS[c] for c in text[start:i])))
+        elif ch == "^" or text.startswith("**", i):
+            i += 1 if ch == "^" else 2
+            start = i
+            if i < n and text[i] in "+-":
+                i += 1
+            while i < n and (text[i].isdigit() or text[i] == "."):
+                i += 1
+            if i == start or text[start:i] in "+-":
+                raise UnitError(f"Missing exponent at position {start} in {text!r}")
+            tokens.append(("power", text[start:i]))
+        elif ch in _MULTIPLY:
+            tokens.append(("*", ch))
+            i += 1
+        elif ch in "/()":
+            tokens.append((ch, ch))
+            i += 1
+        elif ch.isdigit() or ch == ".":
+            start = i
+            while i < n and (text[i].isdigit() or text[i] in ".eE" or
+                             (text[i] in "+-" and text[i - 1] in "eE")):
+                i += 1
+            tokens.append(("number", text[start:i]))
+        elif ch.isalpha() or ch in "µμΩ°":
+            start = i
+            while i < n and (text[i].isalpha() or text[i] in "µμΩ°"):
+                i += 1
+            tokens.append(("name", text[start:i]))
+        else:
+            raise UnitError(f"Unexpected {ch!r} at position {i} in {text!r}")
+    # Los espacios solo cuentan como producto entre dos operandos
+    cleaned = []
+    for k, token in enumerate(tokens):
+        if token[0] == "space":
+            prev = cleaned[-1][0] if cleaned else None
+            nxt = tokens[k + 1][0] if k + 1 < len(tokens) else None
+            if prev in ("name", "number", "power", ")") and nxt in ("name", "number", "("):
+                cleaned.append(("*", " "))
+            continue
+        cleaned.append(token)
+    return cleaned
+
+
+def _exponents(dimension: Dimension) -> Tuple[Fraction, ...]:
+    return tuple(Fraction(repr(d)) for d in dimension)
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.dims = len(REGISTRY.dimensions)
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Tuple[float, Tuple[Fraction, ...]]:
+        if not self.tokens:
+            raise UnitError("Empty unit expression")
+        result = self._product()
+        if self.pos != len(self.tokens):
+            raise UnitError(f"Unexpected {self.tokens[self.pos][1]!r} in {self.text!r}")
+        return result
+
+    def _product(self) -> Tuple[float, Tuple[Fraction, ...]]:
+        scale, dimension = self._power()
+        while True:
+            kind = self._peek()
+            if kind == "*":
+                self._next()
+                other_scale, other_dim = self._power()
+                scale *= other_scale
+                dimension = tuple(a + b for a, b in zip(dimension, other_dim))
+            elif kind == "/":
+                self._next()
+                other_scale, other_dim = self._power()
+                scale /= other_scale
+                dimension = tuple(a - b for a, b in zip(dimension, other_dim))
+            elif kind in ("name", "("):
+                # Producto implícito, p. ej. 'N m' tras quitar espacios de más
+                other_scale, other_dim = self._power()
+                scale *= other_scale
+                dimension = tuple(a + b for a, b in zip(dimension, other_dim))
+            else:
+                return scale, dimension
+
+    def _power(self) -> Tuple[float, Tuple[Fraction, ...]]:
+        scale, dimension = self._atom()
+        if self._peek() == "power":
+            text = self._next()[1]
+            try:
+                exponent = Fraction(text)
+            except ValueError:
+                raise UnitError(f"Invalid exponent {text!r} in {self.text!r}") from None
+            scale **= float(exponent)
+            dimension = tuple(d * exponent for d in dimension)
+        return scale, dimension
+
+    def _atom(self) -> Tuple[float, Tuple[Fraction, ...]]:
+        if self._peek() is None:
+            raise UnitError(f"Unexpected end of {self.text!r}")
+        kind, value = self._next()
+        if kind == "name":
+            try:
+                scale, dimension = REGISTRY.units[value]
+            except KeyError:
+                raise UnitError(f"Unknown unit {value!r} in {self.text!r}") from None
+            return scale, _exponents(dimension)
+        if kind == "number":
+            try:
+                number = float(value)
+            except ValueError:
+                raise UnitError(f"Invalid number {value!r} in {self.text!r}") from None
+            if number == 0 or not math.isfinite(number):
+                raise UnitError(f"Invalid number {value!r} in {self.text!r}")
+            return number, (Fraction(0),) * self.dims
+        if kind == "(":
+            result = self._product()
+            if self._peek() != ")":
+                raise UnitError(f"Missing ')' in {self.text!r}")
+            self._next()
+            return result
+        raise UnitError(f"Unexpected {value!r} in {self.text!r}")
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def parse_unit(text: str) -> UnitExpression:
+    """Compila una expresión de unidades (memorizada por texto)."""
+    try:
+        scale, dimension = _Parser(text.strip()).parse()
+    except (OverflowError, ZeroDivisionError):
+        scale = math.inf
+    if scale == 0 or not math.isfinite(scale):
+        raise UnitError(f"Scale of {text!r} out of range")
+    # Redondeo como en dimensions.scale_in_system: (1e-2)**-2 -> 1e4 exacto
+    return UnitExpression(text, float(f"{scale:.15g}"), tuple(float(d) for d in dimension))
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def unit_factor(src: str, dst: str) -> float:
+    """Factor multiplicativo de `src` a `dst`; UnitError si las dimensiones difieren."""
+    source, target = parse_unit(src), parse_unit(dst)
+    if source.dimension != target.dimension:
+        symbols = REGISTRY.system_symbols[0]
+        raise UnitError(f"Cannot convert {src!r} ({format_dimension(source.dimension, symbols)}) "
+                        f"to {dst!r} ({format_dimension(target.dimension, symbols)})")
+    factor = source.scale / target.scale
+    if factor == 0 or not math.isfinite(factor):
+        raise UnitError(f"Factor from {src!r} to {dst!r} out of range")
+    return float(f"{factor:.15g}")
+
+
+def convert_units(value: float, src: str, dst: str) -> float:
+    """Convierte `value` de la expresión `src` a la expresión `dst`."""
+    return value * unit_factor(src, dst)
+
+
+def category_for(text: str) -> Optional[str]:
+    """Primera categoría del registro con la misma dimensión que la expresión."""
+    dimension = parse_unit(text).dimension
+    for category, category_dimension in REGISTRY.category_dimensions.items():
+        if category_dimension == dimension:
+            return category
+    return None
+
+
+def clear_caches():
+    parse_unit.cache_clear()
+    unit_factor.cache_clear()
+
+
+def cache_info() -> dict:
+    return {"parse": parse_unit.cache_info()._asdict(), "factor": unit_factor.cache_info()._asdict()}
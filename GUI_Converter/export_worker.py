@@ -0,0 +1,114 @@
+import os
+import threading
+from typing import Callable, Iterable, Sequence
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from converter_core.export import ExportCancelled, export_rows
+
+
+def with_export_extension(file_name: str, selected_filter: str) -> str:
+    """Añade la extensión del filtro elegido en QFileDialog si el nombre no trae ninguna."""
+    if os.path.splitext(file_name)[1] or "*." not in selected_filter:
+        return file_name
+    return file_name + selected_filter.split("*", 1)[1].split(")", 1)[0]
+
+
+class _ExportSignals(QObject):
+    progress = Signal(int, int)     # id del trabajo, filas escritas
+    finished = Signal(int, int)     # id del trabajo, total de filas
+    failed = Signal(int, str)       # id del trabajo, mensaje
+    done = Signal(int)              # id del trabajo; siempre, también si se cancela
+
+
+class ExportJob(QRunnable):
+    """Escribe una exportación fuera del hilo de la interfaz.
+
+    `rows_factory` se llama ya en el hilo del trabajador, de modo que el
+    generador de filas (p. ej. una conexión SQLite propia) vive en ese hilo.
+    """
+
+    def __init__(self, job_id: int, rows_factory: Callable[[], Iterable[Sequence]], path: str,
+                 fields: Sequence[str], fmt: str, signals: _ExportSignals):
+        super().__init__()
+        self.job_id = job_id
+        self.rows_factory = rows_factory
+        self.path = path
+        self.fields = fields
+        self.fmt = fmt
+        self.signals = signals
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            total = export_rows(self.rows_factory(), self.path, self.fields, self.fmt,
+                                progress=lambda rows: self.signals.progress.emit(self.job_id, rows),
+                                cancelled=self.cancelled.is_set)
+            self.signals.finished.emit(self.job_id, total)
+        except ExportCancelled:
+            pass
+        except Exception as e:
+            self.signals.failed.emit(self.job_id, str(e))
+        finally:
+            self.signals.done.emit(self.job_id)
+
+
+class BackgroundExporter(QObject):
+    """Ejecuta exportaciones de una en una en un hilo aparte."""
+
+    exportStarted = Signal(str)             # ruta
+    progressChanged = Signal(int)           # filas escritas
+    exportFinished = Signal(str, int)       # ruta, filas
+    exportFailed = Signal(str, str)         # ruta, mensaje
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _ExportSignals(self)
+        self._signals.progress.connect(self._on_progress)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._signals.done.connect(self._on_done)
+        self._next_id = 0
+        # Trabajos en curso; se conservan hasta que terminan (ver BackgroundConverter)
+        self._running = {}
+
+    def submit(self, rows_factory: Callable[[], Iterable[Sequence]], path: str,
+               fields: Sequence[str], fmt: str) -> int:
+        self._next_id += 1
+        job = ExportJob(self._next_id, rows_factory, path, fields, fmt, self._signals)
+        job.setAutoDelete(False)
+        self._running[job.job_id] = job
+        self.exportStarted.emit(path)
+        self._pool.start(job)
+        return job.job_id
+
+    def cancel_all(self):
+        for job in self._running.values():
+            job.cancel()
+
+    def is_busy(self) -> bool:
+        return bool(self._running)
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def _on_progress(self, job_id: int, rows: int):
+        self.progressChanged.emit(rows)
+
+    def _on_finished(self, job_id: int, total: int):
+        job = self._running.get(job_id)
+        if job is not None:
+            self.exportFinished.emit(job.path, total)
+
+    def _on_failed(self, job_id: int, message: str):
+        job = self._running.get(job_id)
+        if job is not None:
+            self.exportFailed.emit(job.path, message)
+
+    def _on_done(self, job_id: int):
+        self._running.pop(job_id, None)
@@ -1,68 +1,85 @@
-import ctypes
 import os
 import sys
 from typing import Dict, List
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QHBoxLayout, QListWidget, QComboBox,
-    QLabel, QPushButton, QLineEdit, QTableWidget,
-    QTableWidgetItem, QAbstractItemView, QSizePolicy,
-    QHeaderView, QFileDialog, QMessageBox
+    QHBoxLayout, QListView, QComboBox,
+    QLabel, QPushButton, QLineEdit, QTableView,
+    QAbstractItemView, QSizePolicy,
+    QHeaderView, QFileDialog, QMessageBox, QCheckBox
 )
-from PySide6.QtCore import Qt, QRegularExpression, QLocale, QEvent, QModelIndex, QSize
-from PySide6.QtGui import QRegularExpressionValidator, QIcon
+from PySide6.QtCore import (
+    Qt, QLocale, QEvent, QModelIndex, QSize, QStandardPaths, QTimer, Signal,
+)
+from PySide6.QtGui import QIcon, QKeySequence, QShortcut
+
+from conversion_scheduler import ConversionScheduler
+from number_validator import NumberValidator
+from results_model import ResultsTableModel, UnitDelegate
+from converter_core import (
+    CATEGORY_UNITS, UNIT_LABELS, UNIT_SYSTEM_NAMES, NumberFormatter,
+    convert_to_html_unit, placeholder_convert,
+)
+from converter_core.history import HistoryRecord, HistoryStore
+from converter_core.instrumentation import PROFILER
+from converter_core.parsing import NumberParser
+from converter_core.result_cache import ResultCache
 
-class UnitConverterUI(QMainWindow):
+# Los iconos se buscan junto al módulo, no en una ruta absoluta de Windows
+ICONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
 
-    #DATOS DE UNIDADES Y CONVERSIÓN
-
-    UNIT_LABELS: Dict[str, List[str]] = {
-        "Force": ["N", "N", "dyn"],
-        "Pressure": ["Pa", "N/mm²", "dyn/cm²"],
-        "Density": ["kg/m³", "kg/mm³", "g/cm³"],
-        "Thermal Conductivity": ["W/(m·K)", "N·mm/(s·K)", "g·cm/(s³·K)"],
-        "Specific heat": ["J/(kg·K)", "mm²/(s²·K)", "cm²/(s²·K)"],
-        "Young’s Modulus": ["Pa", "N/mm²", "dyn/cm²"],
-        "Film Coefficient": ["W/(m²·K)", "N/(m·m·s·K)", "g/(s³·K)"],
-        "Dynamic Viscosity": ["Pa·s", "N·s/mm²", "Poise"],
-        "Elastic": ["Pa", "N/mm²", "dyn/cm²"],
-        "Expansion": ["1/K", "1/K", "1/K"],
-        "Stefan Boltzmann": ["W/(m²·K⁴)", "N/(mm·s·K⁴)", "erg/(cm²·s·K⁴)"],
-    }
-
-    CATEGORY_UNITS: Dict[str, List[str]] = {
-        "Force": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Pressure": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Density": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Thermal Conductivity": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Specific heat": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Young’s Modulus": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Film Coefficient": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Dynamic Viscosity": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Elastic": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-        "Expansion": ["1/K", "1/K", "1/K"],
-        "Stefan Boltzmann": ["m,kg,s,K", "mm,N,s,K", "cm,g,s,K"],
-    }
-
-    @staticmethod
-    def convert_to_html_unit(unit_str: str) -> str:
-        """Convierte un string de unidad con superíndices a HTML."""
-        unit_str = unit_str.replace("²", "<sup>2</sup>")
-        unit_str = unit_str.replace("³", "<sup>3</sup>")
-        unit_str = unit_str.replace("⁴", "<sup>4</sup>")
-        unit_str = unit_str.replace("·", "⋅")
-        unit_str = unit_str.replace("K⁴", "K<sup>4</sup>")
-        return unit_str
+class UnitConverterUI(QMainWindow):
+    """Ventana principal.
+
+    Para que la ventana aparezca cuanto antes, __init__ solo construye lo que
+    se ve en el primer pintado. El historial (lista, filtro y base de datos),
+    los iconos y el exportador se crean en _finish_startup, que se programa
+    tras el primer paintEvent; los métodos que los usan antes de tiempo los
+    construyen al vuelo con _ensure_history_panel / _ensure_exporter.
+    """
+
+    # Primer pintado de la ventana y fin de la inicialización diferida
+    firstPainted = Signal()
+    startupFinished = Signal()
+
+    #DATOS DE UNIDADES Y CONVERSIÓN (compartidos con converter_core)
+
+    UNIT_LABELS: Dict[str, List[str]] = UNIT_LABELS
+    CATEGORY_UNITS: Dict[str, List[str]] = CATEGORY_UNITS
+
+    convert_to_html_unit = staticmethod(convert_to_html_unit)
+
+    # Retardo (ms) del antirrebote de conversiones; 0 = una por turno del bucle de eventos
+    CONVERSION_DELAY_MS = 0
+    MAX_DECIMALS = 12
+    # Cifras significativas del modo exacto (factores Fraction, sin round())
+    SIGNIFICANT_DIGITS = 15
+    # Entradas de la caché de resultados (categoría, sistema de origen, valor)
+    RESULT_CACHE_CAPACITY = ResultCache.DEFAULT_CAPACITY
+    # Máximo de entradas del historial; al superarlo se descartan las más antiguas
+    HISTORY_CAPACITY = HistoryStore.DEFAULT_CAPACITY
+    HISTORY_DB_NAME = "history.sqlite3"
+    # Antirrebote del filtro del historial y espera antes de escribir altas pendientes
+    HISTORY_FILTER_DELAY_MS = 200
+    HISTORY_FLUSH_DELAY_MS = 2000
+    EXPORT_FILTERS = "CSV (*.csv);;JSON Lines (*.jsonl);;NumPy columnar (*.npz)"
+    # Etapas que muestra la barra de estado con GUI_CONVERTER_PROFILE activo
+    PROFILE_STAGES = ("parse", "convert", "table_update", "format", "paint", "conversion")
+    PROFILE_DUMP_PATH = "conversion_profile.json"
 
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Conversor de Unidades Físicas")
 
         self.setGeometry(100, 100, 1000, 750)
-        self.setWindowIcon(QIcon(r"C:\GUI_Converter\icons\Convert.ico"))
+        self._startup_scheduled = False
+        self.history_model = None
+        self.list_history = None
+        self.exporter = None
 
         if os.name == 'nt':
             try:
+                import ctypes
                 myappid = 'GUI_Converter.icons.Convert.ico'
                 ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
             except Exception as e:
@@ -72,6 +89,15 @@ class UnitConverterUI(QMainWindow):
         self.setMaximumHeight(750)
         self.setMinimumWidth(800)
 
+        # Formateador con los separadores de la localización en caché
+        locale = QLocale.system()
+        self.number_formatter = NumberFormatter(
+            locale.decimalPoint(), locale.groupSeparator(), decimals=self.MAX_DECIMALS)
+        # Validación y lectura del valor en una sola pasada, con los mismos separadores
+        self.number_parser = NumberParser(locale.decimalPoint(), locale.groupSeparator())
+        # Filas ya convertidas y formateadas; se vacía sola si cambia la localización
+        self.result_cache = ResultCache(self.number_formatter, capacity=self.RESULT_CACHE_CAPACITY)
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QHBoxLayout(central_widget)
@@ -86,8 +112,15 @@ class UnitConverterUI(QMainWindow):
         self.combo_properties.setFixedHeight(35)
         self.combo_properties.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
+        # Entrada de varios valores a la vez (se crea al abrirla por primera vez)
+        self.button_bulk_input = QPushButton("Bulk Input...")
+        self.button_bulk_input.setFixedHeight(35)
+        self.button_bulk_input.setToolTip("Paste a column of values and convert them all at once")
+        self.bulk_panel = None
+
         left_panel_layout.addWidget(magnitude_label)
         left_panel_layout.addWidget(self.combo_properties)
+        left_panel_layout.addWidget(self.button_bulk_input)
         left_panel_layout.addStretch(1)
         left_panel_widget.setFixedWidth(250)
         left_panel_widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
@@ -124,9 +157,7 @@ class UnitConverterUI(QMainWindow):
         self.line_edit_value.setFixedWidth(200)
         self.line_edit_value.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
-        value_regex = QRegularExpression(r"^[+-]?(\d+[.,]?\d*|\d*[.,]?\d+)([eE][+-]?\d+)?$")
-        value_validator = QRegularExpressionValidator(value_regex)
-        self.line_edit_value.setValidator(value_validator)
+        self.line_edit_value.setValidator(NumberValidator(self.number_parser, self.line_edit_value))
 
         self.label_source_unit = QLabel("N")
         self.label_source_unit.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
@@ -146,40 +177,35 @@ class UnitConverterUI(QMainWindow):
 
         conversion_input_layout.addWidget(self.line_edit_value)
         conversion_input_layout.addWidget(self.label_source_unit)
+
+        # Modo exacto opcional: no redondea a MAX_DECIMALS, así que valores
+        # muy pequeños (Stefan Boltzmann, kg/mm³) no se quedan en 0.
+        self.check_exact = QCheckBox("Exact (significant digits)")
+        self.check_exact.setToolTip(
+            f"Convert with exact factors and show {self.SIGNIFICANT_DIGITS} significant digits")
+        conversion_input_layout.addWidget(self.check_exact)
         conversion_input_layout.addStretch(1)
 
         top_controls_layout.addLayout(system_units_layout)
         top_controls_layout.addLayout(conversion_input_layout)
         right_panel_layout.addWidget(top_controls_widget)
 
-        # TABLA DE RESULTADOS
-        self.table_results = QTableWidget()
-        self.table_results.setColumnCount(4)
-        self.table_results.setHorizontalHeaderLabels([
-            "Unit system", "Converted Value", "Scientific notation", "UNITS"
-        ])
+        # TABLA DE RESULTADOS (modelo/vista: valores en un array, texto formateado bajo demanda)
+        self.results_model = ResultsTableModel(self.number_formatter, self)
+        self.results_model.set_systems(UNIT_SYSTEM_NAMES)
+        if PROFILER.enabled:
+            from profiling_overlay import ProfiledTableView
+            self.table_results = ProfiledTableView()
+        else:
+            self.table_results = QTableView()
+        self.table_results.setModel(self.results_model)
+        self.table_results.setItemDelegateForColumn(ResultsTableModel.COL_UNIT, UnitDelegate(self.table_results))
         self.table_results.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table_results.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table_results.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.table_results.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table_results.verticalHeader().setDefaultSectionSize(30)
-        self.table_results.setRowCount(3)
         self.table_results.setToolTip("Double-click a row and press SPACEBAR to add it to history")
-        unit_systems = ["m,Kg,s,K (SI)", "mm,N,s,K", "cm,g,s,K (CGS)"]
-
-        for row in range(3):
-            item_unit_system = QTableWidgetItem(unit_systems[row])
-            item_unit_system.setFlags(item_unit_system.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table_results.setItem(row, 0, item_unit_system)
-            item_value = QTableWidgetItem("")
-            item_value.setFlags(item_value.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table_results.setItem(row, 1, item_value)
-            item_scientific = QTableWidgetItem("")
-            item_scientific.setFlags(item_scientific.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table_results.setItem(row, 2, item_scientific)
-            label_unit = QLabel("")
-            label_unit.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-            self.table_results.setCellWidget(row, 3, label_unit)
 
         right_panel_layout.addWidget(self.table_results, 1)
 
@@ -190,11 +216,8 @@ class UnitConverterUI(QMainWindow):
         self.button_add_to_history.setFixedHeight(40)
         history_actions_layout.addWidget(self.button_add_to_history, 1)
 
-        # CONFIGURACIÓN DEL ÍCONO SVG
-        svg_path = r"C:\GUI_Converter\icons\Deleted_icon.svg"
-        trash_icon = QIcon(svg_path)
+        # El icono SVG se carga en _load_icons, tras el primer pintado
         self.button_clear_history = QPushButton()
-        self.button_clear_history.setIcon(trash_icon)
         self.button_clear_history.setIconSize(QSize(32, 32))
         self.button_clear_history.setFixedSize(40, 40)
         self.button_clear_history.setToolTip("Clear History")
@@ -215,20 +238,28 @@ class UnitConverterUI(QMainWindow):
         history_label.setStyleSheet("font-weight: bold; margin-top: 5px;")
         right_panel_layout.addWidget(history_label)
 
-        self.list_history = QListWidget()
-        self.list_history.setMinimumHeight(120)
-        self.list_history.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        right_panel_layout.addWidget(self.list_history)
+        self.line_edit_history_filter = QLineEdit("")
+        self.line_edit_history_filter.setPlaceholderText("Filter history by category, system or unit")
+        self.line_edit_history_filter.setClearButtonEnabled(True)
+        right_panel_layout.addWidget(self.line_edit_history_filter)
+
+        # Hueco de la lista del historial; se rellena en _ensure_history_panel
+        self.history_panel = QWidget()
+        self.history_panel_layout = QVBoxLayout(self.history_panel)
+        self.history_panel_layout.setContentsMargins(0, 0, 0, 0)
+        self.history_panel.setMinimumHeight(120)
+        self.history_panel.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        right_panel_layout.addWidget(self.history_panel)
 
         history_buttons_layout = QHBoxLayout()
-        self.button_save_history = QPushButton("Save History (.txt)")
+        self.button_save_history = QPushButton("Export History...")
         self.button_save_history.setFixedHeight(40)
         self.button_save_history.setStyleSheet("""
             QPushButton { background-color: #2ECC71; color: white; border: 1px solid #27AE60; border-radius: 5px; font-weight: bold;}
             QPushButton:hover { background-color: #27AE60; }
         """)
         self.button_save_history.setShortcut("Ctrl+G")
-        self.button_save_history.setToolTip("Save conversion history (Ctrl+G)")
+        self.button_save_history.setToolTip("Export conversion history to CSV, JSON Lines or NumPy (Ctrl+G)")
         self.button_exit = QPushButton("Exit Program")
         self.button_exit.setFixedHeight(40)
         self.button_exit.setStyleSheet("""
@@ -242,89 +273,239 @@ class UnitConverterUI(QMainWindow):
         right_panel_layout.addLayout(history_buttons_layout)
         main_layout.addWidget(right_panel_widget, 1)
 
+        # Planificador único de conversiones: agrupa ráfagas de ediciones
+        self.conversion_scheduler = ConversionScheduler(
+            self.perform_conversion, self.CONVERSION_DELAY_MS, self)
+        self.history_filter_scheduler = ConversionScheduler(
+            self._apply_history_filter, self.HISTORY_FILTER_DELAY_MS, self)
+        self.history_flush_scheduler = ConversionScheduler(
+            self._flush_history, self.HISTORY_FLUSH_DELAY_MS, self)
+
         # CONEXIONES DE EVENTOS
         self.table_results.doubleClicked.connect(self._handle_double_click_selection)
-        self.table_results.itemPressed.connect(self._handle_single_click_deselection)
-        self.line_edit_value.textChanged.connect(self.perform_conversion)
-        self.combo_source_system.currentIndexChanged.connect(self.perform_conversion)
+        self.table_results.pressed.connect(self._handle_single_click_deselection)
+        self.line_edit_value.textChanged.connect(self.conversion_scheduler.request)
+        self.combo_source_system.currentIndexChanged.connect(self.conversion_scheduler.request)
+        self.check_exact.toggled.connect(self.conversion_scheduler.request)
         self.combo_properties.currentIndexChanged.connect(self.reset_and_update_ui_from_combo)
         self.button_exit.clicked.connect(self.close)
+        self.button_bulk_input.clicked.connect(self.open_bulk_panel)
+        self.combo_source_system.currentIndexChanged.connect(self._update_bulk_context)
         self.button_add_to_history.clicked.connect(self.add_to_history)
         self.button_save_history.clicked.connect(self.save_history)
         self.button_clear_history.clicked.connect(self.clear_history)
         self.table_results.installEventFilter(self)
-        self.list_history.installEventFilter(self)
+        self.line_edit_history_filter.textChanged.connect(self.history_filter_scheduler.request)
         if self.combo_properties.count() > 0:
             self.reset_and_update_ui_from_combo(0)
 
-    # MÉTODOS DE LÓGICA DE INTERFAZ
+        if PROFILER.enabled:
+            self._install_profiler_readout()
 
-    def perform_conversion(self):
-        value_str = self.line_edit_value.text().strip()
-        current_property = self.combo_properties.currentText()
-        locale = QLocale.system()
+    # ARRANQUE DIFERIDO
 
-        if not value_str or not current_property:
-            # Limpiar tabla si no hay valor
-            for row in range(self.table_results.rowCount()):
-                item_value = self.table_results.item(row, 1)
-                item_scientific = self.table_results.item(row, 2)
-                if item_value: item_value.setText("")
-                if item_scientific: item_scientific.setText("")
-            return
-
-        try:
-            # Preparar valor para la función de conversión (punto decimal)
-            normalized_value_str = value_str.replace(',', '.')
-            base_value = float(normalized_value_str)
-            system_index = self.combo_source_system.currentIndex()
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._startup_scheduled:
+            self._startup_scheduled = True
+            self.firstPainted.emit()
+            QTimer.singleShot(0, self._finish_startup)
 
-            # LLAMADA A LA FUNCIÓN EXTERNA
+    def _finish_startup(self):
+        self._ensure_history_panel()
+        self._load_icons()
+        # El historial guardado solo carga su página más reciente; el resto,
+        # al desplazarse hacia arriba.
+        self._open_history_database()
+        self.startupFinished.emit()
 
-            from main import placeholder_convert
+    def _load_icons(self):
+        self.setWindowIcon(QIcon(os.path.join(ICONS_DIR, "Convert.ico")))
+        self.button_clear_history.setIcon(QIcon(os.path.join(ICONS_DIR, "Deleted_icon.svg")))
 
-            for row in range(self.table_results.rowCount()):
-                result_item_value = self.table_results.item(row, 1)
-                result_item_scientific = self.table_results.item(row, 2)
+    def _ensure_history_panel(self):
+        if self.history_model is not None:
+            return
+        from history_model import HistoryListModel
+        self.history_model = HistoryListModel(HistoryStore(self.HISTORY_CAPACITY), self.number_formatter, self)
+        self.list_history = QListView()
+        self.list_history.setModel(self.history_model)
+        self.list_history.setUniformItemSizes(True)
+        self.list_history.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.list_history.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.history_panel_layout.addWidget(self.list_history)
+        self.list_history.installEventFilter(self)
+        self.list_history.verticalScrollBar().valueChanged.connect(self._on_history_scrolled)
+
+    def _ensure_exporter(self):
+        if self.exporter is not None:
+            return self.exporter
+        from export_worker import BackgroundExporter
+        # Las exportaciones se escriben en otro hilo; el progreso va a la barra de estado
+        self.exporter = BackgroundExporter(self)
+        self.exporter.progressChanged.connect(self._on_export_progress)
+        self.exporter.exportFinished.connect(self._on_export_finished)
+        self.exporter.exportFailed.connect(self._on_export_failed)
+        return self.exporter
 
-                # LLAMADA A LA FUNCIÓN DE CONVERSIÓN
-                converted_value = placeholder_convert(current_property, system_index, row, base_value)
+    # MÉTODOS DE LÓGICA DE INTERFAZ
 
-                # Formato y presentación
-                scientific_value = f"{converted_value:.12e}"
-                result_item_scientific.setText(scientific_value)
+    def _clear_results(self):
+        self.results_model.clear_values()
 
-                raw_formatted = locale.toString(converted_value, 'f', 12)
+    def perform_conversion(self):
+        """Única pasada de conversión; se invoca a través de conversion_scheduler."""
+        with PROFILER.span("conversion"):
+            self._perform_conversion()
 
-                if locale.decimalPoint() in raw_formatted:
-                    parts = raw_formatted.split(locale.decimalPoint(), 1)
-                    decimal_part_cleaned = parts[1].rstrip('0')
+    def _perform_conversion(self):
+        value_str = self.line_edit_value.text()
+        current_property = self.combo_properties.currentText()
 
-                    if decimal_part_cleaned:
-                        formatted_value = f"{parts[0]}{locale.decimalPoint()}{decimal_part_cleaned}"
-                    else:
-                        formatted_value = parts[0]
-                else:
-                    formatted_value = raw_formatted
+        with PROFILER.span("parse"):
+            base_value = self.number_parser.try_parse(value_str) if current_property else None
+        if base_value is None:
+            # Limpiar la tabla si no hay valor o está incompleto ('-', '1e')
+            self._clear_results()
+            return
 
-                result_item_value.setText(formatted_value)
+        system_index = self.combo_source_system.currentIndex()
+        if self.check_exact.isChecked():
+            self._perform_exact_conversion(current_property, system_index, value_str)
+            return
 
-        except ValueError:
-            # Limpiar si el valor de entrada es incorrecto
-            for row in range(self.table_results.rowCount()):
-                item_value = self.table_results.item(row, 1)
-                item_scientific = self.table_results.item(row, 2)
-                if item_value: item_value.setText("")
-                if item_scientific: item_scientific.setText("")
+        result = self.result_cache.get(current_property, system_index, base_value)
+        if result is None:
+            # LLAMADA A LA FUNCIÓN DE CONVERSIÓN; redondeo para limitar la imprecisión del float.
+            with PROFILER.span("convert"):
+                values = [
+                    round(placeholder_convert(current_property, system_index, row, base_value), self.MAX_DECIMALS)
+                    for row in range(self.results_model.rowCount())
+                ]
+            result = self.result_cache.put(current_property, system_index, base_value, values)
+        # Los textos de la caché llegan ya formateados; en un acierto no se convierte ni formatea nada.
+        with PROFILER.span("table_update"):
+            self.results_model.set_values(result.values, result.fixed, result.scientific)
+
+    def _perform_exact_conversion(self, category: str, system_index: int, value_str: str):
+        """Modo exacto: el número escrito como Fraction y texto por cifras significativas."""
+        # fractions/decimal solo se cargan la primera vez que se activa el modo
+        from converter_core.exact import (
+            ExactRangeError, convert_row_exact, format_scientific_exact, format_significant, to_float)
+
+        # La clave es el texto normalizado: no coincide con las claves float del modo normal
+        normalized = self.number_parser.normalize(value_str)
+        result = self.result_cache.get(category, system_index, normalized)
+        if result is None:
+            try:
+                with PROFILER.span("convert"):
+                    exact = convert_row_exact(category, system_index, normalized)
+                    values = [to_float(value) for value in exact]
+            except ExactRangeError as e:
+                # Fuera del rango del modo exacto: tabla vacía y aviso, como un valor incompleto
+                self._clear_results()
+                self.statusBar().showMessage(str(e), 3000)
+                return
+            with PROFILER.span("format"):
+                localize = self.number_formatter.localize
+                fixed = [format_significant(value, self.SIGNIFICANT_DIGITS, localize) for value in exact]
+                scientific = [format_scientific_exact(value, self.number_formatter.sci_digits) for value in exact]
+            result = self.result_cache.put(
+                category, system_index, normalized, values, fixed, scientific)
+        with PROFILER.span("table_update"):
+            self.results_model.set_values(result.values, result.fixed, result.scientific)
+
+    def changeEvent(self, event):
+        # Si cambia la localización del sistema se renuevan los separadores
+        # (y la caché del formateador) y se reformatea la tabla.
+        if event.type() == QEvent.Type.LocaleChange:
+            locale = QLocale.system()
+            self.number_parser.set_locale(locale.decimalPoint(), locale.groupSeparator())
+            if self.number_formatter.set_locale(locale.decimalPoint(), locale.groupSeparator()):
+                if self.check_exact.isChecked():
+                    # El texto exacto no se puede rehacer desde los float del modelo
+                    self.conversion_scheduler.request()
+                else:
+                    self.results_model.invalidate_formatting()
+                if self.history_model is not None:
+                    self.history_model.refresh()
+                if self.bulk_panel is not None:
+                    self.bulk_panel.set_locale(locale.decimalPoint(), locale.groupSeparator())
+        super().changeEvent(event)
+
+    def _open_history_database(self):
+        import sqlite3
+        from converter_core.history_db import HistoryDatabase
+        directory = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        try:
+            database = HistoryDatabase(os.path.join(directory, self.HISTORY_DB_NAME))
+        except (OSError, sqlite3.Error) as e:
+            # Sin base de datos el historial sigue funcionando, solo en memoria
+            self.statusBar().showMessage(f"History will not be saved: {e}", 5000)
+            return
+        self.history_model.attach_database(database)
+        self.list_history.scrollToBottom()
+
+    def _apply_history_filter(self):
+        self._ensure_history_panel()
+        self.history_model.set_filter(self.line_edit_history_filter.text())
+        self.list_history.scrollToBottom()
+
+    def _on_history_scrolled(self, value: int):
+        if value == self.list_history.verticalScrollBar().minimum() and self.history_model.can_load_older():
+            added = self.history_model.load_older()
+            if added:
+                # Mantener a la vista la entrada que estaba arriba
+                self.list_history.scrollTo(self.history_model.index(added),
+                                           QAbstractItemView.ScrollHint.PositionAtTop)
+
+    def _flush_history(self):
+        if self.history_model is not None:
+            self.history_model.flush()
+
+    def closeEvent(self, event):
+        if self.exporter is not None:
+            self.exporter.cancel_all()
+            self.exporter.wait()
+        database = self.history_model.database() if self.history_model is not None else None
+        if database is not None:
+            database.close()
+        super().closeEvent(event)
+
+    def _install_profiler_readout(self):
+        from profiling_overlay import ProfilerReadout
+        self.profiler_readout = ProfilerReadout(self.PROFILE_STAGES, cache=self.result_cache, parent=self)
+        self.statusBar().addPermanentWidget(self.profiler_readout)
+        shortcut = QShortcut(QKeySequence("Ctrl+Shift+P"), self)
+        shortcut.activated.connect(self.dump_profile)
+
+    def dump_profile(self):
+        """Vuelca las estadísticas de latencia a JSON (Ctrl+Shift+P)."""
+        try:
+            PROFILER.dump_json(self.PROFILE_DUMP_PATH)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Error saving file:\n{e}")
             return
-        except ImportError:
-            QMessageBox.critical(self, "Error de Módulo",
-                                 "No se pudo importar 'placeholder_convert'. Asegúrate de que tu lógica de conversión esté disponible.")
+        self.statusBar().showMessage(f"Profile written to {os.path.abspath(self.PROFILE_DUMP_PATH)}", 5000)
+
+    def open_bulk_panel(self):
+        if self.bulk_panel is None:
+            from bulk_panel import BulkConversionPanel
+            self.bulk_panel = BulkConversionPanel(self.number_formatter, self)
+        self._update_bulk_context()
+        self.bulk_panel.show()
+        self.bulk_panel.raise_()
+        self.bulk_panel.activateWindow()
+
+    def _update_bulk_context(self, *_args):
+        if self.bulk_panel is not None:
+            self.bulk_panel.set_context(self.combo_properties.currentText(),
+                                        self.combo_source_system.currentIndex())
 
     def _handle_double_click_selection(self, index: QModelIndex):
         self.table_results.selectRow(index.row())
 
-    def _handle_single_click_deselection(self, item: QTableWidgetItem):
+    def _handle_single_click_deselection(self, index: QModelIndex):
         self.table_results.clearSelection()
 
     def eventFilter(self, source, event):
@@ -348,11 +529,11 @@ class UnitConverterUI(QMainWindow):
         return self.UNIT_LABELS.get(property_name, ["Unit"])[0]
 
     def remove_selected_history_item(self):
-        selected_items = self.list_history.selectedItems()
-        if selected_items:
-            for item in selected_items:
-                row = self.list_history.row(item)
-                self.list_history.takeItem(row)
+        if self.list_history is None:
+            return
+        selected_rows = self.list_history.selectionModel().selectedRows()
+        if selected_rows:
+            self.history_model.remove_rows(index.row() for index in selected_rows)
 
     def reset_and_update_ui_from_combo(self, index: int):
         self.line_edit_value.setText("")
@@ -371,18 +552,13 @@ class UnitConverterUI(QMainWindow):
             self.combo_source_system.clear()
             self.combo_source_system.addItems(units)
             self.combo_source_system.blockSignals(False)
+            self._update_bulk_context()
 
-            for row in range(self.table_results.rowCount()):
-                item_value = self.table_results.item(row, 1)
-                item_scientific = self.table_results.item(row, 2)
-                if item_value: item_value.setText("")
-                if item_scientific: item_scientific.setText("")
-
-                unit_label = self.table_results.cellWidget(row, 3)
-                if isinstance(unit_label, QLabel):
-                    default_output_unit_plain = self.get_output_unit(current_property, row)
-                    html_unit = self.convert_to_html_unit(default_output_unit_plain)
-                    unit_label.setText(html_unit)
+            self._clear_results()
+            self.results_model.set_units([
+                self.convert_to_html_unit(self.get_output_unit(current_property, row))
+                for row in range(self.results_model.rowCount())
+            ])
 
     def add_to_history(self):
         selected_rows = self.table_results.selectionModel().selectedRows()
@@ -393,60 +569,93 @@ class UnitConverterUI(QMainWindow):
 
         try:
             property_name = self.combo_properties.currentText()
-            source_value = self.line_edit_value.text()
-            source_unit = self.get_default_unit(property_name)
-            unit_system = self.table_results.item(row, 0).text()
-            converted_value_item = self.table_results.item(row, 1)
-            scientific_notation_item = self.table_results.item(row, 2)
-
-            if not converted_value_item or not converted_value_item.text().strip():
+            model = self.results_model
+            if not model.has_values():
                 return
 
-            converted_value = converted_value_item.text()
-            scientific_notation = scientific_notation_item.text()
-            output_unit = self.get_output_unit(property_name, row)
+            # Valor de origen tal como se convirtió (mismo valor que el de la tabla)
+            source_value = self.number_parser.parse(self.line_edit_value.text())
+            source_unit = self.get_output_unit(property_name, self.combo_source_system.currentIndex())
 
-            history_entry = (
-                f"{property_name} | {source_value} {source_unit} | "
-                f"[{unit_system}] {converted_value} {output_unit} | "
-                f" ({scientific_notation})"
+            record = HistoryRecord(
+                property_name, source_value, source_unit,
+                model.text(row, ResultsTableModel.COL_SYSTEM), model.value(row),
+                self.get_output_unit(property_name, row),
             )
-
-            for i in range(self.list_history.count()):
-                if self.list_history.item(i).text() == history_entry:
-                    return
-
-            self.list_history.addItem(history_entry)
-            self.list_history.scrollToBottom()
+            # Los duplicados se descartan en O(1) con el índice del almacén
+            self._ensure_history_panel()
+            if self.history_model.add(record):
+                self.list_history.scrollToBottom()
+                self.history_flush_scheduler.request()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not add to history: {e}")
             return
 
     def save_history(self):
-        if self.list_history.count() == 0:
+        self._ensure_history_panel()
+        database = self.history_model.database()
+        if self.history_model.rowCount() == 0 and database is None:
             return
 
-        file_name, _ = QFileDialog.getSaveFileName(
+        file_name, selected_filter = QFileDialog.getSaveFileName(
             self,
-            "Save conversion history",
-            "conversion_history.txt",
-            "Text Files (*.txt);;All Files (*)"
+            "Export conversion history",
+            "conversion_history.csv",
+            self.EXPORT_FILTERS
         )
+        if not file_name:
+            return
 
-        if file_name:
-            try:
-                with open(file_name, 'w', encoding='utf-8') as f:
-                    f.write("--- Conversion History ---\n")
-                    f.write(f"Source Property: {self.combo_properties.currentText()}\n\n")
-                    for i in range(self.list_history.count()):
-                        f.write(self.list_history.item(i).text() + "\n")
+        from export_worker import with_export_extension
+        from converter_core.export import HISTORY_FIELDS, format_for_path, history_rows
+        file_name = with_export_extension(file_name, selected_filter)
+        try:
+            fmt = format_for_path(file_name)
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error saving file:\n{e}")
+        if database is not None:
+            # Todo el historial guardado, leído por páginas desde el hilo de exportación
+            database.flush()
+            from converter_core.history_db import iter_rows
+            path = database.path
+            rows_factory = lambda: iter_rows(path)
+        else:
+            records = list(self.history_model.store)
+            rows_factory = lambda: history_rows(records)
+        self._ensure_exporter().submit(rows_factory, file_name, HISTORY_FIELDS, fmt)
+        self.statusBar().showMessage(f"Exporting history to {file_name}...")
+
+    def _on_export_progress(self, rows: int):
+        self.statusBar().showMessage(f"Exporting... {rows:,} rows written")
+
+    def _on_export_finished(self, path: str, rows: int):
+        self.statusBar().showMessage(f"Exported {rows:,} rows to {path}", 5000)
+
+    def _on_export_failed(self, path: str, message: str):
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Error", f"Error saving file:\n{message}")
 
     def clear_history(self):
-        self.list_history.clear()
+        self._ensure_history_panel()
+        # Con base de datos el borrado es permanente: se confirma y se limita al filtro activo
+        database = self.history_model.database()
+        if database is not None:
+            text = self.history_model.filter_text()
+            count = database.count(text)
+            if count == 0 and self.history_model.rowCount() == 0:
+                return
+            scope = f" matching \"{text}\"" if text else ""
+            answer = QMessageBox.question(
+                self, "Clear History",
+                f"Permanently delete {count:,} saved history entries{scope}?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No)
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+        self.history_model.clear()
 
 
 if __name__ == '__main__':
@@ -469,7 +678,7 @@ if __name__ == '__main__':
         print("Para un diseño moderno, instala 'qt-material': pip install qt-material")
         # Estilos por defecto si qt-material no está instalado
         app.setStyleSheet("""
-            QTableWidget::item { padding: 4px; }
+            QTableView::item { padding: 4px; }
             QPushButton { border-radius: 5px; }
         """)
 
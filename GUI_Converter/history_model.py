@@ -0,0 +1,149 @@
+from typing import Iterable, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from converter_core import NumberFormatter
+from converter_core.history import HistoryRecord, HistoryStore
+from converter_core.history_db import DEFAULT_PAGE_SIZE, HistoryDatabase, matches_filter
+
+
+class HistoryListModel(QAbstractListModel):
+    """Vista perezosa sobre un HistoryStore.
+
+    El texto de cada entrada se genera en data() solo para las filas
+    visibles; el almacén guarda los registros estructurados. Con una base de
+    datos asociada, los cambios se persisten y el historial antiguo se carga
+    por páginas según se necesita.
+    """
+
+    def __init__(self, store: HistoryStore, formatter: NumberFormatter, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._formatter = formatter
+        self._database: Optional[HistoryDatabase] = None
+        self._page_size = DEFAULT_PAGE_SIZE
+        # id del registro más antiguo cargado; None si no queda nada más antiguo
+        self._older_id: Optional[int] = None
+        self._filter = ""
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.store)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.store[index.row()].display_text(self._formatter)
+
+    def record(self, row: int) -> HistoryRecord:
+        return self.store[row]
+
+    def attach_database(self, database: HistoryDatabase, page_size: int = DEFAULT_PAGE_SIZE):
+        """Asocia la base de datos y carga solo la página más reciente."""
+        self._database = database
+        self._page_size = page_size
+        self._load_recent()
+
+    def database(self) -> Optional[HistoryDatabase]:
+        return self._database
+
+    def _reset_with(self, records: List[HistoryRecord]):
+        self.beginResetModel()
+        self.store.clear()
+        self.store.prepend(records)
+        self.endResetModel()
+
+    def _load_recent(self):
+        records = self._database.recent(self._page_size)
+        self._reset_with(records)
+        self._older_id = records[0].record_id if len(records) == self._page_size else None
+
+    def can_load_older(self) -> bool:
+        return (self._older_id is not None and not self._filter
+                and len(self.store) < self.store.capacity)
+
+    def load_older(self) -> int:
+        """Antepone la página anterior del historial; devuelve las filas añadidas."""
+        if not self.can_load_older():
+            return 0
+        records = self._database.recent(self._page_size, self._older_id)
+        self._older_id = records[0].record_id if len(records) == self._page_size else None
+        count = min(len(self.store.unseen(records)), self.store.capacity - len(self.store))
+        if count <= 0:
+            return 0
+        self.beginInsertRows(QModelIndex(), 0, count - 1)
+        self.store.prepend(records)
+        self.endInsertRows()
+        return count
+
+    def filter_text(self) -> str:
+        return self._filter
+
+    def set_filter(self, text: str):
+        """Muestra solo las entradas que coinciden con `text` (consulta a la base de datos)."""
+        text = text.strip()
+        if text == self._filter or self._database is None:
+            return
+        self._filter = text
+        if text:
+            self._reset_with(self._database.search(text, self.store.capacity))
+            self._older_id = None
+        else:
+            self._load_recent()
+
+    def flush(self):
+        """Escribe en disco las altas pendientes."""
+        if self._database is not None:
+            self._database.flush()
+
+    def add(self, record: HistoryRecord) -> bool:
+        """Añade un registro (si no es duplicado), descartando los más antiguos si hace falta.
+
+        Con un filtro activo, un registro que no coincide se guarda pero no se muestra.
+        """
+        if record in self.store:
+            return False
+        if self._database is not None:
+            self._database.add(record)
+        if self._filter and not matches_filter(record, self._filter):
+            return True
+        overflow = self.store.overflow_for(1)
+        if overflow:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self.store.evict(overflow)
+            self.endRemoveRows()
+        row = len(self.store)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.store.add(record)
+        self.endInsertRows()
+        return True
+
+    def remove_rows(self, rows: Iterable[int]):
+        rows = sorted(set(rows), reverse=True)
+        if self._database is not None:
+            self._database.remove([self.store[row] for row in rows])
+        # Tramos contiguos, de mayor a menor para que los índices restantes
+        # sigan siendo válidos: una selección con mayúsculas es un solo tramo
+        runs: List[List[int]] = []
+        for row in rows:
+            if runs and runs[-1][0] == row + 1:
+                runs[-1][0] = row
+            else:
+                runs.append([row, row])
+        for first, last in runs:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self.store.remove_rows(range(first, last + 1))
+            self.endRemoveRows()
+
+    def clear(self):
+        """Borra las entradas visibles: con un filtro activo, solo las que coinciden con él."""
+        if self._database is not None:
+            self._database.clear(self._filter)
+        self._older_id = None
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+
+    def refresh(self):
+        """Vuelve a pedir el texto de todas las filas (p. ej. tras cambiar la localización)."""
+        if len(self.store):
+            self.dataChanged.emit(self.index(0), self.index(len(self.store) - 1))
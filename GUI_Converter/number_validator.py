@@ -0,0 +1,24 @@
+from PySide6.QtGui import QValidator
+
+from converter_core.parsing import ACCEPTABLE, INTERMEDIATE, NumberParser
+
+_STATES = {
+    ACCEPTABLE: QValidator.State.Acceptable,
+    INTERMEDIATE: QValidator.State.Intermediate,
+}
+
+
+class NumberValidator(QValidator):
+    """Validador de la casilla de valor basado en NumberParser.
+
+    Sustituye a QRegularExpressionValidator: la misma pasada que decide si el
+    texto es válido es la que luego usa la conversión, con los separadores
+    de la localización (incluido el de miles).
+    """
+
+    def __init__(self, parser: NumberParser, parent=None):
+        super().__init__(parent)
+        self.parser = parser
+
+    def validate(self, text: str, pos: int):
+        return _STATES.get(self.parser.validate(text), QValidator.State.Invalid), text, pos
@@ -0,0 +1,42 @@
+from typing import Sequence
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QLabel, QTableView
+
+from converter_core.instrumentation import PROFILER, Profiler
+
+
+class ProfiledTableView(QTableView):
+    """QTableView que mide cada repintado en la etapa 'paint'.
+
+    Solo se usa con la instrumentación activa, para no añadir una llamada a
+    Python en cada paintEvent cuando está desactivada.
+    """
+
+    def paintEvent(self, event):
+        with PROFILER.span("paint"):
+            super().paintEvent(event)
+
+
+class ProfilerReadout(QLabel):
+    """Etiqueta para la barra de estado con p50/p99 por etapa, refrescada cada segundo."""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, stages: Sequence[str], profiler: Profiler = PROFILER, cache=None, parent=None):
+        super().__init__(parent)
+        self._stages = list(stages)
+        self._profiler = profiler
+        # ResultCache opcional: se añade su tasa de aciertos a la lectura
+        self._cache = cache
+        self.setToolTip("p50/p99 latency per stage (GUI_CONVERTER_PROFILE)")
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+
+    def refresh(self):
+        text = self._profiler.readout(self._stages) or "profiling: no samples yet"
+        if self._cache is not None and self._cache.hits + self._cache.misses:
+            text += f" | cache {self._cache.hit_rate:.0%} hits ({len(self._cache)} entries)"
+        self.setText(text)
@@ -0,0 +1,180 @@
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSize, Qt
+from PySide6.QtGui import QTextDocument
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from converter_core import NumberFormatter
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Modelo de la tabla de resultados respaldado por un array de floats.
+
+    Los valores convertidos se guardan en un array('d') reservado de antemano
+    y el texto de cada celda se formatea solo cuando la vista lo pide en
+    data(), es decir, únicamente para las celdas visibles. Cada actualización
+    emite un único dataChanged para todo el rango de valores.
+    """
+
+    COL_SYSTEM, COL_VALUE, COL_SCIENTIFIC, COL_UNIT = range(4)
+    HEADERS = ("Unit system", "Converted Value", "Scientific notation", "UNITS")
+
+    def __init__(self, formatter: NumberFormatter, parent=None):
+        super().__init__(parent)
+        self._formatter = formatter
+        self._systems: List[str] = []
+        self._units: List[str] = []
+        self._values = array("d")
+        self._has_values = False
+        self._fixed: List[Optional[str]] = []
+        self._scientific: List[Optional[str]] = []
+
+    # Estructura
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._systems)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row, column = index.row(), index.column()
+        if column == self.COL_SYSTEM:
+            return self._systems[row]
+        if column == self.COL_UNIT:
+            return self._units[row] if row < len(self._units) else ""
+        if not self._has_values:
+            return ""
+        if column == self.COL_VALUE:
+            text = self._fixed[row]
+            if text is None:
+                text = self._fixed[row] = self._formatter.fixed(self._values[row])
+            return text
+        if column == self.COL_SCIENTIFIC:
+            text = self._scientific[row]
+            if text is None:
+                text = self._scientific[row] = self._formatter.scientific(self._values[row])
+            return text
+        return None
+
+    # Actualización
+
+    def set_systems(self, systems: Sequence[str]):
+        """Define las filas (un sistema de unidades por fila)."""
+        self.beginResetModel()
+        self._systems = list(systems)
+        self._values = array("d", bytes(8 * len(self._systems)))
+        self._has_values = False
+        self._fixed = [None] * len(self._systems)
+        self._scientific = [None] * len(self._systems)
+        self.endResetModel()
+
+    def set_units(self, units: Sequence[str]):
+        """Unidades (HTML) de la columna UNITS, dibujadas por UnitDelegate."""
+        self._units = list(units)
+        if self._systems:
+            self.dataChanged.emit(self.index(0, self.COL_UNIT),
+                                  self.index(len(self._systems) - 1, self.COL_UNIT))
+
+    def set_values(self, values: Sequence[float], fixed: Optional[Sequence[str]] = None,
+                   scientific: Optional[Sequence[str]] = None):
+        """Copia los valores en el array reservado y descarta el texto previo.
+
+        `fixed`/`scientific` dan el texto ya formateado (modo exacto, por
+        cifras significativas) en lugar de formatearlo desde los float.
+        """
+        count = min(len(values), len(self._systems))
+        self._values[:count] = array("d", values[:count])
+        self._has_values = True
+        self._invalidate_text(fixed, scientific)
+
+    def clear_values(self):
+        if not self._has_values:
+            return
+        self._has_values = False
+        self._invalidate_text()
+
+    def invalidate_formatting(self):
+        """Fuerza a reformatear (p. ej. tras un cambio de localización)."""
+        if self._has_values:
+            self._invalidate_text()
+
+    def _invalidate_text(self, fixed: Optional[Sequence[str]] = None,
+                         scientific: Optional[Sequence[str]] = None):
+        rows = len(self._systems)
+        self._fixed = [None] * rows
+        self._scientific = [None] * rows
+        if fixed is not None:
+            count = min(len(fixed), rows)
+            self._fixed[:count] = fixed[:count]
+        if scientific is not None:
+            count = min(len(scientific), rows)
+            self._scientific[:count] = scientific[:count]
+        if rows:
+            self.dataChanged.emit(self.index(0, self.COL_VALUE),
+                                  self.index(rows - 1, self.COL_SCIENTIFIC))
+
+    # Acceso para la ventana
+
+    def has_values(self) -> bool:
+        return self._has_values
+
+    def value(self, row: int) -> Optional[float]:
+        return self._values[row] if self._has_values and 0 <= row < len(self._systems) else None
+
+    def text(self, row: int, column: int) -> str:
+        return self.data(self.index(row, column)) or ""
+
+
+class UnitDelegate(QStyledItemDelegate):
+    """Dibuja la unidad como texto enriquecido (superíndices) sin un QLabel por fila."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._documents: Dict[str, QTextDocument] = {}
+
+    def _document(self, html: str, font) -> QTextDocument:
+        document = self._documents.get(html)
+        if document is None:
+            document = QTextDocument()
+            document.setDocumentMargin(0)
+            document.setHtml(html)
+            self._documents[html] = document
+        document.setDefaultFont(font)
+        return document
+
+    def paint(self, painter, option, index):
+        options = QStyleOptionViewItem(option)
+        self.initStyleOption(options, index)
+        document = self._document(options.text, options.font)
+        options.text = ""
+
+        widget = options.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, options, painter, widget)
+
+        text_rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, options, widget)
+        offset_y = (text_rect.height() - document.size().height()) / 2
+        painter.save()
+        painter.translate(text_rect.left(), text_rect.top() + offset_y)
+        document.drawContents(painter)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        options = QStyleOptionViewItem(option)
+        self.initStyleOption(options, index)
+        document = self._document(options.text, options.font)
+        return QSize(int(document.idealWidth()), int(document.size().height()))
@@ -0,0 +1,439 @@
+"""Servicio local HTTP/JSON de conversión (asyncio, sin Qt).
+
+Uso (desde el directorio GUI_Converter):
+    python serve.py --port 8765
+    python serve.py --unix /tmp/gui_converter.sock
+
+Rutas:
+    POST /convert   una conversión o un lote
+    GET  /metrics   peticiones, valores, lotes y latencias p50/p90/p99
+    GET  /health    comprobación de vida
+
+Cuerpo de /convert:
+    {"category": "Density", "from": 0, "to": 2, "value": 1.5}
+    {"category": "Density", "from": "m,kg,s,K", "values": [1, 2, 3]}   sin "to": todos los sistemas
+    {"from": "kN/cm²", "to": "MPa", "values": [1, 2]}                   expresiones de unidades
+    {"requests": [{...}, {...}]}                                        varias en una petición
+
+Las conversiones que llegan a la vez desde distintas conexiones se agrupan
+(micro-batching) en una sola multiplicación vectorizada: los valores de
+todas las peticiones pendientes se concatenan junto con su par
+(multiplicador, divisor) de engine.convert y se calculan de una vez, con
+NumPy si está instalado, de modo que el resultado coincide con la interfaz. Las conexiones son
+persistentes (HTTP/1.1 keep-alive) hasta `Connection: close` o un tiempo de
+inactividad.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cli import resolve_system
+from converter_core import CATEGORY_UNITS, conversion_operation, operation_row
+from converter_core.instrumentation import Histogram
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Espera (ms) para reunir peticiones concurrentes; 0 = las de un mismo turno del bucle
+DEFAULT_BATCH_WINDOW_MS = 0.0
+# Valores pendientes a partir de los cuales el lote se convierte sin esperar
+DEFAULT_MAX_BATCH = 65536
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_HEADER_BYTES = 64 * 1024
+KEEP_ALIVE_TIMEOUT_S = 30.0
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(ValueError):
+    """Petición mal formada; se responde con `status` y el mensaje."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _system_index(category: str, system) -> int:
+    if isinstance(system, int) and not isinstance(system, bool):
+        if 0 <= system < len(CATEGORY_UNITS[category]):
+            return system
+        raise ValueError(f"System index out of range for {category}: {system}")
+    return resolve_system(category, str(system))
+
+
+def resolve_operations(item: Dict) -> Tuple[List[Tuple[float, float]], bool]:
+    """Pares (multiplicador, divisor) de una petición y si el destino es un único sistema.
+
+    Sin "to" y con categoría se devuelven los pares hacia todos los
+    sistemas, como las filas de la tabla de la interfaz.
+    """
+    category = item.get("category")
+    src, dst = item.get("from"), item.get("to")
+    if src is None:
+        raise ValueError("Missing 'from'")
+    if category is None:
+        if dst is None:
+            raise ValueError("Missing 'to' (required for unit expressions)")
+        from converter_core.unit_expr import unit_factor
+        return [(unit_factor(str(src), str(dst)), 1.0)], True
+    if category not in CATEGORY_UNITS:
+        raise ValueError(f"Unknown category: {category!r}")
+    src_idx = _system_index(category, src)
+    if dst is None:
+        return operation_row(category, src_idx), False
+    return [conversion_operation(category, src_idx, _system_index(category, dst))], True
+
+
+def _values_of(item: Dict) -> Tuple[List[float], bool]:
+    """Valores de la petición y si vino como escalar ("value") o lista ("values")."""
+    if "value" in item:
+        values, scalar = [item["value"]], True
+    elif "values" in item:
+        values, scalar = item["values"], False
+        if not isinstance(values, list):
+            raise ValueError("'values' must be a list")
+    else:
+        raise ValueError("Missing 'value' or 'values'")
+    # Solo números JSON: ni cadenas ("1e3") ni true/false (bool es subclase de int)
+    numbers = []
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("Values must be numbers")
+        try:
+            number = float(value)
+        except OverflowError:
+            number = math.inf
+        if not math.isfinite(number):
+            raise ValueError("Values must be finite")
+        numbers.append(number)
+    return numbers, scalar
+
+
+def _reject_constant(name: str):
+    """json.loads acepta NaN e Infinity, que no son JSON válido."""
+    raise ValueError(f"{name} is not valid JSON")
+
+
+class _Pending:
+    __slots__ = ("values", "operations", "future")
+
+    def __init__(self, values: List[float], operations: List[Tuple[float, float]], future: asyncio.Future):
+        self.values = values
+        self.operations = operations
+        self.future = future
+
+
+class ConversionBatcher:
+    """Agrupa las conversiones concurrentes en una única operación vectorizada.
+
+    Cada petición aporta sus valores y uno o varios pares (multiplicador,
+    divisor); al vaciar el lote se construyen tres vectores (valor repetido
+    por par, multiplicador y divisor) y se calcula valor * m / d de una vez.
+    Cada petición recibe su tramo del resultado.
+    """
+
+    def __init__(self, window_ms: float = DEFAULT_BATCH_WINDOW_MS, max_batch: int = DEFAULT_MAX_BATCH):
+        self.window_s = window_ms / 1000.0
+        self.max_batch = max_batch
+        self._pending: List[_Pending] = []
+        self._pending_values = 0
+        self._handle: Optional[asyncio.Handle] = None
+        self.batches = 0
+        self.batched_requests = 0
+        self.batched_values = 0
+        self.largest_batch = 0
+
+    def submit(self, values: List[float], operations: Sequence[Tuple[float, float]]) -> asyncio.Future:
+        """Futuro con la lista de resultados (len(values) * len(operations), fila a fila)."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_Pending(values, list(operations), future))
+        self._pending_values += len(values) * len(operations)
+        if self._pending_values >= self.max_batch:
+            self.flush()
+        elif self._handle is None:
+            if self.window_s > 0:
+                self._handle = loop.call_later(self.window_s, self.flush)
+            else:
+                self._handle = loop.call_soon(self.flush)
+        return future
+
+    def flush(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, []
+        total, self._pending_values = self._pending_values, 0
+        if not pending:
+            return
+        try:
+            results = self._compute(pending, total)
+        except Exception as e:
+            for request in pending:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        self.batches += 1
+        self.batched_requests += len(pending)
+        self.batched_values += total
+        self.largest_batch = max(self.largest_batch, len(pending))
+        start = 0
+        for request in pending:
+            end = start + len(request.values) * len(request.operations)
+            if not request.future.done():
+                request.future.set_result(results[start:end])
+            start = end
+
+    @staticmethod
+    def _compute(pending: List[_Pending], total: int) -> List[float]:
+        values = array("d")
+        multipliers = array("d")
+        divisors = array("d")
+        for request in pending:
+            width = len(request.operations)
+            if width == 1:
+                values.extend(request.values)
+            else:
+                for value in request.values:
+                    values.extend((value,) * width)
+            row_multipliers = array("d", (m for m, _ in request.operations))
+            row_divisors = array("d", (d for _, d in request.operations))
+            multipliers.extend(row_multipliers * len(request.values))
+            divisors.extend(row_divisors * len(request.values))
+        if np is not None and total >= 64:
+            return (np.frombuffer(values, dtype=np.float64) * np.frombuffer(multipliers, dtype=np.float64)
+                    / np.frombuffer(divisors, dtype=np.float64)).tolist()
+        return [v * m / d for v, m, d in zip(values, multipliers, divisors)]
+
+
+class ServiceMetrics:
+    """Contadores y latencias del servicio para /metrics."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = 0
+        self.conversions = 0
+        self.values = 0
+        self.errors = 0
+        self.connections = 0
+        self.open_connections = 0
+        self.latency = Histogram()
+
+    def as_dict(self, batcher: ConversionBatcher) -> Dict:
+        uptime = max(time.time() - self.started, 1e-9)
+        latency = self.latency.summary()
+        return {
+            "uptime_s": uptime,
+            "requests": self.requests,
+            "conversions": self.conversions,
+            "values": self.values,
+            "errors": self.errors,
+            "connections": self.connections,
+            "open_connections": self.open_connections,
+            "requests_per_s": self.requests / uptime,
+            "values_per_s": self.values / uptime,
+            "batches": batcher.batches,
+            "mean_batch_requests": batcher.batched_requests / batcher.batches if batcher.batches else 0.0,
+            "largest_batch_requests": batcher.largest_batch,
+            "latency_us": latency,
+            "numpy": np is not None,
+        }
+
+
+class ConversionService:
+    """Servidor HTTP/1.1 mínimo sobre asyncio para TCP o socket Unix."""
+
+    def __init__(self, batcher: Optional[ConversionBatcher] = None,
+                 keep_alive_timeout: float = KEEP_ALIVE_TIMEOUT_S):
+        self.batcher = batcher or ConversionBatcher()
+        self.metrics = ServiceMetrics()
+        self.keep_alive_timeout = keep_alive_timeout
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                    unix_path: Optional[str] = None) -> asyncio.AbstractServer:
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.remove(unix_path)
+            return await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.metrics.connections += 1
+        self.metrics.open_connections += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keep_alive_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 413, {"error": "Headers too large"}, False)
+                    return
+                if len(head) > MAX_HEADER_BYTES:
+                    await self._respond(writer, 413, {"error": "Headers too large"}, False)
+                    return
+                keep_alive = await self._handle_request(head, reader, writer)
+                if not keep_alive:
+                    return
+        finally:
+            self.metrics.open_connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_request(self, head: bytes, reader: asyncio.StreamReader,
+                              writer: asyncio.StreamWriter) -> bool:
+        start = time.perf_counter_ns()
+        try:
+            request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+            method, target, version = request_line.split(" ", 2)
+        except ValueError:
+            await self._respond(writer, 400, {"error": "Malformed request line"}, False)
+            return False
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            await self._respond(writer, 400, {"error": "Invalid Content-Length"}, False)
+            return False
+        if length > MAX_BODY_BYTES:
+            await self._respond(writer, 413, {"error": f"Body larger than {MAX_BODY_BYTES} bytes"}, False)
+            return False
+        try:
+            body = await reader.readexactly(length) if length else b""
+        except asyncio.IncompleteReadError:
+            return False
+
+        self.metrics.requests += 1
+        path = target.split("?", 1)[0]
+        try:
+            status, payload = await self._route(method, path, body)
+        except RequestError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception as e:
+            status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+        if status >= 400:
+            self.metrics.errors += 1
+        await self._respond(writer, status, payload, keep_alive)
+        if path == "/convert":
+            self.metrics.latency.record(time.perf_counter_ns() - start)
+        return keep_alive
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        if path == "/convert":
+            if method != "POST":
+                raise RequestError("Use POST for /convert", 405)
+            try:
+                document = json.loads(body, parse_constant=_reject_constant)
+            except (UnicodeDecodeError, ValueError) as e:
+                raise RequestError(f"Invalid JSON: {e}") from None
+            return 200, await self.convert_document(document)
+        if method != "GET":
+            raise RequestError(f"Use GET for {path}", 405)
+        if path == "/metrics":
+            return 200, self.metrics.as_dict(self.batcher)
+        if path == "/health":
+            return 200, {"status": "ok"}
+        raise RequestError(f"Unknown path: {path}", 404)
+
+    async def convert_document(self, document) -> Dict:
+        if isinstance(document, dict) and "requests" in document:
+            items = document["requests"]
+            if not isinstance(items, list):
+                raise RequestError("'requests' must be a list")
+            results = await asyncio.gather(*(self._convert_item(item, per_item_errors=True)
+                                             for item in items))
+            return {"results": results}
+        return await self._convert_item(document, per_item_errors=False)
+
+    async def _convert_item(self, item, per_item_errors: bool) -> Dict:
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("Each conversion must be a JSON object")
+            operations, single = resolve_operations(item)
+            values, scalar = _values_of(item)
+        except ValueError as e:
+            if per_item_errors:
+                self.metrics.errors += 1
+                return {"error": str(e)}
+            raise RequestError(str(e)) from None
+
+        results = await self.batcher.submit(values, operations)
+        if not all(map(math.isfinite, results)):
+            # Un valor finito puede desbordarse al multiplicarlo por el factor
+            message = "Converted value out of range"
+            if per_item_errors:
+                self.metrics.errors += 1
+                return {"error": message}
+            raise RequestError(message)
+        self.metrics.conversions += 1
+        self.metrics.values += len(values)
+        if not single:
+            width = len(operations)
+            rows = [results[i:i + width] for i in range(0, len(results), width)]
+            return {"value": rows[0]} if scalar else {"values": rows}
+        return {"value": results[0]} if scalar else {"values": results}
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Dict, keep_alive: bool):
+        body = json.dumps(payload, separators=(",", ":"), allow_nan=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_path: Optional[str] = None,
+                window_ms: float = DEFAULT_BATCH_WINDOW_MS, max_batch: int = DEFAULT_MAX_BATCH):
+    service = ConversionService(ConversionBatcher(window_ms, max_batch))
+    server = await service.start(host, port, unix_path)
+    where = unix_path or "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+    print(f"Serving conversions on {where} (Ctrl+C to stop)", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON unit conversion service")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Address to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port (default: %(default)s)")
+    parser.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("--batch-window-ms", type=float, default=DEFAULT_BATCH_WINDOW_MS,
+                        help="Time to gather concurrent requests into one batch (default: %(default)s)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help="Pending values that trigger an immediate batch (default: %(default)s)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.batch_window_ms, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())